@@ -0,0 +1,61 @@
+"""Small in-process caches for data that changes far less often than it is read."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """Least-recently-used mapping whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class Generations:
+    """Per-key counters; bumping one invalidates every cache key built from it."""
+
+    def __init__(self):
+        self._counters: dict[Hashable, int] = {}
+
+    def get(self, key: Hashable) -> int:
+        return self._counters.get(key, 0)
+
+    def bump(self, key: Hashable) -> None:
+        self._counters[key] = self.get(key) + 1
+
+
+# Bumped when a profile's rules change (keyed by profile_id) and when stats
+# are loaded (keyed by (season, week) and by season).
+profile_generations = Generations()
+stats_generations = Generations()
@@ -1,43 +1,147 @@
 import os
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy import event, text
-from .models import Base
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from .models import Base, PlayerWeekPoints, PlayerWeekStat
 from typing import AsyncGenerator
 
 
 # Database URL from environment or default to SQLite
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./fantasy.db")
 
-# Create async engine
-engine = create_async_engine(
-    DATABASE_URL,
-    future=True,
-    echo=os.getenv("DEBUG", "false").lower() == "true"
-)
+_url = make_url(DATABASE_URL)
+_ECHO = os.getenv("DEBUG", "false").lower() == "true"
+# File-backed SQLite gets separate read and write pools; in-memory databases
+# and server databases share a single engine.
+_SPLIT_POOLS = _url.get_backend_name() == "sqlite" and _url.database not in (None, "", ":memory:")
+
+
+def dialect_insert(table):
+    """An INSERT with the configured backend's ON CONFLICT clauses (Postgres or SQLite)"""
+    if _url.get_backend_name() == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+def _read_only_url(url):
+    """Open the same SQLite file through a read-only URI connection."""
+    return url.set(database=f"file:{url.database}", query={**url.query, "mode": "ro", "uri": "true"})
+
+
+# Every aiosqlite connection owns a worker thread, so the read pool is capped
+# rather than allowed to overflow: two connections per core keeps the cores
+# busy while one thread waits on I/O, without spawning a thread per request.
+_READ_POOL_SIZE = int(os.getenv("SQLALCHEMY_POOL_SIZE", (os.cpu_count() or 4) * 2))
+
+# Server databases (Postgres) keep a warm pool sized for burst traffic. Keep
+# workers x (pool size + overflow) under the server's max_connections. LIFO
+# checkout reuses the most recently returned connections, so after a burst
+# the surplus ones sit idle and get recycled instead of staying warm.
+_SERVER_POOL_KWARGS = {
+    "pool_size": int(os.getenv("SQLALCHEMY_POOL_SIZE", 20)),
+    "max_overflow": int(os.getenv("SQLALCHEMY_MAX_OVERFLOW", 40)),
+    "pool_timeout": 30,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+    "pool_use_lifo": True,
+}
+
+# A larger compiled-SQL cache than SQLAlchemy's default of 500 so the
+# statement shapes built per request (filters, IN lists) do not evict the hot
+# module-level ones; sqlite3 also keeps more prepared statements per connection.
+_ENGINE_KWARGS = {"future": True, "echo": _ECHO, "query_cache_size": 1200}
+if _url.get_backend_name() == "sqlite":
+    _ENGINE_KWARGS["connect_args"] = {"cached_statements": 256}
+elif _url.get_driver_name() == "asyncpg":
+    # asyncpg already speaks the binary protocol; keep more prepared
+    # statements per connection, and turn off JIT, whose compile time
+    # outweighs the small aggregates these endpoints run.
+    _ENGINE_KWARGS["connect_args"] = {
+        "prepared_statement_cache_size": 1024,
+        "server_settings": {"jit": "off"},
+    }
+
+# Create async engines. SQLite allows a single writer at a time, so writes go
+# through a one-connection pool while reads fan out across CPU cores.
+if _SPLIT_POOLS:
+    engine = create_async_engine(
+        DATABASE_URL, pool_size=1, max_overflow=0, **_ENGINE_KWARGS
+    )
+    read_engine = create_async_engine(
+        _read_only_url(_url), pool_size=_READ_POOL_SIZE, max_overflow=0, pool_timeout=30,
+        **_ENGINE_KWARGS
+    )
+elif _url.get_backend_name() == "sqlite":
+    engine = create_async_engine(DATABASE_URL, **_ENGINE_KWARGS)
+    read_engine = engine
+else:
+    engine = create_async_engine(DATABASE_URL, **_SERVER_POOL_KWARGS, **_ENGINE_KWARGS)
+    read_engine = engine
+
 
 # Configure SQLite optimizations
-@event.listens_for(engine.sync_engine, "connect")
 def _sqlite_pragmas(dbapi_conn, _):
     """Configure SQLite for optimal performance"""
     cur = dbapi_conn.cursor()
     cur.execute("PRAGMA journal_mode=WAL;")
     cur.execute("PRAGMA synchronous=NORMAL;")
     cur.execute("PRAGMA foreign_keys=ON;")
-    cur.execute("PRAGMA cache_size=10000;")
+    cur.execute("PRAGMA cache_size=-65536;")  # 64 MiB, independent of page_size
     cur.execute("PRAGMA temp_store=MEMORY;")
+    cur.execute("PRAGMA mmap_size=268435456;")  # 256 MiB memory-mapped reads
+    cur.execute("PRAGMA busy_timeout=5000;")
     cur.close()
 
 
-# Create session factory
+if _url.get_backend_name() == "sqlite":
+    event.listen(engine.sync_engine, "connect", _sqlite_pragmas)
+
+if _SPLIT_POOLS:
+    event.listen(read_engine.sync_engine, "connect", _sqlite_pragmas)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _sqlite_manual_transactions(dbapi_conn, _):
+        """Let SQLAlchemy emit BEGIN itself instead of the driver's deferred BEGIN."""
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _sqlite_begin_immediate(conn):
+        """Take the write lock up front so writers queue instead of failing mid-transaction."""
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+@event.listens_for(engine.sync_engine, "close")
+def _sqlite_optimize(dbapi_conn, _):
+    """Refresh planner statistics the connection found stale before it closes"""
+    if "sqlite" not in DATABASE_URL:
+        return
+    try:
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA optimize;")
+        cur.close()
+    except Exception:
+        # Closing must not fail because the statistics could not be refreshed.
+        pass
+
+
+# Create session factories
 SessionLocal = async_sessionmaker(
     engine,
     expire_on_commit=False,
     class_=AsyncSession
 )
 
+ReadSessionLocal = async_sessionmaker(
+    read_engine,
+    expire_on_commit=False,
+    class_=AsyncSession
+)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency to get database session"""
+    """Dependency to get a read-write database session"""
     async with SessionLocal() as session:
         try:
             yield session
@@ -45,6 +149,162 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get a read-only database session"""
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+def get_read_sessions() -> async_sessionmaker[AsyncSession]:
+    """
+    Dependency for handlers that run independent reads concurrently, each on its own session.
+
+    A session (and its connection) must never be shared between concurrent
+    tasks, so such handlers open one per task instead of using get_read_db.
+    """
+    return ReadSessionLocal
+
+
+# Keep news_items_fts in step with news_items row by row. Bulk writers drop
+# these, write, rebuild the index once and call create_news_fts_triggers again.
+NEWS_FTS_TRIGGERS = {
+    "news_items_ai": """
+        CREATE TRIGGER IF NOT EXISTS news_items_ai AFTER INSERT ON news_items BEGIN
+            INSERT INTO news_items_fts(rowid, title, summary) VALUES (new.rowid, new.title, new.summary);
+        END;
+    """,
+    "news_items_ad": """
+        CREATE TRIGGER IF NOT EXISTS news_items_ad AFTER DELETE ON news_items BEGIN
+            INSERT INTO news_items_fts(news_items_fts, rowid, title, summary) VALUES('delete', old.rowid, old.title, old.summary);
+        END;
+    """,
+    "news_items_au": """
+        CREATE TRIGGER IF NOT EXISTS news_items_au AFTER UPDATE OF title, summary ON news_items BEGIN
+            INSERT INTO news_items_fts(news_items_fts, rowid, title, summary) VALUES('delete', old.rowid, old.title, old.summary);
+            INSERT INTO news_items_fts(rowid, title, summary) VALUES (new.rowid, new.title, new.summary);
+        END;
+    """,
+}
+# Only SQLite databases get news_items_fts; the search endpoint needs SQLite.
+NEWS_FTS_MAINTAINED = _url.get_backend_name() == "sqlite"
+
+
+async def create_news_fts_triggers(conn) -> None:
+    """Create the news FTS sync triggers on a connection or session"""
+    for ddl in NEWS_FTS_TRIGGERS.values():
+        await conn.execute(text(ddl))
+
+
+# players_fts indexes full_name trigrams so substring name searches are index
+# lookups rather than a scan of players. Like news_items_fts it is
+# external-content, so the delete paths must pass the old name.
+PLAYER_FTS_TRIGGERS = {
+    "players_fts_ai": """
+        CREATE TRIGGER IF NOT EXISTS players_fts_ai AFTER INSERT ON players BEGIN
+            INSERT INTO players_fts(rowid, full_name) VALUES (new.rowid, new.full_name);
+        END;
+    """,
+    "players_fts_ad": """
+        CREATE TRIGGER IF NOT EXISTS players_fts_ad AFTER DELETE ON players BEGIN
+            INSERT INTO players_fts(players_fts, rowid, full_name) VALUES('delete', old.rowid, old.full_name);
+        END;
+    """,
+    "players_fts_au": """
+        CREATE TRIGGER IF NOT EXISTS players_fts_au AFTER UPDATE OF full_name ON players BEGIN
+            INSERT INTO players_fts(players_fts, rowid, full_name) VALUES('delete', old.rowid, old.full_name);
+            INSERT INTO players_fts(rowid, full_name) VALUES (new.rowid, new.full_name);
+        END;
+    """,
+}
+# Only SQLite databases get players_fts; Postgres serves the same ILIKE
+# searches from a pg_trgm index.
+PLAYER_FTS_MAINTAINED = _url.get_backend_name() == "sqlite"
+
+
+async def create_player_fts(conn) -> None:
+    """Create players_fts and its sync triggers, indexing existing players the first time"""
+    exists = (await conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'players_fts'")
+    )).first()
+    await conn.execute(text("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS players_fts
+        USING fts5(full_name, content='players', content_rowid='rowid', tokenize='trigram');
+    """))
+    for ddl in PLAYER_FTS_TRIGGERS.values():
+        await conn.execute(text(ddl))
+    if exists is None:
+        await conn.execute(text("INSERT INTO players_fts(players_fts) VALUES('rebuild')"))
+
+
+# player_season_stats follows player_week_stats row by row: inserts add to
+# the totals, updates and deletes (rare) recompute the affected totals.
+# Bulk loaders drop pws_season_ai, insert, call rebuild_season_stats for the
+# season and create_season_stats_triggers again.
+_RECOMPUTE_SEASON_STAT = """
+    DELETE FROM player_season_stats
+    WHERE season = {row}.season AND player_id = {row}.player_id AND stat_key = {row}.stat_key;
+    INSERT INTO player_season_stats (season, player_id, stat_key, total, games, high)
+    SELECT season, player_id, stat_key, SUM(stat_value), COUNT(*), MAX(stat_value)
+    FROM player_week_stats
+    WHERE season = {row}.season AND player_id = {row}.player_id AND stat_key = {row}.stat_key
+    GROUP BY season, player_id, stat_key;
+"""
+SEASON_STATS_TRIGGERS = {
+    "pws_season_ai": """
+        CREATE TRIGGER IF NOT EXISTS pws_season_ai AFTER INSERT ON player_week_stats BEGIN
+            INSERT INTO player_season_stats (season, player_id, stat_key, total, games, high)
+            VALUES (new.season, new.player_id, new.stat_key, new.stat_value, 1, new.stat_value)
+            ON CONFLICT (season, player_id, stat_key) DO UPDATE SET
+                total = total + excluded.total,
+                games = games + 1,
+                high = max(high, excluded.high);
+        END;
+    """,
+    "pws_season_au": f"""
+        CREATE TRIGGER IF NOT EXISTS pws_season_au AFTER UPDATE ON player_week_stats BEGIN
+            {_RECOMPUTE_SEASON_STAT.format(row="old")}
+            {_RECOMPUTE_SEASON_STAT.format(row="new")}
+        END;
+    """,
+    "pws_season_ad": f"""
+        CREATE TRIGGER IF NOT EXISTS pws_season_ad AFTER DELETE ON player_week_stats BEGIN
+            {_RECOMPUTE_SEASON_STAT.format(row="old")}
+        END;
+    """,
+}
+# Only SQLite databases get the triggers; other backends aggregate
+# player_week_stats directly.
+SEASON_STATS_MAINTAINED = _url.get_backend_name() == "sqlite"
+# player_week_points is filled by the stats ingest and only trusted where the
+# invalidation triggers created in init_db exist; elsewhere points are scored
+# live.
+WEEK_POINTS_MAINTAINED = _url.get_backend_name() == "sqlite"
+
+
+async def create_season_stats_triggers(conn) -> None:
+    """Create the player_season_stats sync triggers on a connection or session"""
+    for ddl in SEASON_STATS_TRIGGERS.values():
+        await conn.execute(text(ddl))
+
+
+async def rebuild_season_stats(conn, season: int) -> None:
+    """Recompute one season's player_season_stats from its week rows"""
+    await conn.execute(text("DELETE FROM player_season_stats WHERE season = :season"), {"season": season})
+    await conn.execute(
+        text("""
+            INSERT INTO player_season_stats (season, player_id, stat_key, total, games, high)
+            SELECT season, player_id, stat_key, SUM(stat_value), COUNT(*), MAX(stat_value)
+            FROM player_week_stats
+            WHERE season = :season
+            GROUP BY season, player_id, stat_key;
+        """),
+        {"season": season},
+    )
+
+
 async def init_db():
     """Initialize database tables and FTS5 virtual table"""
     async with engine.begin() as conn:
@@ -66,6 +326,37 @@ async def init_db():
                 if column not in player_columns:
                     await conn.execute(text(f"ALTER TABLE players ADD COLUMN {column} {definition}"))
 
+            profile_columns = {
+                row[1]
+                for row in (await conn.execute(text("PRAGMA table_info(scoring_profiles)"))).all()
+            }
+            if "compiled" not in profile_columns:
+                await conn.execute(text("ALTER TABLE scoring_profiles ADD COLUMN compiled BLOB"))
+
+            # Rebuild composite-key tables created before they were declared
+            # WITHOUT ROWID. Their triggers go with the old table and are
+            # recreated further down.
+            for table in (PlayerWeekStat.__table__, PlayerWeekPoints.__table__):
+                table_sql = (await conn.execute(
+                    text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": table.name},
+                )).scalar_one()
+                if "WITHOUT ROWID" in table_sql.upper():
+                    continue
+                columns = ", ".join(column.name for column in table.columns)
+                await conn.execute(text(f"ALTER TABLE {table.name} RENAME TO {table.name}_legacy"))
+                await conn.run_sync(table.create)
+                await conn.execute(text(
+                    f"INSERT INTO {table.name} ({columns}) SELECT {columns} FROM {table.name}_legacy"
+                ))
+                await conn.execute(text(f"DROP TABLE {table.name}_legacy"))
+
+            # The clustered primary key already covers (player, season, week)
+            # lookups, so the older secondary indexes only cost space.
+            await conn.execute(text("DROP INDEX IF EXISTS ix_pws_cover;"))
+            await conn.execute(text("DROP INDEX IF EXISTS ix_pws_player_season_week;"))
+            await conn.execute(text("DROP INDEX IF EXISTS ix_pws_season_week_cover;"))
+
             # Early revival builds accidentally seeded "Standard" with 0.5 PPR.
             # Repair only that exact legacy default value; custom profiles are untouched.
             await conn.execute(text("""
@@ -79,27 +370,106 @@ async def init_db():
                   );
             """))
 
+            # External-content FTS5: the index stores only tokens and reads
+            # title/summary back from news_items, so searches join on rowid to
+            # get the text. Triggers must pass the old values on delete.
             await conn.execute(text("""
                 CREATE VIRTUAL TABLE IF NOT EXISTS news_items_fts 
                 USING fts5(title, summary, content='news_items', content_rowid='rowid');
             """))
             
-            # Create triggers for FTS5
+            # Only reindex when searchable text changes; earlier builds fired
+            # news_items_au on every column update.
+            await conn.execute(text("DROP TRIGGER IF EXISTS news_items_au;"))
+            await create_news_fts_triggers(conn)
+            await create_player_fts(conn)
+
+            # Materialized player_week_points rows are only valid while their
+            # stat line and profile stay unchanged.
+            for trigger, event in (
+                ("pws_points_ai", "AFTER INSERT"),
+                ("pws_points_au", "AFTER UPDATE"),
+            ):
+                await conn.execute(text(f"""
+                    CREATE TRIGGER IF NOT EXISTS {trigger} {event} ON player_week_stats BEGIN
+                        DELETE FROM player_week_points
+                        WHERE player_id = new.player_id AND season = new.season AND week = new.week;
+                    END;
+                """))
             await conn.execute(text("""
-                CREATE TRIGGER IF NOT EXISTS news_items_ai AFTER INSERT ON news_items BEGIN
-                    INSERT INTO news_items_fts(rowid, title, summary) VALUES (new.rowid, new.title, new.summary);
+                CREATE TRIGGER IF NOT EXISTS pws_points_ad AFTER DELETE ON player_week_stats BEGIN
+                    DELETE FROM player_week_points
+                    WHERE player_id = old.player_id AND season = old.season AND week = old.week;
                 END;
             """))
-            
+            # Every profile writer recompiles the profile, so a change to
+            # `compiled` marks a rule change.
             await conn.execute(text("""
-                CREATE TRIGGER IF NOT EXISTS news_items_ad AFTER DELETE ON news_items BEGIN
-                    INSERT INTO news_items_fts(news_items_fts, rowid, title, summary) VALUES('delete', old.rowid, old.title, old.summary);
+                CREATE TRIGGER IF NOT EXISTS scoring_profiles_points_au
+                AFTER UPDATE OF compiled ON scoring_profiles BEGIN
+                    DELETE FROM player_week_points WHERE profile_id = old.profile_id;
                 END;
             """))
-            
             await conn.execute(text("""
-                CREATE TRIGGER IF NOT EXISTS news_items_au AFTER UPDATE ON news_items BEGIN
-                    INSERT INTO news_items_fts(news_items_fts, rowid, title, summary) VALUES('delete', old.rowid, old.title, old.summary);
-                    INSERT INTO news_items_fts(rowid, title, summary) VALUES (new.rowid, new.title, new.summary);
+                CREATE TRIGGER IF NOT EXISTS scoring_profiles_points_ad
+                AFTER DELETE ON scoring_profiles BEGIN
+                    DELETE FROM player_week_points WHERE profile_id = old.profile_id;
                 END;
             """))
+            # A week's leaderboard is only served from player_week_points while
+            # none of its stats and none of the profile's rules have changed.
+            for trigger, event, row in (
+                ("pws_points_complete_ai", "AFTER INSERT", "new"),
+                ("pws_points_complete_au", "AFTER UPDATE", "new"),
+                ("pws_points_complete_ad", "AFTER DELETE", "old"),
+            ):
+                await conn.execute(text(f"""
+                    CREATE TRIGGER IF NOT EXISTS {trigger} {event} ON player_week_stats BEGIN
+                        DELETE FROM player_week_points_complete
+                        WHERE season = {row}.season AND week = {row}.week;
+                    END;
+                """))
+            for trigger, event in (
+                ("scoring_profiles_points_complete_au", "AFTER UPDATE OF compiled"),
+                ("scoring_profiles_points_complete_ad", "AFTER DELETE"),
+            ):
+                await conn.execute(text(f"""
+                    CREATE TRIGGER IF NOT EXISTS {trigger} {event} ON scoring_profiles BEGIN
+                        DELETE FROM player_week_points_complete WHERE profile_id = old.profile_id;
+                    END;
+                """))
+
+            # Season totals: fill once from existing weeks, then follow them.
+            await create_season_stats_triggers(conn)
+            if (await conn.execute(text("SELECT 1 FROM player_season_stats LIMIT 1"))).first() is None:
+                await conn.execute(text("""
+                    INSERT INTO player_season_stats (season, player_id, stat_key, total, games, high)
+                    SELECT season, player_id, stat_key, SUM(stat_value), COUNT(*), MAX(stat_value)
+                    FROM player_week_stats
+                    GROUP BY season, player_id, stat_key;
+                """))
+
+            # Give the planner statistics for the composite indexes;
+            # analysis_limit keeps startup fast on large databases.
+            await conn.execute(text("PRAGMA analysis_limit=400;"))
+            await conn.execute(text("ANALYZE;"))
+        elif _url.get_backend_name() == "postgresql":
+            # A trigram GIN index serves ILIKE '%q%' player searches. Creating
+            # the extension needs privileges some hosts withhold; searches
+            # still work without the index, just as scans.
+            try:
+                async with conn.begin_nested():
+                    await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                    await conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS players_name_trgm "
+                        "ON players USING gin (full_name gin_trgm_ops)"
+                    ))
+            except DBAPIError:
+                pass
+
+
+async def close_db():
+    """Dispose of the connection pools, running PRAGMA optimize on the way out"""
+    await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
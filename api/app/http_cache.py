@@ -0,0 +1,83 @@
+"""Conditional-request helpers (ETag / Cache-Control) for read endpoints."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+
+# Finished seasons only change if the data is re-ingested, so clients may keep them.
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Fixed lookup lists (positions, teams) only change with a deploy; within a
+# day clients need not even revalidate.
+STATIC = "public, max-age=86400, immutable"
+# Player records change at most with a reseed; a few minutes' reuse is fine.
+BRIEF = "public, max-age=300"
+# Anything else may change at any time: store it, but revalidate with the ETag.
+REVALIDATE = "no-cache"
+
+
+def current_season() -> int:
+    """NFL season in progress; January and February belong to the previous year's season."""
+    now = time.localtime()
+    return now.tm_year if now.tm_mon >= 3 else now.tm_year - 1
+
+
+def season_cache_control(season: int) -> str:
+    return IMMUTABLE if season < current_season() else REVALIDATE
+
+
+def etag_for_bytes(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_for(payload: Any) -> str:
+    """Strong ETag over the JSON form of a response payload."""
+    body = json.dumps(jsonable_encoder(payload), sort_keys=True, separators=(",", ":"))
+    return etag_for_bytes(body.encode())
+
+
+def not_modified(
+    response: Response,
+    if_none_match: Optional[str],
+    payload: Any,
+    cache_control: str,
+) -> Optional[Response]:
+    """
+    Tag ``response`` with an ETag and Cache-Control for ``payload``.
+
+    Returns a 304 response to send instead when the client already holds
+    this representation, otherwise None.
+    """
+    etag = etag_for(payload)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    response.headers.update(headers)
+    if _matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return None
+
+
+def json_bytes_response(
+    body: bytes, if_none_match: Optional[str], cache_control: str, etag: Optional[str] = None
+) -> Response:
+    """
+    Send already-serialized JSON, or a 304 when the client holds the same bytes.
+
+    Pass ``etag`` when it was computed up front for a constant body.
+    """
+    etag = etag or etag_for_bytes(body)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    if if_none_match is None:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
@@ -1,16 +1,35 @@
+import logging
+import logging.handlers
 import os
+import queue
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from .db import init_db
+from .db import close_db, init_db
+from .responses import ORJSONResponse
 from .routers import fantasy, news, players, rankings, sleeper, yahoo
 
 
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Route app.* log records through a queue so handler I/O runs off the event loop"""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    app_logger = logging.getLogger("app")
+    app_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    app_logger.setLevel(logging.INFO)
+    app_logger.propagate = False
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
+    log_listener = _start_log_listener()
     print("Starting NFLDrafter API...")
     await init_db()
     print("Database initialized successfully")
@@ -29,7 +48,10 @@ async def lifespan(app: FastAPI):
     if scheduler is not None:
         scheduler.shutdown(wait=False)
         print("Background ingestion scheduler stopped")
+    await yahoo.close_yahoo_client()
+    await close_db()
     print("Shutting down NFLDrafter API...")
+    log_listener.stop()
 
 
 # Create FastAPI app
@@ -37,7 +59,8 @@ app = FastAPI(
     title="NFLDrafter - Fantasy Football Open Scorer",
     description="Local-first fantasy football scoring application with custom profiles and player analysis",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy import String, Integer, Float, Boolean, ForeignKey, UniqueConstraint, Index, Text, JSON
+from sqlalchemy import String, Integer, Float, Boolean, ForeignKey, UniqueConstraint, Index, Text, JSON, LargeBinary
 from typing import Optional, Dict
 
 
@@ -24,7 +24,9 @@ class Player(Base):
     headshot: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     
     # Relationships
-    week_stats: Mapped[list["PlayerWeekStat"]] = relationship("PlayerWeekStat", back_populates="player")
+    # Stats are read with explicit column queries joined to the player; a
+    # lazy load here would be an N+1 round trip per player.
+    week_stats: Mapped[list["PlayerWeekStat"]] = relationship("PlayerWeekStat", back_populates="player", lazy="raise")
 
 
 class PlayerIdentifier(Base):
@@ -66,11 +68,74 @@ class PlayerWeekStat(Base):
     # Relationships
     player: Mapped["Player"] = relationship("Player", back_populates="week_stats")
     
+    # Cluster rows by the primary key so (player, season, week) lookups read
+    # stat_key/stat_value straight from the table B-tree. Season and week
+    # leaderboards read player_season_stats / player_week_points instead.
+    # PostgreSQL heap tables are not clustered, so there the key lookups get
+    # their own covering index for index-only scans.
     __table_args__ = (
-        Index("ix_pws_player_season_week", "player_id", "season", "week"),
+        Index(
+            "ix_pws_player_season_week_cover", "player_id", "season", "week", "stat_key",
+            postgresql_include=["stat_value"],
+        ).ddl_if(dialect="postgresql"),
+        {"sqlite_with_rowid": False},
     )
 
 
+class PlayerSeasonStat(Base):
+    """Season totals of one player's stat, kept in step with player_week_stats.
+    
+    SQLite triggers created in init_db add each inserted week to the totals
+    and recompute them on update or delete, so season-wide reads skip
+    re-aggregating every week.
+    """
+    __tablename__ = "player_season_stats"
+    
+    # Season leads the key: reads are a whole season, or one player's season.
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    player_id: Mapped[str] = mapped_column(String, primary_key=True)
+    stat_key: Mapped[str] = mapped_column(String, primary_key=True)
+    total: Mapped[float] = mapped_column(Float, default=0.0)
+    games: Mapped[int] = mapped_column(Integer, default=0)
+    high: Mapped[float] = mapped_column(Float, default=0.0)
+    
+    __table_args__ = {"sqlite_with_rowid": False}
+
+
+class PlayerWeekPoints(Base):
+    """Fantasy points already scored for a player-week under one profile.
+    
+    Filled by materialize_week_points during stats ingest and only read by
+    /fantasy/points and the leaderboard; SQLite triggers created in init_db
+    drop rows whose stats or profile change.
+    """
+    __tablename__ = "player_week_points"
+    
+    player_id: Mapped[str] = mapped_column(String, primary_key=True)
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    week: Mapped[int] = mapped_column(Integer, primary_key=True)
+    profile_id: Mapped[str] = mapped_column(String, primary_key=True)
+    points: Mapped[float] = mapped_column(Float)
+    
+    __table_args__ = {"sqlite_with_rowid": False}
+
+
+class PlayerWeekPointsComplete(Base):
+    """Marks a (season, week, profile) whose player_week_points rows cover every player.
+    
+    Written by materialize_week_points after a stats load; the same triggers
+    that drop stale points rows delete the marker, sending the leaderboard
+    back to scoring live.
+    """
+    __tablename__ = "player_week_points_complete"
+    
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    week: Mapped[int] = mapped_column(Integer, primary_key=True)
+    profile_id: Mapped[str] = mapped_column(String, primary_key=True)
+    
+    __table_args__ = {"sqlite_with_rowid": False}
+
+
 class ScoringProfile(Base):
     __tablename__ = "scoring_profiles"
     
@@ -79,9 +144,13 @@ class ScoringProfile(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     is_public: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[int] = mapped_column(Integer)  # epoch timestamp
+    # Rules packed by app.scoring.compile_profile whenever the profile is written
+    compiled: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
     
     # Relationships
-    rules: Mapped[list["ScoringRule"]] = relationship("ScoringRule", back_populates="profile")
+    # Always eager-load (selectinload); a stray lazy load would be an extra
+    # round trip and fails outright under asyncio anyway.
+    rules: Mapped[list["ScoringRule"]] = relationship("ScoringRule", back_populates="profile", lazy="raise")
 
 
 class ScoringRule(Base):
@@ -1,22 +1,155 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, delete
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy import bindparam, select, delete, func, insert, literal, null, tuple_, union_all
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
+import logging
 import time
 import uuid
 
-from ..deps import get_db_session
-from ..models import PlayerWeekStat, ScoringRule, ScoringProfile
-from ..schemas import PointsResponse, ScoringProfileCreate, ScoringProfile as ScoringProfileSchema
-from ..scoring import compute_points_from_dict
+import orjson
 
-router = APIRouter(prefix="/fantasy", tags=["fantasy"])
+from ..cache import TTLCache, profile_generations, stats_generations
+from ..db import SEASON_STATS_MAINTAINED, WEEK_POINTS_MAINTAINED, get_db, get_read_db
+from ..http_cache import (
+    REVALIDATE,
+    current_season,
+    json_bytes_response,
+    not_modified,
+    season_cache_control,
+)
+from ..models import (
+    Player,
+    PlayerSeasonStat,
+    PlayerWeekPoints,
+    PlayerWeekPointsComplete,
+    PlayerWeekStat,
+    ScoringProfile,
+    ScoringRule,
+)
+from ..responses import ORJSONResponse
+from ..schemas import (
+    PointsResponse,
+    ScoringProfileCreate,
+    ScoringProfile as ScoringProfileSchema,
+    WeeklyPointsBatchRequest,
+)
+from ..scoring import (
+    compile_profile,
+    score_compiled,
+    scores_missing_stats,
+    sql_rule_points,
+)
+from ..services.profile_rules import cached_profile_rules, get_profile_rules, remember_profile_rules
+
+router = APIRouter(prefix="/fantasy", tags=["fantasy"], default_response_class=ORJSONResponse)
+logger = logging.getLogger(__name__)
+
+# Slow-request warnings are emitted at most once per interval per kind; the
+# next one reports how many were skipped in between.
+_SLOW_LOG_INTERVAL = 10.0
+_slow_log_state: Dict[str, List[float]] = {}
+
+
+def _warn_slow(kind: str, ms: float, **fields: Any):
+    now = time.monotonic()
+    last, suppressed = _slow_log_state.get(kind, [0.0, 0])
+    if now - last < _SLOW_LOG_INTERVAL:
+        _slow_log_state[kind] = [last, suppressed + 1]
+        return
+    _slow_log_state[kind] = [now, 0]
+    logger.warning(
+        "%s took %.2fms %s (%d suppressed)",
+        kind, ms, " ".join(f"{key}={value}" for key, value in fields.items()), suppressed,
+        extra={"event": kind, "ms": ms, "suppressed": suppressed, **fields},
+    )
+
+# Serialized /fantasy/points bodies. Keys carry the profile and week
+# generations, so profile edits and stat loads in this process retire old
+# entries; the TTL bounds staleness from writers in other processes (CLI).
+_points_response_cache = TTLCache(maxsize=10_000, ttl=300)
+# Serialized profile GET/export bodies keyed by (kind, profile_id, generation),
+# and the public profile list. Profile writes here clear the list; the short
+# list TTL covers profiles synced from Yahoo.
+_profile_body_cache = TTLCache(maxsize=512, ttl=300)
+_profile_list_cache = TTLCache(maxsize=1, ttl=60)
+# Leaderboard bodies keyed by query parameters. Each entry records the
+# generations it was built from and when it goes stale; stale bodies stay
+# around so a failing database can still be answered with the last result.
+_leaderboard_cache = TTLCache(maxsize=512, ttl=86400)
+_LEADERBOARD_FRESH_CURRENT = 30.0
+_LEADERBOARD_FRESH_PAST = 3600.0
+# Largest IN-list sent in one statement; longer id lists are queried in chunks.
+_IN_CHUNK_SIZE = 500
+
+
+def _stat_lines(season: int, week: Optional[int]):
+    """
+    Select (player_id, stat_key, stat_value) for one week, or season totals when ``week`` is None.
+
+    Season totals come from player_season_stats where triggers maintain it.
+    """
+    if not week and SEASON_STATS_MAINTAINED:
+        return select(
+            PlayerSeasonStat.player_id,
+            PlayerSeasonStat.stat_key,
+            PlayerSeasonStat.total.label('stat_value'),
+        ).where(PlayerSeasonStat.season == season)
+    stat_lines = select(
+        PlayerWeekStat.player_id,
+        PlayerWeekStat.stat_key,
+        func.sum(PlayerWeekStat.stat_value).label('stat_value')
+    ).where(PlayerWeekStat.season == season)
+    if week:
+        stat_lines = stat_lines.where(PlayerWeekStat.week == week)
+    return stat_lines.group_by(PlayerWeekStat.player_id, PlayerWeekStat.stat_key)
+
+
+def _chunked(items: List[Any]):
+    for start in range(0, len(items), _IN_CHUNK_SIZE):
+        yield items[start:start + _IN_CHUNK_SIZE]
+
+
+async def _insert_rules(db: AsyncSession, profile: ScoringProfile, rules):
+    """Write a profile's rules with one multi-row INSERT ... RETURNING and attach them to the profile."""
+    rows = [
+        {
+            "rule_id": str(uuid.uuid4()),
+            "profile_id": profile.profile_id,
+            "stat_key": rule.stat_key,
+            "multiplier": rule.multiplier,
+            "per": rule.per,
+            "bonus_min": rule.bonus_min,
+            "bonus_max": rule.bonus_max,
+            "bonus_points": rule.bonus_points,
+            "cap": rule.cap,
+        }
+        for rule in rules
+    ]
+    inserted = []
+    if rows:
+        inserted = (await db.execute(insert(ScoringRule).values(rows).returning(ScoringRule))).scalars().all()
+    set_committed_value(profile, "rules", list(inserted))
+
+
+def _profile_changed(profile_id: str):
+    """Drop everything cached for a profile after a committed write."""
+    _profile_list_cache.clear()
+    profile_generations.bump(profile_id)
+
+
+def _compile_rule_data(rules) -> bytes:
+    """Compile request rule models into the ``ScoringProfile.compiled`` blob."""
+    return compile_profile([rule_data.model_dump() for rule_data in rules])
 
 
 @router.post("/profiles", response_model=ScoringProfileSchema)
 async def create_scoring_profile(
     profile_data: ScoringProfileCreate,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new scoring profile with rules.
@@ -28,63 +161,58 @@ async def create_scoring_profile(
             name=profile_data.name,
             description=profile_data.description,
             is_public=profile_data.is_public,
-            created_at=int(time.time())
+            created_at=int(time.time()),
+            compiled=_compile_rule_data(profile_data.rules)
         )
         db.add(profile)
         
         # Create rules
-        for rule_data in profile_data.rules:
-            rule = ScoringRule(
-                rule_id=str(uuid.uuid4()),
-                profile_id=profile.profile_id,
-                stat_key=rule_data.stat_key,
-                multiplier=rule_data.multiplier,
-                per=rule_data.per,
-                bonus_min=rule_data.bonus_min,
-                bonus_max=rule_data.bonus_max,
-                bonus_points=rule_data.bonus_points,
-                cap=rule_data.cap
-            )
-            db.add(rule)
+        await _insert_rules(db, profile, profile_data.rules)
         
         await db.commit()
-        await db.refresh(profile)
-        
-        # Fetch the complete profile with rules
-        profile_query = select(ScoringProfile).where(ScoringProfile.profile_id == profile.profile_id)
-        profile_result = await db.execute(profile_query)
-        complete_profile = profile_result.scalar_one_or_none()
+        _profile_list_cache.clear()
         
-        return complete_profile
+        return profile
         
-    except Exception as e:
+    except IntegrityError as e:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="A scoring profile with this name already exists") from e
+    except SQLAlchemyError as e:
         await db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to create profile: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to create profile: {str(e)}") from e
 
 
 @router.get("/profiles/{profile_id}", response_model=ScoringProfileSchema)
 async def get_scoring_profile(
     profile_id: str,
-    db: AsyncSession = Depends(get_db_session)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a specific scoring profile by ID.
     """
-    query = select(ScoringProfile).where(ScoringProfile.profile_id == profile_id)
+    cache_key = ("profile", profile_id, profile_generations.get(profile_id))
+    cached_body = _profile_body_cache.get(cache_key)
+    if cached_body is not None:
+        return json_bytes_response(cached_body, if_none_match, REVALIDATE)
+    
+    query = select(ScoringProfile).options(selectinload(ScoringProfile.rules)).where(ScoringProfile.profile_id == profile_id)
     result = await db.execute(query)
     profile = result.scalar_one_or_none()
     
     if not profile:
         raise HTTPException(status_code=404, detail="Scoring profile not found")
     
-    return profile
+    body = ScoringProfileSchema.model_validate(profile).model_dump_json().encode()
+    _profile_body_cache.set(cache_key, body)
+    return json_bytes_response(body, if_none_match, REVALIDATE)
 
 
 @router.put("/profiles/{profile_id}", response_model=ScoringProfileSchema)
 async def update_scoring_profile(
     profile_id: str,
     profile_data: ScoringProfileCreate,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update an existing scoring profile.
@@ -102,44 +230,31 @@ async def update_scoring_profile(
         existing_profile.name = profile_data.name
         existing_profile.description = profile_data.description
         existing_profile.is_public = profile_data.is_public
+        existing_profile.compiled = _compile_rule_data(profile_data.rules)
         
         # Delete existing rules
         await db.execute(delete(ScoringRule).where(ScoringRule.profile_id == profile_id))
         
         # Create new rules
-        for rule_data in profile_data.rules:
-            rule = ScoringRule(
-                rule_id=str(uuid.uuid4()),
-                profile_id=profile_id,
-                stat_key=rule_data.stat_key,
-                multiplier=rule_data.multiplier,
-                per=rule_data.per,
-                bonus_min=rule_data.bonus_min,
-                bonus_max=rule_data.bonus_max,
-                bonus_points=rule_data.bonus_points,
-                cap=rule_data.cap
-            )
-            db.add(rule)
+        await _insert_rules(db, existing_profile, profile_data.rules)
         
         await db.commit()
-        await db.refresh(existing_profile)
-        
-        # Fetch the complete updated profile
-        updated_query = select(ScoringProfile).where(ScoringProfile.profile_id == profile_id)
-        updated_result = await db.execute(updated_query)
-        updated_profile = updated_result.scalar_one_or_none()
+        _profile_changed(profile_id)
         
-        return updated_profile
+        return existing_profile
         
-    except Exception as e:
+    except IntegrityError as e:
         await db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to update profile: {str(e)}")
+        raise HTTPException(status_code=409, detail="A scoring profile with this name already exists") from e
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to update profile: {str(e)}") from e
 
 
 @router.delete("/profiles/{profile_id}")
 async def delete_scoring_profile(
     profile_id: str,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a scoring profile and all its rules.
@@ -160,24 +275,31 @@ async def delete_scoring_profile(
         await db.execute(delete(ScoringProfile).where(ScoringProfile.profile_id == profile_id))
         
         await db.commit()
+        _profile_changed(profile_id)
         
         return {"message": "Scoring profile deleted successfully"}
         
-    except Exception as e:
+    except SQLAlchemyError as e:
         await db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to delete profile: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to delete profile: {str(e)}") from e
 
 
 @router.get("/profiles/{profile_id}/export")
 async def export_scoring_profile(
     profile_id: str,
-    db: AsyncSession = Depends(get_db_session)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Export a scoring profile as JSON for sharing/backup.
     """
+    cache_key = ("export", profile_id, profile_generations.get(profile_id))
+    cached_body = _profile_body_cache.get(cache_key)
+    if cached_body is not None:
+        return json_bytes_response(cached_body, if_none_match, REVALIDATE)
+    
     # Get profile with rules
-    profile_query = select(ScoringProfile).where(ScoringProfile.profile_id == profile_id)
+    profile_query = select(ScoringProfile).options(selectinload(ScoringProfile.rules)).where(ScoringProfile.profile_id == profile_id)
     profile_result = await db.execute(profile_query)
     profile = profile_result.scalar_one_or_none()
     
@@ -203,13 +325,15 @@ async def export_scoring_profile(
         ]
     }
     
-    return export_data
+    body = orjson.dumps(export_data)
+    _profile_body_cache.set(cache_key, body)
+    return json_bytes_response(body, if_none_match, REVALIDATE)
 
 
 @router.post("/profiles/import", response_model=ScoringProfileSchema)
 async def import_scoring_profile(
     profile_data: ScoringProfileCreate,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Import a scoring profile from JSON data.
@@ -221,62 +345,165 @@ async def import_scoring_profile(
             name=profile_data.name,
             description=profile_data.description,
             is_public=profile_data.is_public,
-            created_at=int(time.time())
+            created_at=int(time.time()),
+            compiled=_compile_rule_data(profile_data.rules)
         )
         db.add(profile)
         
         # Create rules from imported data
-        for rule_data in profile_data.rules:
-            rule = ScoringRule(
-                rule_id=str(uuid.uuid4()),
-                profile_id=profile.profile_id,
-                stat_key=rule_data.stat_key,
-                multiplier=rule_data.multiplier,
-                per=rule_data.per,
-                bonus_min=rule_data.bonus_min,
-                bonus_max=rule_data.bonus_max,
-                bonus_points=rule_data.bonus_points,
-                cap=rule_data.cap
-            )
-            db.add(rule)
+        await _insert_rules(db, profile, profile_data.rules)
         
         await db.commit()
-        await db.refresh(profile)
-        
-        # Fetch the complete imported profile
-        profile_query = select(ScoringProfile).where(ScoringProfile.profile_id == profile.profile_id)
-        profile_result = await db.execute(profile_query)
-        complete_profile = profile_result.scalar_one_or_none()
+        _profile_list_cache.clear()
         
-        return complete_profile
+        return profile
         
-    except Exception as e:
+    except IntegrityError as e:
         await db.rollback()
-        raise HTTPException(status_code=500, detail=f"Failed to import profile: {str(e)}")
+        raise HTTPException(status_code=409, detail="A scoring profile with this name already exists") from e
+    except SQLAlchemyError as e:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=f"Failed to import profile: {str(e)}") from e
+
+
+# calculate_points statements are built once with bind parameters so every
+# request reuses the same constructs and their cached compiled SQL.
+_player_week = (
+    (PlayerWeekStat.player_id == bindparam("player_id"))
+    & (PlayerWeekStat.season == bindparam("season"))
+    & (PlayerWeekStat.week == bindparam("week"))
+)
+
+# Points materialized by the stats ingest ride along on every stat row.
+_stored_points = select(PlayerWeekPoints.points).where(
+    PlayerWeekPoints.player_id == bindparam("player_id"),
+    PlayerWeekPoints.season == bindparam("season"),
+    PlayerWeekPoints.week == bindparam("week"),
+    PlayerWeekPoints.profile_id == bindparam("profile_id")
+).scalar_subquery()
+
+# The week's stats and, unless the profile is cached, the profile's rules in
+# one round-trip. Stat rows carry only stat_key/stat_value; profile rows carry
+# the profile name and one rule each (a single rule-less row when the profile
+# is empty).
+_STATS_STMT = select(
+    literal("stat").label("kind"),
+    null().label("profile_name"),
+    null().label("compiled"),
+    PlayerWeekStat.stat_key,
+    PlayerWeekStat.stat_value,
+    _stored_points.label("stored_points"),
+    null().label("multiplier"),
+    null().label("per"),
+    null().label("bonus_min"),
+    null().label("bonus_max"),
+    null().label("bonus_points"),
+    null().label("cap"),
+).where(_player_week)
+
+_STATS_AND_RULES_STMT = union_all(
+    _STATS_STMT,
+    select(
+        literal("rule").label("kind"),
+        ScoringProfile.name,
+        ScoringProfile.compiled,
+        ScoringRule.stat_key,
+        null().label("stat_value"),
+        null().label("stored_points"),
+        ScoringRule.multiplier,
+        ScoringRule.per,
+        ScoringRule.bonus_min,
+        ScoringRule.bonus_max,
+        ScoringRule.bonus_points,
+        ScoringRule.cap,
+    ).select_from(ScoringProfile).outerjoin(
+        ScoringRule, ScoringRule.profile_id == ScoringProfile.profile_id
+    ).where(ScoringProfile.profile_id == bindparam("profile_id")),
+)
 
+# SQLite scores each stat row against its rule and totals them with a window
+# SUM; the rows still carry the stat line for the response.
+_SCORED_STATS_STMT = select(
+    PlayerWeekStat.stat_key,
+    PlayerWeekStat.stat_value,
+    _stored_points.label("stored_points"),
+    func.sum(sql_rule_points(PlayerWeekStat.stat_value)).over().label("points"),
+).outerjoin(
+    ScoringRule,
+    (ScoringRule.profile_id == bindparam("profile_id"))
+    & (ScoringRule.stat_key == PlayerWeekStat.stat_key),
+).where(_player_week)
 
-@router.get("/points", response_model=PointsResponse)
+
+# The body is built directly; the schema only documents the response.
+@router.get("/points", responses={200: {"model": PointsResponse}})
 async def calculate_points(
     player_id: str = Query(..., description="Player ID"),
     season: int = Query(..., description="NFL season year", ge=2000, le=2030),
     week: int = Query(..., description="Week number", ge=1, le=18),
     profile_id: str = Query(..., description="Scoring profile ID"),
-    db: AsyncSession = Depends(get_db_session)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Calculate fantasy points for a player in a specific week using a scoring profile.
+    
+    Read-only: points the stats ingest materialized are used when present,
+    anything else is scored on the fly and only kept in the response cache.
     """
     start_time = time.time()
     
-    # Get player stats for the week
-    stats_query = select(PlayerWeekStat.stat_key, PlayerWeekStat.stat_value).where(
-        PlayerWeekStat.player_id == player_id,
-        PlayerWeekStat.season == season,
-        PlayerWeekStat.week == week
+    profile_generation = profile_generations.get(profile_id)
+    cache_key = (
+        player_id, season, week, profile_id,
+        profile_generation, stats_generations.get((season, week)),
     )
+    cached_body = _points_response_cache.get(cache_key)
+    if cached_body is not None:
+        return json_bytes_response(cached_body, if_none_match, REVALIDATE)
     
-    result = await db.execute(stats_query)
-    stats = {row.stat_key: row.stat_value for row in result.all()}
+    params = {"player_id": player_id, "season": season, "week": week, "profile_id": profile_id}
+    points = None
+    cached_profile = cached_profile_rules(profile_id, profile_generation)
+    if cached_profile is not None and not scores_missing_stats(cached_profile[1]):
+        # Let SQLite score each stat row against its rule and total them with
+        # a window SUM; the rows still carry the stat line for the response.
+        profile_name, rules_dict, compiled = cached_profile
+        rows = (await db.execute(_SCORED_STATS_STMT, params)).all()
+        stats = {row.stat_key: row.stat_value for row in rows}
+        if rows:
+            points = round(rows[0].points or 0.0, 2)
+    elif cached_profile is not None:
+        rows = (await db.execute(_STATS_STMT, params)).all()
+        stats = {row.stat_key: row.stat_value for row in rows}
+        profile_name, rules_dict, compiled = cached_profile
+    else:
+        rows = (await db.execute(_STATS_AND_RULES_STMT, params)).all()
+        stats = {}
+        profile_name = None
+        compiled_blob = None
+        rules_dict = []
+        for row in rows:
+            if row.kind == "stat":
+                stats[row.stat_key] = row.stat_value
+                continue
+            profile_name = row.profile_name
+            compiled_blob = row.compiled
+            if row.stat_key is not None:
+                rules_dict.append({
+                    "stat_key": row.stat_key,
+                    "multiplier": row.multiplier,
+                    "per": row.per,
+                    "bonus_min": row.bonus_min,
+                    "bonus_max": row.bonus_max,
+                    "bonus_points": row.bonus_points,
+                    "cap": row.cap
+                })
+    
+        if profile_name is not None:
+            _, rules_dict, compiled = remember_profile_rules(
+                profile_id, profile_generation, profile_name, tuple(rules_dict), compiled_blob
+            )
     
     if not stats:
         raise HTTPException(
@@ -284,49 +511,34 @@ async def calculate_points(
             detail=f"No stats found for player {player_id} in {season} week {week}"
         )
     
-    # Get scoring profile and rules
-    profile_query = select(ScoringProfile).where(ScoringProfile.profile_id == profile_id)
-    profile_result = await db.execute(profile_query)
-    profile = profile_result.scalar_one_or_none()
-    
-    if not profile:
+    if profile_name is None:
         raise HTTPException(
             status_code=404,
             detail=f"Scoring profile {profile_id} not found"
         )
     
-    rules_query = select(ScoringRule).where(ScoringRule.profile_id == profile_id)
-    rules_result = await db.execute(rules_query)
-    rules = rules_result.scalars().all()
-    
-    # Convert rules to dictionary format for scoring engine
-    rules_dict = [
-        {
-            "stat_key": rule.stat_key,
-            "multiplier": rule.multiplier,
-            "per": rule.per,
-            "bonus_min": rule.bonus_min,
-            "bonus_max": rule.bonus_max,
-            "bonus_points": rule.bonus_points,
-            "cap": rule.cap
-        }
-        for rule in rules
-    ]
-    
-    # Calculate points
-    points = compute_points_from_dict(stats, rules_dict)
+    stored = None
+    if WEEK_POINTS_MAINTAINED:
+        stored = next((row.stored_points for row in rows if row.stored_points is not None), None)
+    if stored is not None:
+        points = round(stored, 2)
+    elif points is None:
+        points = score_compiled([stats], compiled)[0]
     
     # Performance check
     calculation_time = (time.time() - start_time) * 1000
     if calculation_time > 50:
-        # Log warning for slow calculations
-        print(f"Warning: Points calculation took {calculation_time:.2f}ms for {profile_id}")
+        _warn_slow("slow_points", calculation_time, profile_id=profile_id)
     
-    return PointsResponse(
-        points=points,
-        stats=stats,
-        profile_name=profile.name
-    )
+    # The values are already the schema's types; serialize without a pydantic pass
+    body = orjson.dumps({
+        "points": float(points),
+        "stats": stats,
+        "profile_name": profile_name
+    })
+    _points_response_cache.set(cache_key, body)
+    # Profiles can be edited at any time, so points always revalidate.
+    return json_bytes_response(body, if_none_match, REVALIDATE)
 
 
 @router.get("/points/leaderboard")
@@ -338,155 +550,160 @@ async def get_leaderboard(
     profile_id: str = Query(..., description="Scoring profile ID"),
     limit: int = Query(300, ge=1, le=1000, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
-    db: AsyncSession = Depends(get_db_session)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get fantasy points leaderboard with optional filters.
     """
+    cache_key = (season, week, position, team, profile_id, limit, offset)
+    generations = (
+        profile_generations.get(profile_id),
+        stats_generations.get((season, week) if week else season),
+    )
+    cached = _leaderboard_cache.get(cache_key)
+    if cached is not None:
+        built_from, fresh_until, body = cached
+        if built_from == generations and time.monotonic() < fresh_until:
+            return json_bytes_response(body, if_none_match, REVALIDATE)
+    
     try:
-        # Get scoring profile and rules
-        profile_query = select(ScoringProfile).where(ScoringProfile.profile_id == profile_id)
-        profile_result = await db.execute(profile_query)
-        profile = profile_result.scalar_one_or_none()
+        # Get scoring profile and rules (one query, cached per profile)
+        profile = await get_profile_rules(db, profile_id)
         
         if not profile:
             raise HTTPException(status_code=404, detail="Scoring profile not found")
         
-        rules_query = select(ScoringRule).where(ScoringRule.profile_id == profile_id)
-        rules_result = await db.execute(rules_query)
-        rules = rules_result.scalars().all()
-        
-        # Convert rules to dictionary format
-        rules_dict = [
-            {
-                "stat_key": rule.stat_key,
-                "multiplier": rule.multiplier,
-                "per": rule.per,
-                "bonus_min": rule.bonus_min,
-                "bonus_max": rule.bonus_max,
-                "bonus_points": rule.bonus_points,
-                "cap": rule.cap
-            }
-            for rule in rules
-        ]
-        
-        # Build base query for player stats
-        from ..models import Player
-        from sqlalchemy import and_, func
-        
-        if week:
-            # Weekly stats
-            stats_query = select(
-                Player.player_id,
-                Player.full_name,
-                Player.position,
-                Player.team,
-                func.sum(PlayerWeekStat.stat_value).label('total_value'),
-                func.count(PlayerWeekStat.stat_key).label('stat_count')
-            ).join(
-                PlayerWeekStat, 
-                and_(
-                    Player.player_id == PlayerWeekStat.player_id,
-                    PlayerWeekStat.season == season,
-                    PlayerWeekStat.week == week
-                )
+        profile_name, rules_dict, compiled = profile
+        
+        # One stat line per player: the week's values or the season totals.
+        stat_lines = _stat_lines(season, week)
+        if position or team:
+            filtered_players = select(Player.player_id)
+            if position:
+                filtered_players = filtered_players.where(Player.position == position)
+            if team:
+                filtered_players = filtered_players.where(Player.team == team)
+            stat_lines = stat_lines.where(stat_lines.selected_columns.player_id.in_(filtered_players))
+        stat_lines = stat_lines.subquery()
+        
+        materialized = WEEK_POINTS_MAINTAINED and bool(week) and (await db.execute(
+            select(PlayerWeekPointsComplete.profile_id).where(
+                PlayerWeekPointsComplete.season == season,
+                PlayerWeekPointsComplete.week == week,
+                PlayerWeekPointsComplete.profile_id == profile_id,
             )
-        else:
-            # Season totals
-            stats_query = select(
-                Player.player_id,
-                Player.full_name,
-                Player.position,
-                Player.team,
-                func.sum(PlayerWeekStat.stat_value).label('total_value'),
-                func.count(PlayerWeekStat.stat_key).label('stat_count')
-            ).join(
-                PlayerWeekStat, 
-                and_(
-                    Player.player_id == PlayerWeekStat.player_id,
-                    PlayerWeekStat.season == season
+        )).first() is not None
+        
+        if materialized:
+            # Points for this week were precomputed after the stats load.
+            ranking_query = (
+                select(Player.player_id, Player.full_name, Player.position, Player.team, PlayerWeekPoints.points)
+                .join(PlayerWeekPoints, PlayerWeekPoints.player_id == Player.player_id)
+                .where(
+                    PlayerWeekPoints.season == season,
+                    PlayerWeekPoints.week == week,
+                    PlayerWeekPoints.profile_id == profile_id,
                 )
+                .order_by(PlayerWeekPoints.points.desc(), Player.player_id)
+                .limit(limit)
+                .offset(offset)
             )
-        
-        # Add filters
-        if position:
-            stats_query = stats_query.where(Player.position == position)
-        if team:
-            stats_query = stats_query.where(Player.team == team)
-        
-        # Group and order by total value
-        stats_query = stats_query.group_by(
-            Player.player_id, Player.full_name, Player.position, Player.team
-        ).order_by(func.sum(PlayerWeekStat.stat_value).desc())
-        
-        # Add pagination
-        stats_query = stats_query.limit(limit).offset(offset)
-        
-        result = await db.execute(stats_query)
-        player_stats = result.all()
-        
-        # Calculate fantasy points for each player
-        leaderboard = []
-        for player_stat in player_stats:
-            if player_stat.stat_count == 0:
-                continue
-                
-            # Get detailed stats for this player
-            if week:
-                detail_query = select(PlayerWeekStat.stat_key, PlayerWeekStat.stat_value).where(
-                    and_(
-                        PlayerWeekStat.player_id == player_stat.player_id,
-                        PlayerWeekStat.season == season,
-                        PlayerWeekStat.week == week
-                    )
+            if position:
+                ranking_query = ranking_query.where(Player.position == position)
+            if team:
+                ranking_query = ranking_query.where(Player.team == team)
+            player_rows = (await db.execute(ranking_query)).all()
+            points_by_player = {row.player_id: round(row.points, 2) for row in player_rows}
+        elif not scores_missing_stats(rules_dict):
+            # SQLite scores every stat line against its rule, so ranking and
+            # pagination happen on fantasy points before any row leaves the DB.
+            points = func.coalesce(func.sum(sql_rule_points(stat_lines.c.stat_value)), 0.0)
+            ranked = (
+                select(stat_lines.c.player_id, points.label('fantasy_points'))
+                .outerjoin(
+                    ScoringRule,
+                    (ScoringRule.profile_id == profile_id)
+                    & (ScoringRule.stat_key == stat_lines.c.stat_key),
                 )
-            else:
-                detail_query = select(
-                    PlayerWeekStat.stat_key, 
-                    func.sum(PlayerWeekStat.stat_value).label('stat_value')
-                ).where(
-                    and_(
-                        PlayerWeekStat.player_id == player_stat.player_id,
-                        PlayerWeekStat.season == season
-                    )
-                ).group_by(PlayerWeekStat.stat_key)
-            
-            detail_result = await db.execute(detail_query)
-            stats_dict = {row.stat_key: row.stat_value for row in detail_result.all()}
-            
-            # Calculate fantasy points
-            points = compute_points_from_dict(stats_dict, rules_dict)
-            
-            leaderboard.append({
-                "player_id": player_stat.player_id,
-                "full_name": player_stat.full_name,
-                "position": player_stat.position,
-                "team": player_stat.team,
-                "fantasy_points": points,
-                "stats": stats_dict
-            })
-        
-        # Sort by fantasy points
-        leaderboard.sort(key=lambda x: x['fantasy_points'], reverse=True)
+                .group_by(stat_lines.c.player_id)
+                .subquery()
+            )
+            ranking_query = (
+                select(Player.player_id, Player.full_name, Player.position, Player.team, ranked.c.fantasy_points)
+                .join(ranked, ranked.c.player_id == Player.player_id)
+                .order_by(ranked.c.fantasy_points.desc(), Player.player_id)
+                .limit(limit)
+                .offset(offset)
+            )
+            player_rows = (await db.execute(ranking_query)).all()
+            points_by_player = {row.player_id: round(row.fantasy_points, 2) for row in player_rows}
+        else:
+            # Rules that score absent stats can't be expressed as a join over
+            # stat rows; score every candidate in NumPy and page afterwards.
+            player_rows = (await db.execute(
+                select(Player.player_id, Player.full_name, Player.position, Player.team)
+                .where(Player.player_id.in_(select(stat_lines.c.player_id)))
+            )).all()
+            points_by_player = None
+        
+        # Fetch the stat lines for every listed player in one query.
+        stats_by_player: Dict[str, Dict[str, float]] = {row.player_id: {} for row in player_rows}
+        if stats_by_player:
+            detail_query = select(
+                stat_lines.c.player_id, stat_lines.c.stat_key, stat_lines.c.stat_value
+            ).where(
+                stat_lines.c.player_id.in_(list(stats_by_player))
+            ).execution_options(yield_per=1000)
+            async for row in await db.stream(detail_query):
+                stats_by_player[row.player_id][row.stat_key] = row.stat_value
+        
+        if points_by_player is None:
+            points_by_player = dict(zip(
+                stats_by_player, score_compiled(list(stats_by_player.values()), compiled)
+            ))
+            player_rows = sorted(
+                player_rows, key=lambda row: (-points_by_player[row.player_id], row.player_id)
+            )[offset:offset + limit]
+        
+        leaderboard = [
+            {
+                "player_id": row.player_id,
+                "full_name": row.full_name,
+                "position": row.position,
+                "team": row.team,
+                "fantasy_points": points_by_player[row.player_id],
+                "stats": stats_by_player[row.player_id]
+            }
+            for row in player_rows
+        ]
         
-        return {
+        body = orjson.dumps({
             "season": season,
             "week": week,
             "position": position,
             "team": team,
-            "profile_name": profile.name,
+            "profile_name": profile_name,
             "total_players": len(leaderboard),
             "leaderboard": leaderboard
-        }
+        })
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to generate leaderboard: {str(e)}")
+    except SQLAlchemyError as e:
+        if cached is not None:
+            logger.warning("Serving stale leaderboard for %s: %s", cache_key, e)
+            return json_bytes_response(cached[2], if_none_match, REVALIDATE)
+        raise HTTPException(status_code=500, detail=f"Failed to generate leaderboard: {str(e)}") from e
+    
+    fresh_for = _LEADERBOARD_FRESH_PAST if season < current_season() else _LEADERBOARD_FRESH_CURRENT
+    _leaderboard_cache.set(cache_key, (generations, time.monotonic() + fresh_for, body))
+    # Profiles can be edited at any time, so even past seasons revalidate.
+    return json_bytes_response(body, if_none_match, REVALIDATE)
 
 
 @router.post("/points/batch")
 async def batch_calculate_points(
     request_data: dict,
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Calculate fantasy points for multiple players in one request.
@@ -497,49 +714,59 @@ async def batch_calculate_points(
         week = request_data.get("week")
         profile_id = request_data.get("profile_id")
         
-        if not all([player_ids, season, profile_id]):
+        if player_ids is None or not all([season, profile_id]):
             raise HTTPException(
                 status_code=400, 
                 detail="player_ids, season, and profile_id are required"
             )
         
-        # Get scoring profile and rules
-        profile_query = select(ScoringProfile).where(ScoringProfile.profile_id == profile_id)
-        profile_result = await db.execute(profile_query)
-        profile = profile_result.scalar_one_or_none()
+        # Get scoring profile and rules (one query, cached per profile)
+        profile = await get_profile_rules(db, profile_id)
         
         if not profile:
             raise HTTPException(status_code=404, detail="Scoring profile not found")
         
-        rules_query = select(ScoringRule).where(ScoringRule.profile_id == profile_id)
-        rules_result = await db.execute(rules_query)
-        rules = rules_result.scalars().all()
+        profile_name, _, compiled = profile
         
-        # Convert rules to dictionary format
-        rules_dict = [
-            {
-                "stat_key": rule.stat_key,
-                "multiplier": rule.multiplier,
-                "per": rule.per,
-                "bonus_min": rule.bonus_min,
-                "bonus_max": rule.bonus_max,
-                "bonus_points": rule.bonus_points,
-                "cap": rule.cap
-            }
-            for rule in rules
-        ]
+        if not player_ids:
+            return ORJSONResponse({
+                "season": season,
+                "week": week,
+                "profile_name": profile_name,
+                "total_players": 0,
+                "calculation_time_ms": 0.0,
+                "results": []
+            })
         
-        # Get player info
-        from ..models import Player
-        from sqlalchemy import func, and_
-        players_query = select(Player).where(Player.player_id.in_(player_ids))
-        players_result = await db.execute(players_query)
-        players = {p.player_id: p for p in players_result.scalars().all()}
+        # Get player info as plain rows; only four columns reach the response
+        players = {}
+        for chunk in _chunked(list(dict.fromkeys(player_ids))):
+            players_result = await db.execute(
+                select(Player.player_id, Player.full_name, Player.position, Player.team)
+                .where(Player.player_id.in_(chunk))
+            )
+            players.update((p.player_id, p) for p in players_result.all())
         
         # Calculate points for each player
         results = []
         start_time = time.time()
         
+        # Every player's stat line in one query; summing per stat_key gives
+        # the week's values or the season totals.
+        stats_by_player: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for chunk in _chunked(list(players)):
+            stats_query = _stat_lines(season, week)
+            stats_query = stats_query.where(stats_query.selected_columns.player_id.in_(chunk))
+            
+            stats_result = await db.execute(stats_query)
+            for row in stats_result.all():
+                stats_by_player[row.player_id][row.stat_key] = row.stat_value
+        
+        # Score every stat line against the compiled rules in one pass.
+        points_by_player = dict(zip(
+            stats_by_player, score_compiled(list(stats_by_player.values()), compiled)
+        ))
+        
         for player_id in player_ids:
             if player_id not in players:
                 results.append({
@@ -549,29 +776,7 @@ async def batch_calculate_points(
                 continue
             
             player = players[player_id]
-            
-            # Get stats for this player
-            if week:
-                stats_query = select(PlayerWeekStat.stat_key, PlayerWeekStat.stat_value).where(
-                    and_(
-                        PlayerWeekStat.player_id == player_id,
-                        PlayerWeekStat.season == season,
-                        PlayerWeekStat.week == week
-                    )
-                )
-            else:
-                stats_query = select(
-                    PlayerWeekStat.stat_key, 
-                    func.sum(PlayerWeekStat.stat_value).label('stat_value')
-                ).where(
-                    and_(
-                        PlayerWeekStat.player_id == player_id,
-                        PlayerWeekStat.season == season
-                    )
-                ).group_by(PlayerWeekStat.stat_key)
-            
-            stats_result = await db.execute(stats_query)
-            stats = {row.stat_key: row.stat_value for row in stats_result.all()}
+            stats = stats_by_player.get(player_id, {})
             
             if not stats:
                 results.append({
@@ -585,116 +790,174 @@ async def batch_calculate_points(
                 })
                 continue
             
-            # Calculate fantasy points
-            points = compute_points_from_dict(stats, rules_dict)
-            
             results.append({
                 "player_id": player_id,
                 "full_name": player.full_name,
                 "position": player.position,
                 "team": player.team,
-                "fantasy_points": points,
+                "fantasy_points": points_by_player[player_id],
                 "stats": stats
             })
         
         # Performance check
         total_time = (time.time() - start_time) * 1000
         if total_time > 100:
-            print(f"Warning: Batch calculation took {total_time:.2f}ms for {len(player_ids)} players")
+            _warn_slow("slow_batch_points", total_time, profile_id=profile_id, players=len(player_ids))
         
-        return {
+        # Batch bodies are large and plain JSON types: render them with orjson
+        # directly rather than walking them through jsonable_encoder first.
+        return ORJSONResponse({
             "season": season,
             "week": week,
-            "profile_name": profile.name,
+            "profile_name": profile_name,
             "total_players": len(player_ids),
             "calculation_time_ms": total_time,
             "results": results
-        }
+        })
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to calculate batch points: {str(e)}")
+    except SQLAlchemyError as e:
+        raise HTTPException(status_code=500, detail=f"Failed to calculate batch points: {str(e)}") from e
+
+
+@router.post("/points/batch/weeks")
+async def batch_calculate_week_points(
+    request_data: WeeklyPointsBatchRequest,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Score many (player, season, week) stat lines against one profile in a single pass.
+    """
+    start_time = time.time()
+    
+    profile = await get_profile_rules(db, request_data.profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Scoring profile not found")
+    profile_name, _, compiled = profile
+    
+    keys = list(dict.fromkeys(
+        (entry.player_id, entry.season, entry.week) for entry in request_data.entries
+    ))
+    stat_lines = {key: {} for key in keys}
+    rule_stat_keys = set(compiled["stat_key"].tolist())
+    if rule_stat_keys:
+        stats_result = await db.execute(
+            select(
+                PlayerWeekStat.player_id,
+                PlayerWeekStat.season,
+                PlayerWeekStat.week,
+                PlayerWeekStat.stat_key,
+                PlayerWeekStat.stat_value,
+            ).where(
+                tuple_(PlayerWeekStat.player_id, PlayerWeekStat.season, PlayerWeekStat.week).in_(keys),
+                PlayerWeekStat.stat_key.in_(rule_stat_keys),
+            )
+        )
+        for row in stats_result.all():
+            stat_lines[(row.player_id, row.season, row.week)][row.stat_key] = row.stat_value
+    
+    points = score_compiled(list(stat_lines.values()), compiled)
+    
+    return ORJSONResponse({
+        "profile_name": profile_name,
+        "total_entries": len(keys),
+        "calculation_time_ms": (time.time() - start_time) * 1000,
+        "results": [
+            {
+                "player_id": player_id,
+                "season": season,
+                "week": week,
+                "fantasy_points": player_points,
+            }
+            for (player_id, season, week), player_points in zip(stat_lines, points)
+        ]
+    })
 
 
 @router.get("/players/{player_id}/stats")
 async def get_player_stats(
+    response: Response,
     player_id: str,
     season: int = Query(..., description="NFL season year", ge=2000, le=2030),
     week: int = Query(..., description="Week number", ge=1, le=18),
-    db: AsyncSession = Depends(get_db_session)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get raw stats for a player in a specific week.
     """
-    stats_query = select(PlayerWeekStat).where(
+    stats_query = select(PlayerWeekStat.stat_key, PlayerWeekStat.stat_value).where(
         PlayerWeekStat.player_id == player_id,
         PlayerWeekStat.season == season,
         PlayerWeekStat.week == week
     )
     
     result = await db.execute(stats_query)
-    stats = result.scalars().all()
+    stats_dict = dict(result.all())
     
-    if not stats:
+    if not stats_dict:
         raise HTTPException(
             status_code=404,
             detail=f"No stats found for player {player_id} in {season} week {week}"
         )
     
-    # Convert to dictionary format
-    stats_dict = {stat.stat_key: stat.stat_value for stat in stats}
-    
-    return {
+    payload = {
         "player_id": player_id,
         "season": season,
         "week": week,
         "stats": stats_dict
     }
+    return not_modified(response, if_none_match, payload, season_cache_control(season)) or payload
 
 
 @router.get("/profiles")
 async def list_scoring_profiles(
-    db: AsyncSession = Depends(get_db_session)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List all available scoring profiles.
     """
-    query = select(ScoringProfile).where(ScoringProfile.is_public == True)
-    result = await db.execute(query)
-    profiles = result.scalars().all()
-    profile_ids = [profile.profile_id for profile in profiles]
+    cached_body = _profile_list_cache.get("public")
+    if cached_body is not None:
+        return json_bytes_response(cached_body, if_none_match, REVALIDATE)
+    
+    # Plain column rows: nothing here needs ORM instances or the compiled blob.
+    query = select(
+        ScoringProfile.profile_id,
+        ScoringProfile.name,
+        ScoringProfile.description,
+        ScoringProfile.is_public,
+        ScoringProfile.created_at,
+    ).where(ScoringProfile.is_public.is_(True))
+    profiles = (await db.execute(query)).mappings().all()
+    profile_ids = [profile["profile_id"] for profile in profiles]
     rules = (
         await db.execute(
-            select(ScoringRule)
+            select(
+                ScoringRule.profile_id,
+                ScoringRule.rule_id,
+                ScoringRule.stat_key,
+                ScoringRule.multiplier,
+                ScoringRule.per,
+                ScoringRule.bonus_min,
+                ScoringRule.bonus_max,
+                ScoringRule.bonus_points,
+                ScoringRule.cap,
+            )
             .where(ScoringRule.profile_id.in_(profile_ids))
             .order_by(ScoringRule.profile_id, ScoringRule.stat_key)
         )
-    ).scalars().all() if profile_ids else []
-    rules_by_profile: Dict[str, List[ScoringRule]] = {}
+    ).mappings().all() if profile_ids else []
+    rules_by_profile: Dict[str, List[Dict[str, Any]]] = {}
     for rule in rules:
-        rules_by_profile.setdefault(rule.profile_id, []).append(rule)
+        rule = dict(rule)
+        rules_by_profile.setdefault(rule.pop("profile_id"), []).append(rule)
     
-    return {
+    body = orjson.dumps({
         "profiles": [
-            {
-                "profile_id": profile.profile_id,
-                "name": profile.name,
-                "description": profile.description,
-                "is_public": profile.is_public,
-                "created_at": profile.created_at,
-                "rules": [
-                    {
-                        "rule_id": rule.rule_id,
-                        "stat_key": rule.stat_key,
-                        "multiplier": rule.multiplier,
-                        "per": rule.per,
-                        "bonus_min": rule.bonus_min,
-                        "bonus_max": rule.bonus_max,
-                        "bonus_points": rule.bonus_points,
-                        "cap": rule.cap,
-                    }
-                    for rule in rules_by_profile.get(profile.profile_id, [])
-                ],
-            }
+            {**profile, "rules": rules_by_profile.get(profile["profile_id"], [])}
             for profile in profiles
         ]
-    }
+    })
+    _profile_list_cache.set("public", body)
+    return json_bytes_response(body, if_none_match, REVALIDATE)
@@ -6,9 +6,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import DATABASE_URL
-from ..deps import get_db_session
+from ..db import DATABASE_URL, get_read_db
 from ..models import NewsItem, Player
+from ..responses import ORJSONResponse
 
 router = APIRouter(prefix="/news", tags=["news"])
 
@@ -32,7 +32,7 @@ async def list_news(
     source: str = Query(None, description="Source identifier (e.g. espn)"),
     min_score: float = Query(None, ge=0, description="Min relevance score for the player filter"),
     limit: int = Query(50, ge=1, le=200),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """List recent news items, most recent first."""
     stmt = select(NewsItem)
@@ -46,7 +46,9 @@ async def list_news(
     stmt = stmt.order_by(NewsItem.published_at.desc()).limit(limit)
     result = await db.execute(stmt)
     items = [_news_dict(i) for i in result.scalars().all()]
-    return {"count": len(items), "news": items}
+    # Plain JSON types throughout: render with orjson directly rather than
+    # walking every article through jsonable_encoder first.
+    return ORJSONResponse({"count": len(items), "news": items})
 
 
 @router.get("/search")
@@ -54,7 +56,7 @@ async def search_news(
     q: str = Query(..., min_length=1, description="Full-text search query"),
     player_id: str = Query(None, description="Only articles mentioning this player"),
     limit: int = Query(50, ge=1, le=200),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Full-text search over news titles and summaries (SQLite FTS5)."""
     if "sqlite" not in DATABASE_URL:
@@ -76,14 +78,14 @@ async def search_news(
     stmt = select(NewsItem).from_statement(sql)
     result = await db.execute(stmt, {"match": match, "limit": limit})
     items = [_news_dict(i) for i in result.scalars().all()]
-    return {"query": q, "count": len(items), "news": items}
+    return ORJSONResponse({"query": q, "count": len(items), "news": items})
 
 
 @router.get("/players/{player_id}/features")
 async def player_news_features(
     player_id: str,
     days: int = Query(30, ge=1, le=365, description="Look-back window in days"),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Aggregated news features for a player from article relevance scoring.
 
@@ -91,8 +93,11 @@ async def player_news_features(
     the top headlines, all within the look-back window.
     """
     player = (
-        await db.execute(select(Player).where(Player.player_id == player_id))
-    ).scalar_one_or_none()
+        await db.execute(
+            select(Player.full_name, Player.position, Player.team)
+            .where(Player.player_id == player_id)
+        )
+    ).one_or_none()
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
 
@@ -1,39 +1,143 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select, and_, case
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from sqlalchemy import bindparam, select, and_, case, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
+from collections import defaultdict
+from itertools import groupby
 from typing import List, Optional
+import asyncio
+import numpy as np
+import orjson
 
-from ..deps import get_db_session
-from ..models import NewsItem, Player, PlayerInjury, PlayerRanking, PlayerWeekStat
-from ..services.nflverse import search_players, get_player_stats
+from ..cache import TTLCache, stats_generations
+from ..db import get_read_db, get_read_sessions
+from ..http_cache import BRIEF, STATIC, etag_for_bytes, json_bytes_response
+from ..models import NewsItem, Player, PlayerInjury, PlayerRanking, PlayerWeekStat, ScoringRule
+from ..responses import ORJSONResponse
+from ..services.nflverse import PLAYER_COLUMNS, search_players, get_player_stats
+from ..services.profile_rules import get_profile_rules
+from ..services.projection_analytics import projected_team_opportunity, score_projected_batch
+from ..services.schedule_strength import get_schedule_strength
 from ..schemas import Player as PlayerSchema
+from ..scoring import score_compiled, scores_missing_stats, sql_rule_points
 
-router = APIRouter(prefix="/players", tags=["players"])
+router = APIRouter(prefix="/players", tags=["players"], default_response_class=ORJSONResponse)
+
+
+# Constant lookup lists, serialized once at import.
+_POSITIONS_BODY = orjson.dumps({
+    "positions": ["QB", "RB", "WR", "TE", "K", "DEF", "DST"]
+})
+_TEAMS_BODY = orjson.dumps({
+    "teams": [
+        "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE",
+        "DAL", "DEN", "DET", "GB", "HOU", "IND", "JAX", "KC",
+        "LV", "LAC", "LAR", "MIA", "MIN", "NE", "NO", "NYG",
+        "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS"
+    ]
+})
+_POSITIONS_ETAG = etag_for_bytes(_POSITIONS_BODY)
+_TEAMS_ETAG = etag_for_bytes(_TEAMS_BODY)
+
+# Serialized week/season stat bodies. Keys carry the stats generation, so a
+# stat load in this process retires them; the TTL bounds staleness from
+# loads in other processes and from player seeding.
+_stats_body_cache = TTLCache(maxsize=2048, ttl=300)
+
+
+# Player endpoint statements are built once with bind parameters so every
+# request reuses the same constructs and their cached compiled SQL.
+_PLAYER_STMT = select(*PLAYER_COLUMNS).where(Player.player_id == bindparam("player_id"))
+
+
+def _player_with_stats(*stat_criteria):
+    """
+    Select a player's columns LEFT JOINed to their stat rows matching ``stat_criteria``.
+
+    Yields one row per stat (a single row with NULL stat columns if none
+    match) and no rows at all for an unknown player, so the 404 check needs
+    no query of its own.
+    """
+    return select(
+        Player.player_id,
+        Player.full_name,
+        Player.position,
+        Player.team,
+        PlayerWeekStat.week,
+        PlayerWeekStat.stat_key,
+        PlayerWeekStat.stat_value,
+    ).select_from(Player).outerjoin(
+        PlayerWeekStat,
+        and_(PlayerWeekStat.player_id == Player.player_id, *stat_criteria),
+    ).where(Player.player_id == bindparam("player_id"))
+
+
+_PLAYER_WEEK_STATS_STMT = _player_with_stats(
+    PlayerWeekStat.season == bindparam("season"), PlayerWeekStat.week == bindparam("week")
+)
+_PLAYER_SEASON_STATS_STMT = _player_with_stats(
+    PlayerWeekStat.season == bindparam("season")
+).order_by(PlayerWeekStat.week).execution_options(yield_per=1000)
+_PLAYER_SUMMARY_STATS_STMT = _player_with_stats(
+    PlayerWeekStat.season == bindparam("season"), PlayerWeekStat.week <= 18
+).order_by(PlayerWeekStat.week)
+
+# Season totals for every player at the player's position in one aggregate,
+# grouped per player and stat.
+_subject = aliased(Player)
+_position_lines = select(
+    PlayerWeekStat.player_id,
+    PlayerWeekStat.stat_key,
+    func.sum(PlayerWeekStat.stat_value).label('stat_value')
+).join(
+    Player, Player.player_id == PlayerWeekStat.player_id
+).where(
+    Player.position == select(_subject.position).where(
+        _subject.player_id == bindparam("player_id")
+    ).scalar_subquery(),
+    PlayerWeekStat.season == bindparam("season"),
+    PlayerWeekStat.week <= 18,
+).group_by(PlayerWeekStat.player_id, PlayerWeekStat.stat_key)
+
+# Profiles that can score absent stats rank in Python from the raw totals.
+_POSITION_TOTALS_STMT = _position_lines.where(
+    PlayerWeekStat.player_id != bindparam("player_id")
+).execution_options(yield_per=1000)
+
+# Everyone else is scored and ranked in SQL; RANK() is one more than the
+# number of players at the position with strictly more points.
+_position_lines_sq = _position_lines.subquery()
+_position_points = select(
+    _position_lines_sq.c.player_id,
+    func.coalesce(func.sum(sql_rule_points(_position_lines_sq.c.stat_value)), 0.0).label('points'),
+).outerjoin(
+    ScoringRule,
+    (ScoringRule.profile_id == bindparam("profile_id"))
+    & (ScoringRule.stat_key == _position_lines_sq.c.stat_key),
+).group_by(_position_lines_sq.c.player_id).subquery()
+_position_ranks = select(
+    _position_points.c.player_id,
+    func.rank().over(order_by=_position_points.c.points.desc()).label('position_rank'),
+).subquery()
+_POSITION_RANK_STMT = select(_position_ranks.c.position_rank).where(
+    _position_ranks.c.player_id == bindparam("player_id")
+)
 
 
 @router.get("/positions")
-async def get_positions():
+async def get_positions(if_none_match: Optional[str] = Header(None)):
     """
     Get list of available player positions.
     """
-    return {
-        "positions": ["QB", "RB", "WR", "TE", "K", "DEF", "DST"]
-    }
+    return json_bytes_response(_POSITIONS_BODY, if_none_match, STATIC, _POSITIONS_ETAG)
 
 
 @router.get("/teams")
-async def get_teams():
+async def get_teams(if_none_match: Optional[str] = Header(None)):
     """
     Get list of available NFL teams.
     """
-    return {
-        "teams": [
-            "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE",
-            "DAL", "DEN", "DET", "GB", "HOU", "IND", "JAX", "KC",
-            "LV", "LAC", "LAR", "MIA", "MIN", "NE", "NO", "NYG",
-            "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS"
-        ]
-    }
+    return json_bytes_response(_TEAMS_BODY, if_none_match, STATIC, _TEAMS_ETAG)
 
 
 @router.get("/")
@@ -44,7 +148,7 @@ async def search_players_endpoint(
     limit: int = Query(50, ge=1, le=1500, description="Maximum number of results"),
     current_only: bool = Query(False, description="Only active fantasy-relevant players"),
     season: Optional[int] = Query(None, ge=2000, le=2030),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Search players with optional filters.
@@ -59,28 +163,29 @@ async def search_players_endpoint(
             season=season,
             session=db,
         )
-        return players
+        # Up to 1500 plain rows; skip jsonable_encoder and render with orjson.
+        return ORJSONResponse(players)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 
-@router.get("/{player_id}", response_model=PlayerSchema)
+# The row is returned as-is; the schema only documents the response.
+@router.get("/{player_id}", responses={200: {"model": PlayerSchema}})
 async def get_player(
     player_id: str,
-    db: AsyncSession = Depends(get_db_session)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get player details by ID.
     """
-    result = await db.execute(
-        select(Player).where(Player.player_id == player_id)
-    )
-    player = result.scalar_one_or_none()
+    result = await db.execute(_PLAYER_STMT, {"player_id": player_id})
+    player = result.mappings().one_or_none()
     
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
     
-    return player
+    return json_bytes_response(orjson.dumps(dict(player)), if_none_match, BRIEF)
 
 
 @router.get("/{player_id}/stats")
@@ -88,32 +193,28 @@ async def get_player_weekly_stats(
     player_id: str,
     season: int = Query(..., description="NFL season year", ge=2000, le=2030),
     week: int = Query(..., description="Week number", ge=1, le=18),
-    db: AsyncSession = Depends(get_db_session)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get player statistics for a specific week.
     """
-    # First verify player exists
-    player_result = await db.execute(
-        select(Player).where(Player.player_id == player_id)
-    )
-    player = player_result.scalar_one_or_none()
+    cache_key = ("week", player_id, season, week, stats_generations.get((season, week)))
+    body = _stats_body_cache.get(cache_key)
+    if body is not None:
+        return json_bytes_response(body, if_none_match, BRIEF)
     
-    if not player:
-        raise HTTPException(status_code=404, detail="Player not found")
+    rows = (await db.execute(
+        _PLAYER_WEEK_STATS_STMT, {"player_id": player_id, "season": season, "week": week}
+    )).all()
     
-    # Get stats
-    stats_result = await db.execute(
-        select(PlayerWeekStat).where(
-            PlayerWeekStat.player_id == player_id,
-            PlayerWeekStat.season == season,
-            PlayerWeekStat.week == week
-        )
-    )
+    if not rows:
+        raise HTTPException(status_code=404, detail="Player not found")
     
-    stats = stats_result.scalars().all()
+    player = rows[0]
+    stats = {row.stat_key: row.stat_value for row in rows if row.stat_key is not None}
     
-    return {
+    body = orjson.dumps({
         "player": {
             "player_id": player.player_id,
             "full_name": player.full_name,
@@ -122,47 +223,44 @@ async def get_player_weekly_stats(
         },
         "season": season,
         "week": week,
-        "stats": {stat.stat_key: stat.stat_value for stat in stats}
-    }
+        "stats": stats
+    })
+    _stats_body_cache.set(cache_key, body)
+    return json_bytes_response(body, if_none_match, BRIEF)
 
 
 @router.get("/{player_id}/season/{season}")
 async def get_player_season_stats(
     player_id: str,
     season: int,
-    db: AsyncSession = Depends(get_db_session)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get player statistics for an entire season.
     """
-    # First verify player exists
-    player_result = await db.execute(
-        select(Player).where(Player.player_id == player_id)
-    )
-    player = player_result.scalar_one_or_none()
+    cache_key = ("season", player_id, season, stats_generations.get(season))
+    body = _stats_body_cache.get(cache_key)
+    if body is not None:
+        return json_bytes_response(body, if_none_match, BRIEF)
     
-    if not player:
-        raise HTTPException(status_code=404, detail="Player not found")
-    
-    # Get all stats for the season
-    stats_result = await db.execute(
-        select(PlayerWeekStat).where(
-            PlayerWeekStat.player_id == player_id,
-            PlayerWeekStat.season == season
-        ).order_by(PlayerWeekStat.week)
+    # Stream the player and season's stat rows as plain columns and group
+    # them by week as they arrive, rather than materializing every ORM row first.
+    stats_result = await db.stream(
+        _PLAYER_SEASON_STATS_STMT, {"player_id": player_id, "season": season}
     )
     
-    stats = stats_result.scalars().all()
-    
-    # Group by week
+    player = None
     weekly_stats = {}
-    for stat in stats:
-        week = stat.week
-        if week not in weekly_stats:
-            weekly_stats[week] = {}
-        weekly_stats[week][stat.stat_key] = stat.stat_value
+    async for row in stats_result:
+        player = player or row
+        if row.stat_key is not None:
+            weekly_stats.setdefault(row.week, {})[row.stat_key] = row.stat_value
     
-    return {
+    if player is None:
+        raise HTTPException(status_code=404, detail="Player not found")
+    
+    body = orjson.dumps({
         "player": {
             "player_id": player.player_id,
             "full_name": player.full_name,
@@ -171,7 +269,9 @@ async def get_player_season_stats(
         },
         "season": season,
         "weekly_stats": weekly_stats
-    }
+    }, option=orjson.OPT_NON_STR_KEYS)
+    _stats_body_cache.set(cache_key, body)
+    return json_bytes_response(body, if_none_match, BRIEF)
 
 
 @router.get("/{player_id}/summary")
@@ -179,178 +279,92 @@ async def get_player_summary(
     player_id: str,
     season: int = Query(..., description="NFL season year", ge=2000, le=2030),
     profile_id: Optional[str] = Query(None, description="Scoring profile ID for fantasy points"),
-    db: AsyncSession = Depends(get_db_session)
+    sessions: async_sessionmaker[AsyncSession] = Depends(get_read_sessions)
 ):
     """
     Get comprehensive player summary including season totals, weekly trends, and fantasy points.
     """
     try:
-        # Get player info
-        player_query = select(Player).where(Player.player_id == player_id)
-        player_result = await db.execute(player_query)
-        player = player_result.scalar_one_or_none()
+        params = {"player_id": player_id, "season": season, "profile_id": profile_id}
         
-        if not player:
-            raise HTTPException(status_code=404, detail="Player not found")
+        async def read_rows(stmt):
+            async with sessions() as session:
+                return (await session.execute(stmt, params)).all()
+        
+        async def read_profile():
+            async with sessions() as session:
+                return await get_profile_rules(session, profile_id)
         
-        # Get all weekly stats for the season
-        from sqlalchemy import func, and_
-        weekly_query = select(
-            PlayerWeekStat.week,
-            func.sum(PlayerWeekStat.stat_value).label('total_value'),
-            func.count(PlayerWeekStat.stat_key).label('stat_count')
-        ).where(
-            and_(
-                PlayerWeekStat.player_id == player_id,
-                PlayerWeekStat.season == season,
-                PlayerWeekStat.week <= 18,
+        # The three reads are independent, so each runs on its own session
+        # and they overlap instead of queueing on one connection.
+        if profile_id:
+            season_rows, profile, rank_rows = await asyncio.gather(
+                read_rows(_PLAYER_SUMMARY_STATS_STMT), read_profile(), read_rows(_POSITION_RANK_STMT)
             )
-        ).group_by(PlayerWeekStat.week).order_by(PlayerWeekStat.week)
+        else:
+            season_rows, profile, rank_rows = await read_rows(_PLAYER_SUMMARY_STATS_STMT), None, []
         
-        weekly_result = await db.execute(weekly_query)
-        weekly_stats = weekly_result.all()
+        if not season_rows:
+            raise HTTPException(status_code=404, detail="Player not found")
         
-        # Get season totals by stat type
-        season_query = select(
-            PlayerWeekStat.stat_key,
-            func.sum(PlayerWeekStat.stat_value).label('season_total'),
-            func.avg(PlayerWeekStat.stat_value).label('weekly_avg'),
-            func.max(PlayerWeekStat.stat_value).label('weekly_high'),
-            func.count(PlayerWeekStat.stat_key).label('games_played')
-        ).where(
-            and_(
-                PlayerWeekStat.player_id == player_id,
-                PlayerWeekStat.season == season,
-                PlayerWeekStat.week <= 18,
+        player = season_rows[0]
+        weekly_stats = {
+            week: {row.stat_key: row.stat_value for row in rows}
+            for week, rows in groupby(
+                (row for row in season_rows if row.stat_key is not None),
+                key=lambda row: row.week,
             )
-        ).group_by(PlayerWeekStat.stat_key)
+        }
         
-        season_result = await db.execute(season_query)
-        season_stats = {row.stat_key: {
-            'total': row.season_total,
-            'avg': row.weekly_avg,
-            'high': row.weekly_high,
-            'games': row.games_played
-        } for row in season_result.all()}
+        # Season totals by stat type
+        season_stats = {}
+        for week_stats_dict in weekly_stats.values():
+            for stat_key, stat_value in week_stats_dict.items():
+                totals = season_stats.setdefault(stat_key, {'total': 0.0, 'high': stat_value, 'games': 0})
+                totals['total'] += stat_value
+                totals['high'] = max(totals['high'], stat_value)
+                totals['games'] += 1
+        for totals in season_stats.values():
+            totals['avg'] = totals['total'] / totals['games']
         
         # Calculate fantasy points if profile provided
         fantasy_points = None
-        if profile_id and season_stats:
-            from ..models import ScoringProfile, ScoringRule
-            from ..scoring import compute_points_from_dict
+        compiled = None
+        if profile and season_stats:
+            # Cached rules, compiled once and reused for the ranking and weekly scores
+            _, _, compiled = profile
             
-            # Get scoring profile and rules
-            profile_query = select(ScoringProfile).where(ScoringProfile.profile_id == profile_id)
-            profile_result = await db.execute(profile_query)
-            profile = profile_result.scalar_one_or_none()
-            
-            if profile:
-                rules_query = select(ScoringRule).where(ScoringRule.profile_id == profile_id)
-                rules_result = await db.execute(rules_query)
-                rules = rules_result.scalars().all()
-                
-                # Convert rules to dictionary format
-                rules_dict = [
-                    {
-                        "stat_key": rule.stat_key,
-                        "multiplier": rule.multiplier,
-                        "per": rule.per,
-                        "bonus_min": rule.bonus_min,
-                        "bonus_max": rule.bonus_max,
-                        "bonus_points": rule.bonus_points,
-                        "cap": rule.cap
-                    }
-                    for rule in rules
-                ]
-                
-                # Calculate season total fantasy points
-                season_stats_dict = {stat: data['total'] for stat, data in season_stats.items()}
-                fantasy_points = compute_points_from_dict(season_stats_dict, rules_dict)
+            # Calculate season total fantasy points
+            season_stats_dict = {stat: data['total'] for stat, data in season_stats.items()}
+            fantasy_points = score_compiled([season_stats_dict], compiled)[0]
         
         # Get position ranking
         position_ranking = None
-        if profile_id and fantasy_points is not None:
-            # Get all players in same position for ranking
-            ranking_query = select(
-                Player.player_id,
-                Player.full_name,
-                Player.team
-            ).where(
-                and_(
-                    Player.position == player.position,
-                    Player.player_id != player_id
-                )
-            )
+        if fantasy_points is not None and not scores_missing_stats(profile[1]):
+            position_ranking = rank_rows[0].position_rank if rank_rows else None
+        elif fantasy_points is not None:
+            # Stream the position's totals straight into per-player stat lines
+            position_stats = defaultdict(dict)
+            async with sessions() as session:
+                async for row in await session.stream(_POSITION_TOTALS_STMT, params):
+                    position_stats[row.player_id][row.stat_key] = row.stat_value
             
-            ranking_result = await db.execute(ranking_query)
-            position_players = ranking_result.all()
-            
-            if position_players:
-                # Calculate fantasy points for all players in position
-                player_points = []
-                for pos_player in position_players:
-                    pos_stats_query = select(
-                        PlayerWeekStat.stat_key,
-                        func.sum(PlayerWeekStat.stat_value).label('stat_value')
-                    ).where(
-                        and_(
-                            PlayerWeekStat.player_id == pos_player.player_id,
-                            PlayerWeekStat.season == season,
-                            PlayerWeekStat.week <= 18,
-                        )
-                    ).group_by(PlayerWeekStat.stat_key)
-                    
-                    pos_stats_result = await db.execute(pos_stats_query)
-                    pos_stats = {row.stat_key: row.stat_value for row in pos_stats_result.all()}
-                    
-                    if pos_stats:
-                        pos_points = compute_points_from_dict(pos_stats, rules_dict)
-                        player_points.append({
-                            'player_id': pos_player.player_id,
-                            'full_name': pos_player.full_name,
-                            'team': pos_player.team,
-                            'fantasy_points': pos_points
-                        })
-                
-                # Sort by fantasy points and find rank
-                player_points.sort(key=lambda x: x['fantasy_points'], reverse=True)
-                for i, pos_player in enumerate(player_points):
-                    if pos_player['fantasy_points'] <= fantasy_points:
-                        position_ranking = i + 1
-                        break
-                
-                if position_ranking is None:
-                    position_ranking = len(player_points) + 1
+            # Score the whole position in one vectorized pass and count the
+            # players ahead without a Python loop
+            pos_points = np.asarray(score_compiled(list(position_stats.values()), compiled))
+            position_ranking = 1 + int(np.count_nonzero(pos_points > fantasy_points))
         
         # Build weekly sparkline data
-        weekly_sparkline = []
-        for week_stat in weekly_stats:
-            if week_stat.stat_count == 0:
-                continue
-                
-            # Get detailed stats for this week
-            week_detail_query = select(PlayerWeekStat.stat_key, PlayerWeekStat.stat_value).where(
-                and_(
-                    PlayerWeekStat.player_id == player_id,
-                    PlayerWeekStat.season == season,
-                    PlayerWeekStat.week == week_stat.week,
-                    PlayerWeekStat.week <= 18,
-                )
-            )
-            
-            week_detail_result = await db.execute(week_detail_query)
-            week_stats_dict = {row.stat_key: row.stat_value for row in week_detail_result.all()}
-            
-            # Calculate weekly fantasy points if profile provided
-            week_fantasy_points = None
-            if profile_id and 'rules_dict' in locals():
-                week_fantasy_points = compute_points_from_dict(week_stats_dict, rules_dict)
-            
-            weekly_sparkline.append({
-                'week': week_stat.week,
-                'stats': week_stats_dict,
-                'fantasy_points': week_fantasy_points
-            })
+        weekly_sparkline = [
+            {'week': week, 'stats': week_stats_dict, 'fantasy_points': None}
+            for week, week_stats_dict in weekly_stats.items()
+        ]
+        
+        # Calculate weekly fantasy points if profile provided
+        if compiled is not None:
+            week_points = score_compiled([entry['stats'] for entry in weekly_sparkline], compiled)
+            for entry, points in zip(weekly_sparkline, week_points):
+                entry['fantasy_points'] = points
         
         return {
             "player": {
@@ -364,7 +378,7 @@ async def get_player_summary(
             "weekly_sparkline": weekly_sparkline,
             "fantasy_points": fantasy_points,
             "position_ranking": position_ranking,
-            "total_games": len([w for w in weekly_stats if w.stat_count > 0])
+            "total_games": len(weekly_stats)
         }
         
     except Exception as e:
@@ -376,14 +390,12 @@ async def get_player_context(
     player_id: str,
     season: int = Query(..., description="Upcoming NFL season", ge=2000, le=2030),
     profile_id: Optional[str] = Query(None, description="Scoring profile for projection scoring"),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Return projections, schedule difficulty, injuries, and recent news."""
-    import asyncio
-
     player = (
-        await db.execute(select(Player).where(Player.player_id == player_id))
-    ).scalar_one_or_none()
+        await db.execute(_PLAYER_STMT, {"player_id": player_id})
+    ).one_or_none()
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
 
@@ -405,8 +417,6 @@ async def get_player_context(
     projection_raw = projection_row.raw or {} if projection_row else {}
     opportunity = None
     if projection_row and player.team:
-        from ..services.projection_analytics import projected_team_opportunity
-
         teammate_rows = (
             await db.execute(
                 select(PlayerRanking).where(
@@ -421,26 +431,21 @@ async def get_player_context(
         ).scalars().all()
         opportunity = projected_team_opportunity(teammate_rows).get(player_id)
     profile = None
+    profile_name = None
     profile_points = None
     profile_weekly = {}
     if profile_id and projection_row:
-        from ..models import ScoringProfile, ScoringRule
-        from ..services.projection_analytics import rule_dicts, score_projected_stats
-
-        profile = (
-            await db.execute(select(ScoringProfile).where(ScoringProfile.profile_id == profile_id))
-        ).scalar_one_or_none()
+        profile = await get_profile_rules(db, profile_id)
         if profile:
-            rules = (
-                await db.execute(select(ScoringRule).where(ScoringRule.profile_id == profile_id))
-            ).scalars().all()
-            normalized_rules = rule_dicts(rules)
-            profile_points = score_projected_stats(
-                projection_raw.get("projected_stats"), normalized_rules
+            profile_name, normalized_rules, compiled = profile
+            weeks = projection_raw.get("weekly_projections") or []
+            profile_points, *weekly_points = score_projected_batch(
+                [projection_raw.get("projected_stats"), *(week.get("stats") for week in weeks)],
+                normalized_rules,
+                compiled,
             )
             profile_weekly = {
-                week.get("week"): score_projected_stats(week.get("stats"), normalized_rules)
-                for week in projection_raw.get("weekly_projections") or []
+                week.get("week"): points for week, points in zip(weeks, weekly_points)
             }
 
     injury_rows = (
@@ -462,8 +467,6 @@ async def get_player_context(
     ).scalars().all()
 
     try:
-        from ..services.schedule_strength import get_schedule_strength
-
         schedule_strength = await asyncio.to_thread(
             get_schedule_strength, player.team or "", player.position, season
         )
@@ -483,8 +486,8 @@ async def get_player_context(
             "scoring": projection_row.scoring if projection_row else None,
             "points": projection_raw.get("projected_points"),
             "points_per_game": projection_raw.get("projected_points_per_game"),
-            "profile_id": profile.profile_id if profile else None,
-            "profile_name": profile.name if profile else None,
+            "profile_id": profile_id if profile else None,
+            "profile_name": profile_name,
             "profile_points": profile_points,
             "profile_points_per_game": round(profile_points / 17, 2) if profile_points is not None else None,
             "projection_season": projection_raw.get("projection_season"),
@@ -4,8 +4,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..deps import get_db_session
-from ..models import PlayerInjury, PlayerRanking, ScoringProfile, ScoringRule
+from ..db import get_read_db
+from ..models import PlayerInjury, PlayerRanking
+from ..services.profile_rules import get_profile_rules
 from ..services.projection_analytics import build_projection_analytics
 
 router = APIRouter(prefix="/rankings", tags=["rankings"])
@@ -53,7 +54,7 @@ async def list_snapshots(
     source: str = Query("fantasypros-ecr", description="Ranking source identifier"),
     rank_type: str = Query("preseason", description="preseason or weekly"),
     season: int = Query(None, description="Season year"),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """List available ranking snapshots (dates), most recent first."""
     source = _source_or_400(source)
@@ -76,7 +77,7 @@ async def list_snapshots(
 
 
 @router.get("/sources")
-async def list_ranking_sources(db: AsyncSession = Depends(get_db_session)):
+async def list_ranking_sources(db: AsyncSession = Depends(get_read_db)):
     """Report the latest stored snapshot and canonical-ID coverage per source."""
     latest = (
         select(
@@ -144,7 +145,7 @@ async def get_rankings(
     min_rank: Optional[int] = Query(None, ge=1, description="Minimum overall rank"),
     max_rank: Optional[int] = Query(None, ge=1, description="Maximum overall rank"),
     limit: int = Query(300, ge=1, le=1000),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get rankings from a source snapshot, ordered by overall rank."""
     source = _source_or_400(source)
@@ -215,7 +216,7 @@ async def get_movement(
     rank_type: str = Query("preseason", description="preseason or weekly"),
     position: Optional[str] = Query(None, description="Filter by position"),
     limit: int = Query(50, ge=1, le=500),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get biggest risers/fallers between the two most recent snapshots."""
     source = _source_or_400(source)
@@ -303,17 +304,13 @@ async def get_projection_analytics(
     superflex: int = Query(0, ge=0, le=4),
     k: int = Query(1, ge=0, le=2),
     defense: int = Query(1, ge=0, le=2),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Score cached FantasyPros projections with ESPN fallback, deriving tiers and VORP."""
-    profile = (
-        await db.execute(select(ScoringProfile).where(ScoringProfile.profile_id == profile_id))
-    ).scalar_one_or_none()
+    profile = await get_profile_rules(db, profile_id)
     if not profile:
         raise HTTPException(status_code=404, detail="Scoring profile not found")
-    rules = (
-        await db.execute(select(ScoringRule).where(ScoringRule.profile_id == profile_id))
-    ).scalars().all()
+    profile_name, rules, compiled = profile
     if not rules:
         raise HTTPException(status_code=422, detail="Scoring profile has no rules")
 
@@ -335,7 +332,7 @@ async def get_projection_analytics(
     if not any(snapshot_dates.values()):
         return {
             "season": season, "snapshot_date": None,
-            "profile": {"profile_id": profile.profile_id, "name": profile.name},
+            "profile": {"profile_id": profile_id, "name": profile_name},
             "methodology": {}, "players": [],
         }
 
@@ -369,12 +366,13 @@ async def get_projection_analytics(
         starters={"QB": qb, "RB": rb, "WR": wr, "TE": te, "K": k, "DEF": defense},
         flex_slots=flex,
         superflex_slots=superflex,
+        compiled=compiled,
     )
     return {
         "season": season,
         "snapshot_date": max(date for date in snapshot_dates.values() if date),
         "snapshot_dates": snapshot_dates,
-        "profile": {"profile_id": profile.profile_id, "name": profile.name},
+        "profile": {"profile_id": profile_id, "name": profile_name},
         "methodology": methodology,
         "players": players,
     }
@@ -419,7 +417,7 @@ async def get_player_ranking_history(
     player_id: str,
     source: str = Query("fantasypros-ecr", description="Ranking source identifier"),
     rank_type: str = Query("preseason", description="preseason or weekly"),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get a player's ranking over time across snapshots."""
     source = _source_or_400(source)
@@ -461,7 +459,7 @@ async def get_injuries(
     status: Optional[str] = Query(None, description="Report status filter (e.g. OUT, Q)"),
     position: Optional[str] = Query(None, description="Filter by position"),
     limit: int = Query(200, ge=1, le=1000),
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get injury report entries, most recent season/week first."""
     if not season:
@@ -509,7 +507,7 @@ async def get_injuries(
 @injury_router.get("/players/{player_id}")
 async def get_player_injuries(
     player_id: str,
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get a player's injury history across seasons/weeks."""
     result = await db.execute(
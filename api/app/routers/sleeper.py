@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..deps import get_db_session
+from ..db import get_read_db
 from ..models import Player, PlayerIdentifier
 
 router = APIRouter(prefix="/sleeper", tags=["sleeper"])
@@ -17,7 +17,7 @@ async def run_sleeper_backfill():
 
 
 @router.get("/coverage")
-async def sleeper_coverage(season: int = 2026, db: AsyncSession = Depends(get_db_session)):
+async def sleeper_coverage(season: int = 2026, db: AsyncSession = Depends(get_read_db)):
     """Report Sleeper identifier coverage for the canonical player pool."""
     total = (
         await db.execute(select(func.count(Player.player_id))).scalar_one()
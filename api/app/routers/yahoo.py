@@ -3,21 +3,26 @@ from fastapi.responses import RedirectResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+import asyncio
+import hashlib
 import httpx
 import os
 from urllib.parse import urlencode
 from datetime import datetime, timedelta
 import jwt
 from dotenv import load_dotenv
-from app.deps import get_db
+from app.cache import TTLCache, profile_generations
+from app.db import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.yahoo_xml import (
+    ElementStream,
     parse_leagues,
-    parse_rosters,
     parse_settings,
     parse_stat_categories,
     parse_teams,
     parse_user,
+    roster_stream,
+    team_stream,
 )
 from app.services.player_matching import map_yahoo_rosters
 from app.services.yahoo_scoring import (
@@ -47,6 +52,55 @@ YAHOO_FRONTEND_CALLBACK_URI = os.getenv(
 # JWT secret for internal token management
 JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key")
 
+# One pooled client for every Yahoo call, so the TCP/TLS connection is
+# reused across requests instead of handshaking per call. Created on first
+# use and closed by the app lifespan.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_yahoo_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for Yahoo API and OAuth calls"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _http_client
+
+
+async def close_yahoo_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+# Successful Yahoo reads keyed by (endpoint, sha256 of the access token), so
+# repeated verify/user-info/leagues calls skip the round trip to Yahoo and raw
+# tokens are never kept. Only 200 responses are cached.
+_token_response_cache = TTLCache(maxsize=1024, ttl=300)
+
+
+def _token_key(endpoint: str, access_token: str) -> tuple[str, str]:
+    return endpoint, hashlib.sha256(access_token.encode()).hexdigest()
+
+
+async def _fetch_login_user(access_token: str) -> Optional[str]:
+    """The users;use_login=1 XML for a token (cached), or None if Yahoo rejects it."""
+    key = _token_key("user", access_token)
+    cached = _token_response_cache.get(key)
+    if cached is not None:
+        return cached
+    client = get_yahoo_client()
+    response = await client.get(
+        "https://fantasysports.yahooapis.com/fantasy/v2/users;use_login=1",
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+    if response.status_code != 200:
+        return None
+    _token_response_cache.set(key, response.text)
+    return response.text
+
 class TokenExchangeRequest(BaseModel):
     code: str
 
@@ -149,12 +203,43 @@ async def get_authorize_url(
         "redirect_uri": YAHOO_REDIRECT_URI,
     }
 
-async def get_yahoo_client():
-    """Get HTTP client for Yahoo API calls"""
-    return httpx.AsyncClient(
-        base_url="https://fantasysports.yahooapis.com/fantasy/v2",
-        timeout=30.0
-    )
+
+async def _stream_xml(url: str, access_token: str, parser: ElementStream) -> Optional[List[dict]]:
+    """GET a Yahoo XML resource, parsing it as it downloads; None on a non-200 response."""
+    async with get_yahoo_client().stream(
+        "GET", url, headers={"Authorization": f"Bearer {access_token}"}
+    ) as response:
+        if response.status_code != 200:
+            return None
+        async for chunk in response.aiter_bytes():
+            parser.feed(chunk)
+    return parser.close()
+
+# Upper bound on Yahoo requests one import fans out at once, to stay inside
+# Yahoo's rate limits when leagues grow more per-league calls.
+_yahoo_fanout = asyncio.Semaphore(8)
+
+
+async def _fanout_get(url: str, access_token: str) -> httpx.Response:
+    async with _yahoo_fanout:
+        return await get_yahoo_client().get(url, headers={"Authorization": f"Bearer {access_token}"})
+
+
+async def _league_rosters(league_id: str, access_token: str) -> Optional[List[dict]]:
+    """A league's parsed rosters for a token (cached), or None if Yahoo rejects the request."""
+    key = _token_key(f"rosters:{league_id}", access_token)
+    cached = _token_response_cache.get(key)
+    if cached is not None:
+        return cached
+    async with _yahoo_fanout:
+        rosters = await _stream_xml(
+            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{league_id}/teams/roster",
+            access_token,
+            roster_stream(),
+        )
+    if rosters is not None:
+        _token_response_cache.set(key, rosters)
+    return rosters
 
 
 def _game_key(league_id: str) -> str:
@@ -177,22 +262,22 @@ async def exchange_code_for_tokens(code: str) -> Dict[str, Any]:
         "client_secret": YAHOO_CLIENT_SECRET
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(token_url, data=data)
-        
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to exchange authorization code"
-            )
-        
-        token_data = response.json()
-        return {
-            "access_token": token_data["access_token"],
-            "refresh_token": token_data["refresh_token"],
-            "expires_in": token_data["expires_in"],
-            "token_type": token_data["token_type"]
-        }
+    client = get_yahoo_client()
+    response = await client.post(token_url, data=data)
+    
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Failed to exchange authorization code"
+        )
+    
+    token_data = response.json()
+    return {
+        "access_token": token_data["access_token"],
+        "refresh_token": token_data["refresh_token"],
+        "expires_in": token_data["expires_in"],
+        "token_type": token_data["token_type"]
+    }
 
 async def refresh_access_token(refresh_token: str) -> Dict[str, Any]:
     """Refresh access token using refresh token"""
@@ -210,32 +295,27 @@ async def refresh_access_token(refresh_token: str) -> Dict[str, Any]:
         "client_secret": YAHOO_CLIENT_SECRET
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(token_url, data=data)
-        
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to refresh access token"
-            )
-        
-        token_data = response.json()
-        return {
-            "access_token": token_data["access_token"],
-            "refresh_token": token_data.get("refresh_token", refresh_token),
-            "expires_in": token_data["expires_in"],
-            "token_type": token_data["token_type"]
-        }
+    client = get_yahoo_client()
+    response = await client.post(token_url, data=data)
+    
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Failed to refresh access token"
+        )
+    
+    token_data = response.json()
+    return {
+        "access_token": token_data["access_token"],
+        "refresh_token": token_data.get("refresh_token", refresh_token),
+        "expires_in": token_data["expires_in"],
+        "token_type": token_data["token_type"]
+    }
 
 async def verify_yahoo_token(access_token: str) -> bool:
     """Verify if Yahoo access token is still valid"""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://fantasysports.yahooapis.com/fantasy/v2/users;use_login=1",
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
-            return response.status_code == 200
+        return await _fetch_login_user(access_token) is not None
     except:
         return False
 
@@ -299,20 +379,16 @@ async def get_user_info(
     access_token = credentials.credentials
     
     try:
-        async with httpx.AsyncClient() as client:
-            # Get user info
-            user_response = await client.get(
-                "https://fantasysports.yahooapis.com/fantasy/v2/users;use_login=1",
-                headers={"Authorization": f"Bearer {access_token}"}
+        # Get user info (shared with token verification)
+        user_xml = await _fetch_login_user(access_token)
+        
+        if user_xml is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Failed to fetch user info"
             )
-            
-            if user_response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Failed to fetch user info"
-                )
-            
-            return parse_user(user_response.text)
+        
+        return parse_user(user_xml)
             
     except HTTPException:
         raise
@@ -331,29 +407,36 @@ async def get_leagues(
     access_token = credentials.credentials
     
     try:
-        async with httpx.AsyncClient() as client:
-            # Get user's leagues
-            leagues_response = await client.get(
-                "https://fantasysports.yahooapis.com/fantasy/v2/users;use_login=1/games;game_keys=nfl/leagues",
-                headers={"Authorization": f"Bearer {access_token}"}
+        cache_key = _token_key("leagues", access_token)
+        cached = _token_response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        client = get_yahoo_client()
+        # Get user's leagues
+        leagues_response = await client.get(
+            "https://fantasysports.yahooapis.com/fantasy/v2/users;use_login=1/games;game_keys=nfl/leagues",
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        
+        if leagues_response.status_code != 200:
+            raise HTTPException(
+                status_code=(
+                    status.HTTP_403_FORBIDDEN
+                    if leagues_response.status_code in {401, 403}
+                    else status.HTTP_502_BAD_GATEWAY
+                ),
+                detail=(
+                    FANTASY_PERMISSION_DETAIL
+                    if leagues_response.status_code in {401, 403}
+                    else "Yahoo returned an error while fetching leagues"
+                ),
             )
-            
-            if leagues_response.status_code != 200:
-                raise HTTPException(
-                    status_code=(
-                        status.HTTP_403_FORBIDDEN
-                        if leagues_response.status_code in {401, 403}
-                        else status.HTTP_502_BAD_GATEWAY
-                    ),
-                    detail=(
-                        FANTASY_PERMISSION_DETAIL
-                        if leagues_response.status_code in {401, 403}
-                        else "Yahoo returned an error while fetching leagues"
-                    ),
-                )
-            
-            return {"leagues": parse_leagues(leagues_response.text)}
-            
+        
+        leagues = {"leagues": parse_leagues(leagues_response.text)}
+        _token_response_cache.set(cache_key, leagues)
+        return leagues
+        
     except HTTPException:
         raise
     except Exception as e:
@@ -372,21 +455,21 @@ async def get_league_teams(
     access_token = credentials.credentials
     
     try:
-        async with httpx.AsyncClient() as client:
-            # Get league teams
-            teams_response = await client.get(
-                f"https://fantasysports.yahooapis.com/fantasy/v2/league/{league_id}/teams",
-                headers={"Authorization": f"Bearer {access_token}"}
+        # Get league teams
+        teams = await _stream_xml(
+            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{league_id}/teams",
+            access_token,
+            team_stream(),
+        )
+        
+        if teams is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Failed to fetch teams"
             )
-            
-            if teams_response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Failed to fetch teams"
-                )
-            
-            return {"teams": parse_teams(teams_response.text)}
-            
+        
+        return {"teams": teams}
+        
     except HTTPException:
         raise
     except Exception as e:
@@ -403,15 +486,15 @@ async def get_league_settings(
 ):
     """Get scoring and roster settings for a Yahoo league."""
     del db
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{league_id}/settings",
-            headers={"Authorization": f"Bearer {credentials.credentials}"},
-        )
-        categories_response = await client.get(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/game/{_game_key(league_id)}/stat_categories",
-            headers={"Authorization": f"Bearer {credentials.credentials}"},
-        )
+    client = get_yahoo_client()
+    response = await client.get(
+        f"https://fantasysports.yahooapis.com/fantasy/v2/league/{league_id}/settings",
+        headers={"Authorization": f"Bearer {credentials.credentials}"},
+    )
+    categories_response = await client.get(
+        f"https://fantasysports.yahooapis.com/fantasy/v2/game/{_game_key(league_id)}/stat_categories",
+        headers={"Authorization": f"Bearer {credentials.credentials}"},
+    )
     if response.status_code != 200:
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Failed to fetch league settings")
     settings = parse_settings(response.text)
@@ -432,21 +515,17 @@ async def get_league_rosters(
     access_token = credentials.credentials
     
     try:
-        async with httpx.AsyncClient() as client:
-            # Get league rosters
-            rosters_response = await client.get(
-                f"https://fantasysports.yahooapis.com/fantasy/v2/league/{league_id}/teams/roster",
-                headers={"Authorization": f"Bearer {access_token}"}
+        # Get league rosters, parsed team by team as the response arrives
+        rosters = await _league_rosters(league_id, access_token)
+        
+        if rosters is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Failed to fetch rosters"
             )
-            
-            if rosters_response.status_code != 200:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Failed to fetch rosters"
-                )
-            
-            return {"rosters": parse_rosters(rosters_response.text)}
-            
+        
+        return {"rosters": rosters}
+        
     except HTTPException:
         raise
     except Exception as e:
@@ -473,34 +552,20 @@ async def import_league(
                 detail="Invalid or expired token"
             )
         
-        headers = {"Authorization": f"Bearer {access_token}"}
-        async with httpx.AsyncClient() as client:
-            settings_response = await client.get(
-                f"https://fantasysports.yahooapis.com/fantasy/v2/league/{request.league_id}/settings",
-                headers=headers,
-            )
-            teams_response = await client.get(
-                f"https://fantasysports.yahooapis.com/fantasy/v2/league/{request.league_id}/teams",
-                headers=headers,
-            )
-            categories_response = await client.get(
-                f"https://fantasysports.yahooapis.com/fantasy/v2/game/{_game_key(request.league_id)}/stat_categories",
-                headers=headers,
-            )
-            rosters_response = None
-            if request.include_rosters:
-                rosters_response = await client.get(
-                    f"https://fantasysports.yahooapis.com/fantasy/v2/league/{request.league_id}/teams/roster",
-                    headers=headers,
-                )
-        if settings_response.status_code != 200 or teams_response.status_code != 200 or (
-            rosters_response is not None and rosters_response.status_code != 200
-        ):
+        # Settings, teams, stat categories and rosters are independent reads,
+        # so they go out together and the import waits one round trip, not four.
+        base_url = "https://fantasysports.yahooapis.com/fantasy/v2"
+        settings_response, teams_response, categories_response, rosters = await asyncio.gather(
+            _fanout_get(f"{base_url}/league/{request.league_id}/settings", access_token),
+            _fanout_get(f"{base_url}/league/{request.league_id}/teams", access_token),
+            _fanout_get(f"{base_url}/game/{_game_key(request.league_id)}/stat_categories", access_token),
+            _league_rosters(request.league_id, access_token) if request.include_rosters else asyncio.sleep(0, []),
+        )
+        if settings_response.status_code != 200 or teams_response.status_code != 200 or rosters is None:
             raise HTTPException(status_code=502, detail="Yahoo returned an error while importing league data")
 
         settings = parse_settings(settings_response.text)
         teams = parse_teams(teams_response.text)
-        rosters = parse_rosters(rosters_response.text) if rosters_response is not None else []
         categories = (
             parse_stat_categories(categories_response.text)
             if categories_response.status_code == 200
@@ -512,6 +577,8 @@ async def import_league(
             db, rosters, settings.get("season") or datetime.utcnow().year
         )
         await db.commit()
+        if scoring_profile is not None:
+            profile_generations.bump(scoring_profile["profile_id"])
         import_result = {
             "league_id": request.league_id,
             "imported_at": datetime.utcnow().isoformat(),
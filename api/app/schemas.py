@@ -1,9 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
 
-# Base schemas
+# Base schemas. Schemas read from ORM rows are response-only, so they are
+# frozen as well.
 class PlayerBase(BaseModel):
     full_name: str
     position: str
@@ -24,8 +25,7 @@ class Player(PlayerBase):
     status: Optional[str] = None
     headshot: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class PlayerWeekStatBase(BaseModel):
@@ -41,8 +41,7 @@ class PlayerWeekStatCreate(PlayerWeekStatBase):
 
 
 class PlayerWeekStat(PlayerWeekStatBase):
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ScoringRuleBase(BaseModel):
@@ -63,8 +62,7 @@ class ScoringRule(ScoringRuleBase):
     rule_id: str
     profile_id: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ScoringProfileBase(BaseModel):
@@ -82,8 +80,7 @@ class ScoringProfile(ScoringProfileBase):
     created_at: int
     rules: List[ScoringRule]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class NewsItemBase(BaseModel):
@@ -104,8 +101,7 @@ class NewsItem(NewsItemBase):
     dedupe_hash: str
     created_at: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # API Response schemas
@@ -115,6 +111,17 @@ class PointsResponse(BaseModel):
     profile_name: str
 
 
+class PlayerWeekKey(BaseModel):
+    player_id: str
+    season: int = Field(..., ge=2000, le=2030)
+    week: int = Field(..., ge=1, le=18)
+
+
+class WeeklyPointsBatchRequest(BaseModel):
+    profile_id: str
+    entries: List[PlayerWeekKey] = Field(..., min_length=1, max_length=1000)
+
+
 class PlayerStatsResponse(BaseModel):
     player: Player
     stats: List[PlayerWeekStat]
@@ -1,5 +1,10 @@
 import math
-from typing import Dict, List, Any
+from dataclasses import dataclass
+from io import BytesIO
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Sequence, Tuple
+import numpy as np
+from sqlalchemy import Integer, case, cast, func
 from .models import ScoringRule
 
 
@@ -18,32 +23,26 @@ def compute_points(stats: Dict[str, float], rules: List[ScoringRule]) -> float:
     
     for rule in rules:
         # Get stat value, defaulting to 0 if not present
-        val = float(stats.get(rule.stat_key, 0) or 0)
+        value = stats.get(rule.stat_key)
+        value = float(value) if value else 0.0
         
         # Calculate units (e.g., yards per unit)
-        if rule.per is not None and rule.per > 0:
-            units = math.floor(val / rule.per)
-        else:
-            units = val
+        per = rule.per
+        units = math.floor(value / per) if per is not None and per > 0 else value
         
-        # Calculate base points
-        base = units * float(rule.multiplier or 0)
-        
-        # Calculate bonus points
-        bonus = 0.0
-        if rule.bonus_min is not None:
-            if val >= rule.bonus_min:
-                if rule.bonus_max is None or val <= rule.bonus_max:
-                    bonus = float(rule.bonus_points or 0)
-        
-        # Calculate subtotal
-        subtotal = base + bonus
+        # Base points plus the bonus when the value falls inside the window;
+        # a missing upper bound reads as +inf
+        bonus_min, bonus_max = rule.bonus_min, rule.bonus_max
+        in_window = bonus_min is not None and bonus_min <= value <= (
+            math.inf if bonus_max is None else bonus_max
+        )
+        subtotal = units * float(rule.multiplier or 0) + (
+            float(rule.bonus_points or 0) if in_window else 0.0
+        )
         
         # Apply cap if specified
-        if rule.cap is not None:
-            subtotal = min(subtotal, rule.cap)
-        
-        total += subtotal
+        cap = rule.cap
+        total += subtotal if cap is None or subtotal < cap else cap
     
     return round(total, 2)
 
@@ -62,36 +61,298 @@ def compute_points_from_dict(stats: Dict[str, float], rules: List[Dict[str, Any]
     total = 0.0
     
     for rule in rules:
-        val = float(stats.get(rule["stat_key"], 0) or 0)
+        value = stats.get(rule["stat_key"])
+        value = float(value) if value else 0.0
         
         # Calculate units
-        if rule.get("per") and rule["per"] > 0:
-            units = math.floor(val / rule["per"])
-        else:
-            units = val
+        per = rule.get("per")
+        units = math.floor(value / per) if per and per > 0 else value
         
-        # Calculate base points
-        base = units * float(rule.get("multiplier", 0))
+        # Base points plus the bonus when the value falls inside the window;
+        # a missing upper bound reads as +inf
+        bonus_min, bonus_max = rule.get("bonus_min"), rule.get("bonus_max")
+        in_window = bonus_min is not None and bonus_min <= value <= (
+            math.inf if bonus_max is None else bonus_max
+        )
+        subtotal = units * float(rule.get("multiplier") or 0) + (
+            float(rule.get("bonus_points") or 0) if in_window else 0.0
+        )
         
-        # Calculate bonus points
-        bonus = 0.0
-        if rule.get("bonus_min") is not None:
-            if val >= rule["bonus_min"]:
-                if rule.get("bonus_max") is None or val <= rule["bonus_max"]:
-                    bonus = float(rule.get("bonus_points", 0))
+        # Apply cap if specified
+        cap = rule.get("cap")
+        total += subtotal if cap is None or subtotal < cap else cap
+    
+    return round(total, 2)
+
+
+# Numeric rule fields packed into a compiled profile, in record order.
+_COMPILED_FIELDS = ("multiplier", "per", "bonus_min", "bonus_max", "bonus_points", "cap")
+
+
+def compile_rules(rules: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """
+    Pack rule dictionaries into a structured array with one record per rule.
+    
+    Missing numeric fields become NaN so the vectorized scorer can tell
+    "no bonus window" or "no cap" apart from a zero.
+    """
+    width = max((len(rule["stat_key"]) for rule in rules), default=1)
+    dtype = [("stat_key", f"U{width}")] + [(field, np.float64) for field in _COMPILED_FIELDS]
+    return np.array(
+        [
+            (
+                rule["stat_key"],
+                *(np.nan if rule.get(field) is None else float(rule[field]) for field in _COMPILED_FIELDS),
+            )
+            for rule in rules
+        ],
+        dtype=dtype,
+    )
+
+
+def compile_profile(rules: Sequence[Dict[str, Any]]) -> bytes:
+    """Serialize a profile's rules for ``ScoringProfile.compiled`` (``.npy`` format)."""
+    buffer = BytesIO()
+    np.save(buffer, compile_rules(rules), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def load_compiled_profile(blob: bytes) -> np.ndarray:
+    """Inverse of compile_profile."""
+    return np.load(BytesIO(blob), allow_pickle=False)
+
+
+# Batches up to this many stat lines are scored with a plain loop; below it
+# the NumPy setup costs more than the arithmetic it vectorizes.
+_SCALAR_MAX_LINES = 16
+
+@dataclass(frozen=True, slots=True)
+class RuleGroup:
+    """
+    Rules as one contiguous float64 array per field (structure of arrays).
+    
+    Missing values are sentinels rather than NaN: per 0 means "no per", and
+    a missing bonus bound or cap is +inf, so a missing lower bound never
+    passes, a missing upper bound always does and a missing cap never clips.
+    scalar_rules holds the same rules as tuples for the small-batch loop.
+    """
+    # Column of the (lines, distinct keys) value matrix each rule reads
+    columns: np.ndarray
+    multiplier: np.ndarray
+    per: np.ndarray
+    bonus_min: np.ndarray
+    bonus_max: np.ndarray
+    bonus_points: np.ndarray
+    cap: np.ndarray
+    scalar_rules: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledProfile:
+    """
+    A compiled profile ready for score_compiled.
+    
+    Most rules have no bonus window and no cap, so their points are just
+    units x multiplier: those form the ``simple`` group, scored with one
+    matrix-vector product, and only the ``complex`` rest pay for the bonus
+    and cap arithmetic.
+    """
+    stat_keys: Tuple[str, ...]
+    # Distinct stat key -> column of the value matrix
+    column_of: Dict[str, int]
+    simple: RuleGroup
+    complex: RuleGroup
+    
+    @classmethod
+    def from_compiled(cls, compiled: np.ndarray) -> "CompiledProfile":
+        def field(name: str, missing: float) -> np.ndarray:
+            values = np.asarray(compiled[name], dtype=np.float64)
+            return np.where(np.isnan(values), missing, values)
         
-        # Calculate subtotal
-        subtotal = base + bonus
+        stat_keys = tuple(compiled["stat_key"].tolist())
+        distinct_keys, rule_columns = np.unique(compiled["stat_key"], return_inverse=True)
+        per = field("per", 0.0)
+        fields = {
+            "columns": rule_columns.reshape(-1),
+            "multiplier": field("multiplier", 0.0),
+            "per": np.where(per > 0, per, 0.0),
+            "bonus_min": field("bonus_min", math.inf),
+            "bonus_max": field("bonus_max", math.inf),
+            "bonus_points": field("bonus_points", 0.0),
+            "cap": field("cap", math.inf),
+        }
+        is_simple = np.isinf(fields["bonus_min"]) & np.isinf(fields["cap"])
         
-        # Apply cap if specified
-        if rule.get("cap") is not None:
-            subtotal = min(subtotal, rule["cap"])
+        def group(rules: np.ndarray) -> RuleGroup:
+            arrays = {name: np.ascontiguousarray(values[rules]) for name, values in fields.items()}
+            return RuleGroup(
+                **arrays,
+                scalar_rules=tuple(zip(
+                    [stat_keys[rule] for rule in rules.tolist()],
+                    *(arrays[name].tolist() for name in _COMPILED_FIELDS),
+                )),
+            )
         
-        total += subtotal
+        return cls(
+            stat_keys=stat_keys,
+            column_of={key: column for column, key in enumerate(distinct_keys.tolist())},
+            simple=group(np.flatnonzero(is_simple)),
+            complex=group(np.flatnonzero(~is_simple)),
+        )
+
+
+# CompiledProfiles keyed by id() of the compiled array. Each entry keeps its
+# array alive, so the id cannot be reused while it is cached.
+_kernels: Dict[int, Tuple[np.ndarray, CompiledProfile]] = {}
+_KERNELS_MAX = 256
+
+
+def _kernel(compiled: np.ndarray) -> CompiledProfile:
+    """The CompiledProfile for a compiled rule array, derived once per array."""
+    entry = _kernels.get(id(compiled))
+    if entry is not None and entry[0] is compiled:
+        return entry[1]
     
+    kernel = CompiledProfile.from_compiled(compiled)
+    if len(_kernels) >= _KERNELS_MAX:
+        _kernels.clear()
+    _kernels[id(compiled)] = (compiled, kernel)
+    return kernel
+
+
+def _score_line(stats: Dict[str, float], kernel: CompiledProfile) -> float:
+    total = 0.0
+    for key, multiplier, per, _, _, _, _ in kernel.simple.scalar_rules:
+        value = stats.get(key)
+        if value:
+            value = float(value)
+            total += (math.floor(value / per) if per else value) * multiplier
+    for key, multiplier, per, bonus_min, bonus_max, bonus_points, cap in kernel.complex.scalar_rules:
+        value = stats.get(key)
+        value = float(value) if value else 0.0
+        units = math.floor(value / per) if per else value
+        subtotal = units * multiplier + (bonus_points if bonus_min <= value <= bonus_max else 0.0)
+        total += subtotal if subtotal < cap else cap
     return round(total, 2)
 
 
+def _units(values: np.ndarray, per: np.ndarray) -> np.ndarray:
+    has_per = per > 0
+    return np.where(has_per, np.floor(values / np.where(has_per, per, 1.0)), values)
+
+
+def score_compiled(stat_rows: Sequence[Dict[str, float]], compiled: np.ndarray) -> List[float]:
+    """
+    Score many stat lines against a compiled profile with vectorized NumPy operations.
+    
+    Small batches (a single /points line, one player's weeks) take a scalar
+    loop over the same pre-derived rules instead.
+    
+    Args:
+        stat_rows: One stat_key -> stat_value dictionary per player-week
+        compiled: Structured rule array from compile_rules/load_compiled_profile
+        
+    Returns:
+        Points per stat line, matching compute_points_from_dict
+    """
+    if not stat_rows:
+        return []
+    if not len(compiled):
+        return [0.0] * len(stat_rows)
+    
+    kernel = _kernel(compiled)
+    if len(stat_rows) <= _SCALAR_MAX_LINES:
+        return [_score_line(stats, kernel) for stats in stat_rows]
+    
+    # (N stat lines, distinct keys) matrix of stat values. Stat lines are
+    # sparse, so fill it from each line's own items; each rule group then
+    # gathers the columns its rules read.
+    column_of = kernel.column_of
+    by_key = np.zeros((len(stat_rows), len(column_of)), dtype=np.float64)
+    for row, stats in enumerate(stat_rows):
+        for key, value in stats.items():
+            column = column_of.get(key)
+            if column is not None and value:
+                by_key[row, column] = value
+    
+    simple = kernel.simple
+    totals = _units(by_key[:, simple.columns], simple.per) @ simple.multiplier
+    complex_rules = kernel.complex
+    if len(complex_rules.columns):
+        values = by_key[:, complex_rules.columns]
+        in_bonus = (values >= complex_rules.bonus_min) & (values <= complex_rules.bonus_max)
+        subtotal = (
+            _units(values, complex_rules.per) * complex_rules.multiplier
+            + np.where(in_bonus, complex_rules.bonus_points, 0.0)
+        )
+        totals += np.minimum(subtotal, complex_rules.cap).sum(axis=1)
+    
+    return [round(float(total), 2) for total in totals]
+
+
+def compute_points_batch(
+    stat_rows: Sequence[Dict[str, float]], rules: Sequence[Dict[str, Any]]
+) -> List[float]:
+    """Score many stat lines against rule dictionaries (see score_compiled)."""
+    return score_compiled(stat_rows, compile_rules(rules))
+
+
+def _sql_floor(value):
+    """floor() for SQLite builds compiled without the math extension."""
+    truncated = cast(value, Integer)
+    return truncated - case((value < truncated, 1), else_=0)
+
+
+def sql_rule_points(stat_value, rule=ScoringRule):
+    """
+    SQL expression for one rule's points, mirroring ``compute_points``.
+    
+    Args:
+        stat_value: Column or expression holding the stat value
+        rule: Selectable exposing the ScoringRule columns
+        
+    Returns:
+        Expression evaluating to base + bonus points, capped when cap is set
+    """
+    units = case(
+        (rule.per > 0, _sql_floor(stat_value / rule.per)),
+        else_=stat_value,
+    )
+    bonus = case(
+        (
+            (rule.bonus_min.is_not(None))
+            & (stat_value >= rule.bonus_min)
+            & ((rule.bonus_max.is_(None)) | (stat_value <= rule.bonus_max)),
+            func.coalesce(rule.bonus_points, 0.0),
+        ),
+        else_=0.0,
+    )
+    subtotal = units * func.coalesce(rule.multiplier, 0.0) + bonus
+    return case(
+        ((rule.cap.is_not(None)) & (subtotal > rule.cap), rule.cap),
+        else_=subtotal,
+    )
+
+
+def scores_missing_stats(rules: List[Dict[str, Any]]) -> bool:
+    """
+    Whether a rule can award points for a stat with no recorded value.
+    
+    SQL scoring only visits rules joined to existing stat rows, so profiles
+    with a bonus window containing zero or a negative cap are scored in Python.
+    """
+    for rule in rules:
+        if rule.get("cap") is not None and rule["cap"] < 0:
+            return True
+        if (
+            rule.get("bonus_min") is not None
+            and rule["bonus_min"] <= 0
+            and (rule.get("bonus_max") is None or rule["bonus_max"] >= 0)
+        ):
+            return True
+    return False
+
+
 def validate_scoring_rule(rule: Dict[str, Any]) -> None:
     """
     Validate a scoring rule configuration.
@@ -150,45 +411,54 @@ def validate_scoring_rule(rule: Dict[str, Any]) -> None:
             raise ValueError("cap must be a valid number")
 
 
-def get_default_scoring_profiles() -> Dict[str, List[Dict[str, Any]]]:
+_DEFAULT_PROFILE_RULES = {
+    "Standard": [
+        {"stat_key": "passing_yards", "multiplier": 0.04, "per": 1},
+        {"stat_key": "passing_touchdowns", "multiplier": 4.0, "per": 1},
+        {"stat_key": "interceptions", "multiplier": -2.0, "per": 1},
+        {"stat_key": "rushing_yards", "multiplier": 0.1, "per": 1},
+        {"stat_key": "rushing_touchdowns", "multiplier": 6.0, "per": 1},
+        {"stat_key": "receiving_yards", "multiplier": 0.1, "per": 1},
+        {"stat_key": "receiving_touchdowns", "multiplier": 6.0, "per": 1},
+        {"stat_key": "receptions", "multiplier": 0.0, "per": 1},
+        {"stat_key": "fumbles_lost", "multiplier": -2.0, "per": 1},
+    ],
+    "PPR": [
+        {"stat_key": "passing_yards", "multiplier": 0.04, "per": 1},
+        {"stat_key": "passing_touchdowns", "multiplier": 4.0, "per": 1},
+        {"stat_key": "interceptions", "multiplier": -2.0, "per": 1},
+        {"stat_key": "rushing_yards", "multiplier": 0.1, "per": 1},
+        {"stat_key": "rushing_touchdowns", "multiplier": 6.0, "per": 1},
+        {"stat_key": "receiving_yards", "multiplier": 0.1, "per": 1},
+        {"stat_key": "receiving_touchdowns", "multiplier": 6.0, "per": 1},
+        {"stat_key": "receptions", "multiplier": 1.0, "per": 1},
+        {"stat_key": "fumbles_lost", "multiplier": -2.0, "per": 1},
+    ],
+    "Half PPR": [
+        {"stat_key": "passing_yards", "multiplier": 0.04, "per": 1},
+        {"stat_key": "passing_touchdowns", "multiplier": 4.0, "per": 1},
+        {"stat_key": "interceptions", "multiplier": -2.0, "per": 1},
+        {"stat_key": "rushing_yards", "multiplier": 0.1, "per": 1},
+        {"stat_key": "rushing_touchdowns", "multiplier": 6.0, "per": 1},
+        {"stat_key": "receiving_yards", "multiplier": 0.1, "per": 1},
+        {"stat_key": "receiving_touchdowns", "multiplier": 6.0, "per": 1},
+        {"stat_key": "receptions", "multiplier": 0.5, "per": 1},
+        {"stat_key": "fumbles_lost", "multiplier": -2.0, "per": 1},
+    ]
+}
+# Built once at import. Every caller shares the same objects, so they are
+# handed out as read-only views.
+_DEFAULT_PROFILES: Mapping[str, Tuple[Mapping[str, Any], ...]] = MappingProxyType({
+    name: tuple(MappingProxyType(rule) for rule in rules)
+    for name, rules in _DEFAULT_PROFILE_RULES.items()
+})
+
+
+def get_default_scoring_profiles() -> Mapping[str, Tuple[Mapping[str, Any], ...]]:
     """
     Get default scoring profiles for common fantasy football formats.
     
     Returns:
-        Dictionary of profile names to rule lists
-    """
-    return {
-        "Standard": [
-            {"stat_key": "passing_yards", "multiplier": 0.04, "per": 1},
-            {"stat_key": "passing_touchdowns", "multiplier": 4.0, "per": 1},
-            {"stat_key": "interceptions", "multiplier": -2.0, "per": 1},
-            {"stat_key": "rushing_yards", "multiplier": 0.1, "per": 1},
-            {"stat_key": "rushing_touchdowns", "multiplier": 6.0, "per": 1},
-            {"stat_key": "receiving_yards", "multiplier": 0.1, "per": 1},
-            {"stat_key": "receiving_touchdowns", "multiplier": 6.0, "per": 1},
-            {"stat_key": "receptions", "multiplier": 0.0, "per": 1},
-            {"stat_key": "fumbles_lost", "multiplier": -2.0, "per": 1},
-        ],
-        "PPR": [
-            {"stat_key": "passing_yards", "multiplier": 0.04, "per": 1},
-            {"stat_key": "passing_touchdowns", "multiplier": 4.0, "per": 1},
-            {"stat_key": "interceptions", "multiplier": -2.0, "per": 1},
-            {"stat_key": "rushing_yards", "multiplier": 0.1, "per": 1},
-            {"stat_key": "rushing_touchdowns", "multiplier": 6.0, "per": 1},
-            {"stat_key": "receiving_yards", "multiplier": 0.1, "per": 1},
-            {"stat_key": "receiving_touchdowns", "multiplier": 6.0, "per": 1},
-            {"stat_key": "receptions", "multiplier": 1.0, "per": 1},
-            {"stat_key": "fumbles_lost", "multiplier": -2.0, "per": 1},
-        ],
-        "Half PPR": [
-            {"stat_key": "passing_yards", "multiplier": 0.04, "per": 1},
-            {"stat_key": "passing_touchdowns", "multiplier": 4.0, "per": 1},
-            {"stat_key": "interceptions", "multiplier": -2.0, "per": 1},
-            {"stat_key": "rushing_yards", "multiplier": 0.1, "per": 1},
-            {"stat_key": "rushing_touchdowns", "multiplier": 6.0, "per": 1},
-            {"stat_key": "receiving_yards", "multiplier": 0.1, "per": 1},
-            {"stat_key": "receiving_touchdowns", "multiplier": 6.0, "per": 1},
-            {"stat_key": "receptions", "multiplier": 0.5, "per": 1},
-            {"stat_key": "fumbles_lost", "multiplier": -2.0, "per": 1},
-        ]
-    }
+        Read-only mapping of profile names to rule mappings
+    """
+    return _DEFAULT_PROFILES
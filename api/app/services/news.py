@@ -17,10 +17,16 @@ import urllib.request
 from dataclasses import dataclass
 from typing import Any
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import SessionLocal
+from ..db import (
+    NEWS_FTS_MAINTAINED,
+    NEWS_FTS_TRIGGERS,
+    SessionLocal,
+    create_news_fts_triggers,
+    dialect_insert,
+)
 from ..models import NewsItem, Player
 from .player_matching import normalize_name
 
@@ -35,6 +41,10 @@ _KEYWORD_BOOST = 2.0
 _MENTION_SCORE = 1.0
 # Extra boost when the player's name appears in the headline.
 _HEADLINE_BOOST = 3.0
+# Rebuild the news FTS index instead of indexing row by row once a batch is at
+# least 1/_FTS_REBUILD_SHARE of the table. journal_mode is left alone: leaving
+# WAL needs exclusive access, which the read pool never gives up.
+_FTS_REBUILD_SHARE = 4
 
 _TAG_RE = re.compile(r"<[^>]+>")
 _WS_RE = re.compile(r"\s+")
@@ -192,6 +202,55 @@ def _build_player_index(players: list[Player]) -> dict[str, list[tuple[str, str]
     return index
 
 
+async def bulk_upsert_news(
+    session: AsyncSession,
+    records: list[dict],
+    delete_existing: bool = False,
+) -> None:
+    """
+    Upsert news rows with one executemany, keeping the FTS index in sync.
+
+    A rebuild re-tokenizes the whole table, so it is only worth it when the
+    batch replaces the table or is a sizeable share of it. Then the per-row
+    FTS triggers are dropped for the write, the index is rebuilt once and the
+    triggers are recreated, all inside the caller's transaction. Smaller
+    batches leave the triggers in place so only the new rows are indexed
+    (and written to the WAL). The caller commits.
+    """
+    has_fts = NEWS_FTS_MAINTAINED and (
+        await session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_items_fts'")
+        )
+    ).first() is not None
+    rebuild = has_fts and (
+        delete_existing
+        or len(records) * _FTS_REBUILD_SHARE
+        >= (await session.execute(select(func.count()).select_from(NewsItem))).scalar_one()
+    )
+    if rebuild:
+        for name in NEWS_FTS_TRIGGERS:
+            await session.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+
+    if delete_existing:
+        await session.execute(delete(NewsItem))
+    if records:
+        stmt = dialect_insert(NewsItem.__table__)
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[NewsItem.news_id],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in ("published_at", "source", "url", "title", "summary", "story", "players")
+                },
+            ),
+            records,
+        )
+
+    if rebuild:
+        await session.execute(text("INSERT INTO news_items_fts(news_items_fts) VALUES('rebuild')"))
+        await create_news_fts_triggers(session)
+
+
 async def ingest_news(
     limit: int = 50,
     provider: ESPNNewsProvider | None = None,
@@ -220,9 +279,7 @@ async def ingest_news(
         existing_urls = set(
             (await session.execute(select(NewsItem.url))).scalars().all()
         )
-        if delete_existing:
-            await session.execute(delete(NewsItem))
-
+        records = []
         stored = 0
         skipped_duplicate = 0
         total_mentions = 0
@@ -236,22 +293,23 @@ async def ingest_news(
                 continue
             rec["players"] = _score_players(rec, player_index)
             total_mentions += len(rec["players"])
-            session.add(
-                NewsItem(
-                    news_id=rec["news_id"],
-                    published_at=rec["published_at"],
-                    source=rec["source"],
-                    url=rec["url"],
-                    title=rec["title"],
-                    summary=rec["summary"],
-                    story=rec["story"],
-                    players=rec["players"],
-                    dedupe_hash=rec["news_id"],
-                    created_at=rec["created_at"],
-                )
+            records.append(
+                {
+                    "news_id": rec["news_id"],
+                    "published_at": rec["published_at"],
+                    "source": rec["source"],
+                    "url": rec["url"],
+                    "title": rec["title"],
+                    "summary": rec["summary"],
+                    "story": rec["story"],
+                    "players": rec["players"],
+                    "dedupe_hash": rec["news_id"],
+                    "created_at": rec["created_at"],
+                }
             )
             stored += 1
 
+        await bulk_upsert_news(session, records, delete_existing=delete_existing)
         await session.commit()
         return stored, skipped_duplicate, total_mentions
 
@@ -6,10 +6,16 @@ the same records without network access or Polars leaking into the application.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import hashlib
+import os
+import time
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Protocol
 
+from ..http_cache import current_season
+
 PlayerRecord = dict[str, Any]
 WeeklyStatRecord = dict[str, Any]
 RankingRecord = dict[str, Any]
@@ -19,7 +25,9 @@ InjuryRecord = dict[str, Any]
 class NFLDataProvider(Protocol):
     def load_players(self, season: int | None = None) -> list[PlayerRecord]: ...
 
-    def load_weekly_stats(self, seasons: Sequence[int]) -> list[WeeklyStatRecord]: ...
+    def load_weekly_stats(
+        self, seasons: Sequence[int], columns: Sequence[str] | None = None
+    ) -> list[WeeklyStatRecord]: ...
 
     def load_rankings(
         self, rank_type: str = "preseason"
@@ -30,12 +38,57 @@ class NFLDataProvider(Protocol):
     ) -> list[InjuryRecord]: ...
 
 
+# Downloaded frames are kept as zstd Parquet so repeat seeding runs skip the
+# network. An empty NFLVERSE_CACHE_DIR turns the cache off.
+_CACHE_DIR = os.getenv("NFLVERSE_CACHE_DIR", ".cache/nflverse")
+_CACHE_TTL = float(os.getenv("NFLVERSE_CACHE_TTL", 86400))
+
+
 @dataclass(slots=True)
 class NFLReadPyProvider:
     """nflverse provider backed by the maintained nflreadpy package."""
 
-    def _records(self, frame: Any) -> list[dict[str, Any]]:
-        return frame.to_dicts()
+    cache_dir: Path | None = Path(_CACHE_DIR) if _CACHE_DIR else None
+    cache_ttl: float = _CACHE_TTL
+
+    def _records(self, frame: Any, columns: Sequence[str] | None = None) -> list[dict[str, Any]]:
+        import polars.selectors as cs
+
+        # Drop columns the caller will not read before building per-row dicts,
+        # which cost in proportion to the cells they hold.
+        if columns is not None:
+            available = set(frame.columns)
+            frame = frame.select([column for column in columns if column in available])
+        # Null out NaN floats column-wise so record consumers only test for None
+        # instead of re-checking every cell.
+        return frame.with_columns(cs.float().fill_nan(None)).to_dicts()
+
+    def _cached_frame(
+        self, name: str, args: tuple, load: Callable[[], Any], ttl: float | None
+    ) -> Any:
+        """Read ``load()``'s frame from the Parquet cache, downloading it when missing or stale.
+
+        ``ttl`` None keeps the file for good (finished seasons never change).
+        """
+        if self.cache_dir is None:
+            return load()
+        import polars as pl
+
+        digest = hashlib.sha1(repr(args).encode()).hexdigest()[:16]
+        path = self.cache_dir / f"{name}_{digest}.parquet"
+        try:
+            if ttl is None or time.time() - path.stat().st_mtime < ttl:
+                return pl.read_parquet(path)
+        except OSError:
+            pass
+
+        frame = load()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write beside the target and rename, so readers never see half a file.
+        partial = path.with_suffix(".partial")
+        frame.write_parquet(partial, compression="zstd")
+        partial.replace(path)
+        return frame
 
     def load_players(self, season: int | None = None) -> list[PlayerRecord]:
         import nflreadpy as nfl
@@ -43,12 +96,26 @@ class NFLReadPyProvider:
         # Player identities are mostly immutable; season is accepted to keep the
         # provider interchangeable with season-specific CSV sources.
         del season
-        return self._records(nfl.load_players())
+        return self._records(
+            self._cached_frame("players", (), nfl.load_players, self.cache_ttl)
+        )
 
-    def load_weekly_stats(self, seasons: Sequence[int]) -> list[WeeklyStatRecord]:
+    def load_weekly_stats(
+        self, seasons: Sequence[int], columns: Sequence[str] | None = None
+    ) -> list[WeeklyStatRecord]:
         import nflreadpy as nfl
 
-        return self._records(nfl.load_player_stats(list(seasons), summary_level="week"))
+        seasons = sorted(set(seasons))
+        # The season in progress gains a week at a time, so only finished
+        # seasons are cached.
+        if seasons and seasons[-1] < current_season():
+            frame = self._cached_frame(
+                "player_stats_week", tuple(seasons),
+                lambda: nfl.load_player_stats(seasons, summary_level="week"), None,
+            )
+        else:
+            frame = nfl.load_player_stats(seasons, summary_level="week")
+        return self._records(frame, columns)
 
     def load_rankings(self, rank_type: str = "preseason") -> list[RankingRecord]:
         import nflreadpy as nfl
@@ -1,10 +1,22 @@
-from typing import List, Optional
-from sqlalchemy import select
+from collections import defaultdict
+from typing import Dict, List, Optional
+import time
+from sqlalchemy import column, func, literal_column, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import SessionLocal
+from ..cache import TTLCache, stats_generations
+from ..db import (
+    PLAYER_FTS_MAINTAINED,
+    SEASON_STATS_MAINTAINED,
+    ReadSessionLocal,
+    SessionLocal,
+    create_season_stats_triggers,
+    dialect_insert,
+    rebuild_season_stats,
+)
 from ..models import Player, PlayerWeekStat
 from .nfl_data_provider import NFLDataProvider, get_nfl_data_provider
+from .week_points import materialize_week_points
 
 
 _NFL_TEAM_NAMES = {
@@ -43,113 +55,157 @@ _NFL_TEAM_NAMES = {
 }
 
 
+_MISSING_TEXT = frozenset({"", "nan", "None"})
+
+
 def _first(record: dict, *keys: str):
     for key in keys:
         value = record.get(key)
-        if value is not None and str(value).strip() not in {"", "nan", "None"}:
+        if value is None:
+            continue
+        if isinstance(value, str):
+            if value.strip() not in _MISSING_TEXT:
+                return value
+        elif value == value:  # NaN is the only value not equal to itself
             return value
     return None
 
 
-async def seed_players_and_ids(provider: NFLDataProvider | None = None) -> int:
+def _player_row(record: dict) -> Optional[dict]:
+    """Column values for one nflverse player record, or None without an id and name."""
+    player_id = _first(record, "gsis_id", "player_id")
+    full_name = _first(record, "display_name", "full_name", "name", "player_name")
+    if not player_id or not full_name:
+        return None
+    return {
+        "player_id": str(player_id),
+        "full_name": str(full_name),
+        "position": str(_first(record, "position", "position_group") or "UNK"),
+        "team": str(_first(record, "latest_team", "team", "recent_team") or "") or None,
+        "nflverse_id": str(player_id),
+        "yahoo_id": str(_first(record, "yahoo_id", "yahoo_player_id") or "") or None,
+        "sleeper_id": str(_first(record, "sleeper_id") or "") or None,
+        "espn_id": str(_first(record, "espn_id") or "") or None,
+        "last_season": int(_first(record, "last_season") or 0) or None,
+        "status": str(_first(record, "status") or "") or None,
+        "headshot": str(_first(record, "headshot") or "") or None,
+    }
+
+
+async def seed_players_and_ids(
+    provider: NFLDataProvider | None = None, session: Optional[AsyncSession] = None
+) -> int:
     """
     Seed players from nflreadpy with cross-platform ID mapping.
     
+    Every player is written by one upsert statement: new players are
+    inserted, known ones get their nflverse fields refreshed while keeping
+    the Yahoo/Sleeper ids other sources matched, and an ESPN id already on
+    file survives a record without one.
+    
+    Args:
+        provider: NFLDataProvider override (defaults to nflreadpy).
+        session: AsyncSession override for tests (defaults to SessionLocal).
+    
     Returns:
         Number of players seeded
     """
     try:
         records = (provider or get_nfl_data_provider()).load_players()
-        async with SessionLocal() as session:
-            count = 0
-            for row in records:
-                player_id = _first(row, "gsis_id", "player_id")
-                full_name = _first(row, "display_name", "full_name", "name", "player_name")
-                if not player_id or not full_name:
-                    continue
-                existing = await session.execute(
-                    select(Player).where(Player.player_id == str(player_id))
-                )
-                existing_player = existing.scalar_one_or_none()
-                if existing_player:
-                    existing_player.full_name = str(full_name)
-                    existing_player.position = str(_first(row, "position", "position_group") or "UNK")
-                    existing_player.team = str(_first(row, "latest_team", "team", "recent_team") or "") or None
-                    existing_player.nflverse_id = str(player_id)
-                    existing_player.espn_id = str(_first(row, "espn_id") or "") or existing_player.espn_id
-                    existing_player.last_season = int(_first(row, "last_season") or 0) or None
-                    existing_player.status = str(_first(row, "status") or "") or None
-                    existing_player.headshot = str(_first(row, "headshot") or "") or None
-                    count += 1
-                    continue
-                player = Player(
-                    player_id=str(player_id),
-                    full_name=str(full_name),
-                    position=str(_first(row, "position", "position_group") or "UNK"),
-                    team=str(_first(row, "latest_team", "team", "recent_team") or "") or None,
-                    nflverse_id=str(player_id),
-                    yahoo_id=str(_first(row, "yahoo_id", "yahoo_player_id") or "") or None,
-                    sleeper_id=str(_first(row, "sleeper_id") or "") or None,
-                    espn_id=str(_first(row, "espn_id") or "") or None,
-                    last_season=int(_first(row, "last_season") or 0) or None,
-                    status=str(_first(row, "status") or "") or None,
-                    headshot=str(_first(row, "headshot") or "") or None,
-                )
-                session.add(player)
-                count += 1
-
-            # nflverse's player index contains people, not the 32 draftable
-            # team-defense units exposed by fantasy platforms. Keep those in
-            # the same canonical pool so ESPN/FantasyPros/Yahoo DST records can
-            # resolve by team and the UI's Defense filter is never empty.
-            import time
-
-            current_season = int(time.strftime("%Y"))
-            for team, team_name in _NFL_TEAM_NAMES.items():
-                player_id = f"def-{team}"
-                existing = await session.execute(
-                    select(Player).where(Player.player_id == player_id)
+        # One row per player id (the last record wins), since a single upsert
+        # cannot touch the same row twice.
+        rows = {}
+        for record in records:
+            row = _player_row(record)
+            if row is not None:
+                rows[row["player_id"]] = row
+        
+        # nflverse's player index contains people, not the 32 draftable
+        # team-defense units exposed by fantasy platforms. Keep those in
+        # the same canonical pool so ESPN/FantasyPros/Yahoo DST records can
+        # resolve by team and the UI's Defense filter is never empty.
+        current_season = int(time.strftime("%Y"))
+        defenses = [
+            {
+                "player_id": f"def-{team}",
+                "full_name": f"{team_name} D/ST",
+                "position": "DEF",
+                "team": team,
+                "last_season": current_season,
+                "status": "ACT",
+            }
+            for team, team_name in _NFL_TEAM_NAMES.items()
+        ]
+        
+        async def _run(db: AsyncSession) -> int:
+            if rows:
+                # A Core insert goes to the driver as one executemany; the
+                # ORM bulk path would round-trip an upsert per row.
+                stmt = dialect_insert(Player.__table__)
+                refreshed = ("full_name", "position", "team", "nflverse_id", "last_season", "status", "headshot")
+                await db.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[Player.player_id],
+                        set_={
+                            **{column: stmt.excluded[column] for column in refreshed},
+                            "espn_id": func.coalesce(stmt.excluded.espn_id, Player.espn_id),
+                        },
+                    ),
+                    list(rows.values()),
                 )
-                defense = existing.scalar_one_or_none()
-                if defense:
-                    defense.full_name = f"{team_name} D/ST"
-                    defense.position = "DEF"
-                    defense.team = team
-                    defense.last_season = current_season
-                    defense.status = "ACT"
-                else:
-                    session.add(
-                        Player(
-                            player_id=player_id,
-                            full_name=f"{team_name} D/ST",
-                            position="DEF",
-                            team=team,
-                            last_season=current_season,
-                            status="ACT",
-                        )
-                    )
-                count += 1
-            await session.commit()
-            print(f"Successfully seeded {count} players")
-            return count
+            stmt = dialect_insert(Player.__table__)
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[Player.player_id],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in ("full_name", "position", "team", "last_season", "status")
+                    },
+                ),
+                defenses,
+            )
+            await db.commit()
+            return len(rows) + len(defenses)
+        
+        if session is not None:
+            count = await _run(session)
+        else:
+            async with SessionLocal() as managed_session:
+                count = await _run(managed_session)
+        _search_cache.clear()
+        print(f"Successfully seeded {count} players")
+        return count
     except ImportError:
         raise ImportError("nflreadpy not installed. Install with: pip install nflreadpy")
 
 
+# Run as a Core executemany; DO NOTHING covers rows another loader stored
+# since the existing keys were read.
+_INSERT_NEW_STATS = dialect_insert(PlayerWeekStat.__table__).on_conflict_do_nothing()
+_INSERT_CHUNK_SIZE = 10_000
+
+
 async def ingest_weekly_stats(
-    seasons: List[int], provider: NFLDataProvider | None = None
+    seasons: List[int],
+    provider: NFLDataProvider | None = None,
+    session: Optional[AsyncSession] = None,
 ) -> dict:
     """
     Ingest weekly statistics for specified seasons.
     
+    Stat rows already stored are skipped, and each season's new rows go to
+    the database as one bulk insert, in the same single transaction as the
+    week points materialized from them.
+    
     Args:
         seasons: List of NFL seasons to load
+        provider: NFLDataProvider override (defaults to nflreadpy).
+        session: AsyncSession override for tests (defaults to SessionLocal).
         
     Returns:
         Dictionary with counts per season
     """
     try:
-        records = (provider or get_nfl_data_provider()).load_weekly_stats(seasons)
         results = {}
         
         # Map nflverse player-stat columns to internal scoring keys.
@@ -196,50 +252,98 @@ async def ingest_weekly_stats(
             'fantasy_points_ppr': 'fantasy_points_ppr',
         }
         
+        stat_items = tuple(stat_mappings.items())
+        # Only the key and mapped stat columns become record fields.
+        records = (provider or get_nfl_data_provider()).load_weekly_stats(
+            seasons, columns=("player_id", "gsis_id", "season", "week", *stat_mappings)
+        )
+        
+        async def _load(db: AsyncSession, season: int, season_records: list) -> int:
+            existing_rows = await db.execute(
+                select(
+                    PlayerWeekStat.player_id,
+                    PlayerWeekStat.week,
+                    PlayerWeekStat.stat_key,
+                ).where(PlayerWeekStat.season == season)
+            )
+            existing_keys = set(existing_rows.all())
+            
+            # Rows go to the database as Core executemany calls in bounded
+            # chunks, within the season's one transaction. Each chunk is sent
+            # as soon as it fills, so only one chunk of rows is held at a
+            # time.
+            #
+            # A load that fills a chunk is bulk: the per-row season-total
+            # trigger is dropped before the first chunk and the season's
+            # totals are rebuilt once afterwards, in the same transaction,
+            # so readers never see the trigger missing.
+            connection = await db.connection()
+            rebuild = False
+            chunk = []
+            inserted = 0
+            loaded_weeks = set()
+            for row in season_records:
+                player_id = _first(row, "player_id", "gsis_id")
+                if not player_id:
+                    continue
+                player_id = str(player_id)
+                week = int(row["week"])
+                chunk_size = len(chunk)
+                for nfl_col, stat_key in stat_items:
+                    stat_value = row.get(nfl_col)
+                    # Skip missing, zero and NaN (the only value unequal to itself)
+                    if not stat_value or stat_value != stat_value:
+                        continue
+                    
+                    key = (player_id, week, stat_key)
+                    if key in existing_keys:
+                        continue
+                    existing_keys.add(key)
+                    chunk.append({
+                        "player_id": player_id, "season": season, "week": week,
+                        "stat_key": stat_key, "stat_value": float(stat_value),
+                    })
+                if len(chunk) > chunk_size:
+                    loaded_weeks.add(week)
+                if len(chunk) >= _INSERT_CHUNK_SIZE:
+                    if SEASON_STATS_MAINTAINED and not rebuild:
+                        await connection.exec_driver_sql("DROP TRIGGER IF EXISTS pws_season_ai")
+                        rebuild = True
+                    await connection.execute(_INSERT_NEW_STATS, chunk)
+                    inserted += len(chunk)
+                    chunk = []
+            if chunk:
+                await connection.execute(_INSERT_NEW_STATS, chunk)
+                inserted += len(chunk)
+            if rebuild:
+                await rebuild_season_stats(connection, season)
+                await create_season_stats_triggers(connection)
+            
+            if loaded_weeks:
+                # Precompute the new weeks' points so leaderboards read them,
+                # committed together with the stats they were scored from.
+                await materialize_week_points(db, season, loaded_weeks)
+            await db.commit()
+            for week in loaded_weeks:
+                stats_generations.bump((season, week))
+            stats_generations.bump(season)
+            return inserted
+        
+        records_by_season = defaultdict(list)
+        for row in records:
+            records_by_season[int(row.get("season", 0))].append(row)
+        
         for season in seasons:
-            season_records = [row for row in records if int(row.get("season", 0)) == season]
+            season_records = records_by_season[season]
             print(f"Processing {len(season_records)} weekly records for {season}")
             
-            async with SessionLocal() as session:
-                count = 0
-                existing_rows = await session.execute(
-                    select(
-                        PlayerWeekStat.player_id,
-                        PlayerWeekStat.week,
-                        PlayerWeekStat.stat_key,
-                    ).where(PlayerWeekStat.season == season)
-                )
-                existing_keys = set(existing_rows.all())
-                for row in season_records:
-                    player_id = _first(row, "player_id", "gsis_id")
-                    if not player_id:
-                        continue
-                    for nfl_col, stat_key in stat_mappings.items():
-                        if nfl_col not in row:
-                            continue
-                        stat_value = row[nfl_col]
-                        if stat_value is None or stat_value == 0:
-                            continue
-                        
-                        key = (str(player_id), int(row["week"]), stat_key)
-                        if key in existing_keys:
-                            continue
-                        
-                        # Create stat record
-                        stat = PlayerWeekStat(
-                            player_id=str(player_id),
-                            season=int(row["season"]),
-                            week=int(row["week"]),
-                            stat_key=stat_key,
-                            stat_value=float(stat_value)
-                        )
-                        session.add(stat)
-                        existing_keys.add(key)
-                        count += 1
-                
-                await session.commit()
-                results[season] = count
-                print(f"Loaded {count} stat records for {season}")
+            if session is not None:
+                count = await _load(session, season, season_records)
+            else:
+                async with SessionLocal() as managed_session:
+                    count = await _load(managed_session, season, season_records)
+            results[season] = count
+            print(f"Loaded {count} stat records for {season}")
         
         return results
         
@@ -247,10 +351,51 @@ async def ingest_weekly_stats(
         raise ImportError("nflreadpy not installed. Install with: pip install nflreadpy")
 
 
+async def get_stats_for_players(
+    player_ids: List[str],
+    season: int,
+    week: int,
+    session: Optional[AsyncSession] = None,
+) -> Dict[str, dict]:
+    """
+    Get statistics for many players in a specific week with one query.
+    
+    Args:
+        player_ids: Player identifiers
+        season: NFL season
+        week: Week number
+        
+    Returns:
+        Stat dictionary per player; players without stats are left out
+    """
+    if not player_ids:
+        return {}
+    
+    stmt = select(
+        PlayerWeekStat.player_id, PlayerWeekStat.stat_key, PlayerWeekStat.stat_value
+    ).where(
+        PlayerWeekStat.player_id.in_(player_ids),
+        PlayerWeekStat.season == season,
+        PlayerWeekStat.week == week
+    )
+    
+    async def _load(db: AsyncSession) -> Dict[str, dict]:
+        stats: Dict[str, dict] = defaultdict(dict)
+        for player_id, stat_key, stat_value in (await db.execute(stmt)).all():
+            stats[player_id][stat_key] = stat_value
+        return dict(stats)
+    
+    if session is not None:
+        return await _load(session)
+    async with ReadSessionLocal() as managed_session:
+        return await _load(managed_session)
+
+
 async def get_player_stats(
     player_id: str, 
     season: int, 
-    week: int
+    week: int,
+    session: Optional[AsyncSession] = None,
 ) -> Optional[dict]:
     """
     Get player statistics for a specific week.
@@ -263,20 +408,46 @@ async def get_player_stats(
     Returns:
         Dictionary of stats or None if not found
     """
-    async with SessionLocal() as session:
-        result = await session.execute(
-            select(PlayerWeekStat).where(
-                PlayerWeekStat.player_id == player_id,
-                PlayerWeekStat.season == season,
-                PlayerWeekStat.week == week
-            )
-        )
-        
-        stats = result.scalars().all()
-        if not stats:
-            return None
-            
-        return {stat.stat_key: stat.stat_value for stat in stats}
+    stats = await get_stats_for_players([player_id], season, week, session=session)
+    return stats.get(player_id)
+
+
+# Columns returned for a player by search and lookup endpoints; rows are read
+# as plain mappings rather than ORM objects.
+PLAYER_COLUMNS = (
+    Player.player_id,
+    Player.full_name,
+    Player.position,
+    Player.team,
+    Player.nflverse_id,
+    Player.yahoo_id,
+    Player.sleeper_id,
+    Player.espn_id,
+    Player.last_season,
+    Player.status,
+    Player.headshot,
+)
+
+
+# Typeahead fires the same searches repeatedly; results are public, so they
+# are shared across callers for a minute. Name matching is case-insensitive,
+# so "Mahomes" and "mahomes" share a slot. Player seeding clears it.
+_search_cache = TTLCache(maxsize=1024, ttl=60)
+
+# The trigram tokenizer needs three characters to look anything up.
+_FTS_MIN_QUERY = 3
+_FTS_ROWIDS = text(
+    "SELECT rowid FROM players_fts WHERE players_fts MATCH :match"
+).columns(column("rowid"))
+
+
+def _name_matches(query: str):
+    """Case-insensitive substring match on full_name, through players_fts on SQLite."""
+    if PLAYER_FTS_MAINTAINED and len(query) >= _FTS_MIN_QUERY:
+        # Quoted as one FTS5 string, a trigram MATCH is a substring match.
+        phrase = '"' + query.replace('"', '""') + '"'
+        return literal_column("players.rowid").in_(_FTS_ROWIDS.bindparams(match=phrase))
+    return Player.full_name.ilike(f"%{query}%")
 
 
 async def search_players(
@@ -300,11 +471,17 @@ async def search_players(
     Returns:
         List of player dictionaries
     """
+    cache_key = (query.lower(), position, team, limit, current_only, season)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        # Fresh dicts each call, so callers can't edit the cached rows
+        return [dict(row) for row in cached]
+
     async def _search(db: AsyncSession) -> List[dict]:
-        stmt = select(Player)
+        stmt = select(*PLAYER_COLUMNS)
 
         if query:
-            stmt = stmt.where(Player.full_name.ilike(f"%{query}%"))
+            stmt = stmt.where(_name_matches(query))
 
         if position:
             stmt = stmt.where(Player.position == position)
@@ -313,8 +490,6 @@ async def search_players(
             stmt = stmt.where(Player.team == team)
 
         if current_only:
-            import time
-
             target_season = season or int(time.strftime("%Y"))
             stmt = stmt.where(
                 Player.last_season >= target_season,
@@ -324,27 +499,12 @@ async def search_players(
 
         stmt = stmt.order_by(Player.position, Player.full_name).limit(limit)
         result = await db.execute(stmt)
-        players = result.scalars().all()
-
-        return [
-            {
-                "player_id": p.player_id,
-                "full_name": p.full_name,
-                "position": p.position,
-                "team": p.team,
-                "nflverse_id": p.nflverse_id,
-                "yahoo_id": p.yahoo_id,
-                "sleeper_id": p.sleeper_id,
-                "espn_id": p.espn_id,
-                "last_season": p.last_season,
-                "status": p.status,
-                "headshot": p.headshot,
-            }
-            for p in players
-        ]
+        return [dict(row) for row in result.mappings()]
 
     if session is not None:
-        return await _search(session)
-
-    async with SessionLocal() as managed_session:
-        return await _search(managed_session)
+        players = await _search(session)
+    else:
+        async with ReadSessionLocal() as managed_session:
+            players = await _search(managed_session)
+    _search_cache.set(cache_key, players)
+    return [dict(row) for row in players]
@@ -11,8 +11,10 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import SessionLocal
 from ..models import Player
@@ -25,13 +27,19 @@ _DEFAULT_PARQUET = Path(
 )
 
 
-async def backfill_espn_ids_from_rosters(path: str | os.PathLike | None = None) -> dict:
+async def backfill_espn_ids_from_rosters(
+    path: str | os.PathLike | None = None, session: Optional[AsyncSession] = None
+) -> dict:
     """
     Backfill ``players.espn_id`` from a sports-ml-lab rosters parquet.
 
+    The ids of players still missing an ``espn_id`` are read once into a
+    set, and the matches are written back as one executemany update.
+
     Args:
         path: Path to ``rosters_2026.parquet``. Defaults to the env var
             ``SPORTS_ML_LAB_ROSTERS`` or the standard sports-ml-lab checkout.
+        session: AsyncSession override for tests (defaults to SessionLocal).
 
     Returns:
         Summary dict with updated count and players still missing espn_id.
@@ -51,17 +59,30 @@ async def backfill_espn_ids_from_rosters(path: str | os.PathLike | None = None)
         pid, espn = row
         id_to_espn[str(pid)] = str(espn)
 
-    updated = 0
-    async with SessionLocal() as session:
-        players = (await session.execute(select(Player))).scalars().all()
-        for player in players:
-            if player.espn_id:
-                continue
-            espn_id = id_to_espn.get(player.player_id)
-            if espn_id:
-                player.espn_id = espn_id
-                updated += 1
-        await session.commit()
+    async def _run(db: AsyncSession) -> int:
+        missing = set(
+            (await db.execute(select(Player.player_id).where(Player.espn_id.is_(None)))).scalars()
+        )
+        rows = [
+            {"pid": player_id, "espn_id": id_to_espn[player_id]}
+            for player_id in missing.intersection(id_to_espn)
+        ]
+        if rows:
+            connection = await db.connection()
+            await connection.execute(
+                update(Player.__table__)
+                .where(Player.__table__.c.player_id == bindparam("pid"))
+                .values(espn_id=bindparam("espn_id")),
+                rows,
+            )
+        await db.commit()
+        return len(rows)
+
+    if session is not None:
+        updated = await _run(session)
+    else:
+        async with SessionLocal() as managed_session:
+            updated = await _run(managed_session)
 
     return {
         "updated": updated,
@@ -0,0 +1,91 @@
+"""Scoring-profile rules cached for every endpoint that scores stats."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..cache import TTLCache, profile_generations
+from ..models import ScoringProfile, ScoringRule
+from ..scoring import compile_rules, load_compiled_profile
+
+ProfileRules = tuple[str, tuple[dict[str, Any], ...], np.ndarray]
+
+# (profile name, rule dicts, compiled rule array) keyed by profile_id and its
+# generation, so every profile writer that bumps the generation retires the
+# entry; the TTL covers writers in other processes.
+profile_rules_cache = TTLCache(maxsize=256, ttl=300)
+
+
+def cached_profile_rules(profile_id: str, generation: int) -> Optional[ProfileRules]:
+    """The cached rules for a profile at ``generation``, without touching the database."""
+    return profile_rules_cache.get((profile_id, generation))
+
+
+def remember_profile_rules(
+    profile_id: str,
+    generation: int,
+    name: str,
+    rules: tuple[dict[str, Any], ...],
+    compiled_blob: Optional[bytes],
+) -> ProfileRules:
+    """Cache rules a caller loaded itself (e.g. alongside other rows in one query).
+
+    ``generation`` must be read before the query that loaded the rules, so an
+    update committed while it was in flight leaves them under the old key.
+    """
+    profile = (name, rules, _load_compiled(compiled_blob, rules))
+    profile_rules_cache.set((profile_id, generation), profile)
+    return profile
+
+
+async def get_profile_rules(db: AsyncSession, profile_id: str) -> Optional[ProfileRules]:
+    """Return (profile name, rule dicts, compiled rules) for a profile, or None if it does not exist."""
+    generation = profile_generations.get(profile_id)
+    cached = cached_profile_rules(profile_id, generation)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(
+        select(
+            ScoringProfile.name,
+            ScoringProfile.compiled,
+            ScoringRule.stat_key,
+            ScoringRule.multiplier,
+            ScoringRule.per,
+            ScoringRule.bonus_min,
+            ScoringRule.bonus_max,
+            ScoringRule.bonus_points,
+            ScoringRule.cap,
+        ).select_from(ScoringProfile).outerjoin(
+            ScoringRule, ScoringRule.profile_id == ScoringProfile.profile_id
+        ).where(ScoringProfile.profile_id == profile_id)
+    )
+    rows = result.all()
+    if not rows:
+        return None
+
+    rules = tuple(
+        {
+            "stat_key": row.stat_key,
+            "multiplier": row.multiplier,
+            "per": row.per,
+            "bonus_min": row.bonus_min,
+            "bonus_max": row.bonus_max,
+            "bonus_points": row.bonus_points,
+            "cap": row.cap
+        }
+        for row in rows
+        if row.stat_key is not None
+    )
+    return remember_profile_rules(profile_id, generation, rows[0].name, rules, rows[0].compiled)
+
+
+def _load_compiled(blob: Optional[bytes], rules) -> np.ndarray:
+    """Unpack a stored compiled profile, compiling on the fly for rows written before the column existed."""
+    if blob is None:
+        return compile_rules(rules)
+    return load_compiled_profile(blob)
@@ -6,7 +6,9 @@ import math
 from collections import defaultdict
 from typing import Any, Iterable
 
-from ..scoring import compute_points_from_dict
+import numpy as np
+
+from ..scoring import compile_rules, compute_points_from_dict, score_compiled
 
 
 FANTASY_POSITIONS = ("QB", "RB", "WR", "TE", "K", "DEF")
@@ -55,6 +57,26 @@ def score_projected_stats(
     return compute_points_from_dict(stats, rules)
 
 
+def score_projected_batch(
+    stat_lines: list[dict[str, float] | None],
+    rules: list[dict[str, Any]],
+    compiled: np.ndarray | None = None,
+) -> list[float | None]:
+    """score_projected_stats over many stat lines in one vectorized pass.
+
+    Pass ``compiled`` when the profile's compiled rules are already at hand.
+    """
+    rule_keys = {rule["stat_key"] for rule in rules}
+    lines = [stats or {} for stats in stat_lines]
+    scorable = [index for index, stats in enumerate(lines) if not rule_keys.isdisjoint(stats)]
+    if compiled is None:
+        compiled = compile_rules(rules)
+    points: list[float | None] = [None] * len(lines)
+    for index, value in zip(scorable, score_compiled([lines[index] for index in scorable], compiled)):
+        points[index] = value
+    return points
+
+
 def projected_team_opportunity(records: Iterable[Any]) -> dict[str, dict[str, Any]]:
     """Estimate each skill player's share of their projected team opportunity.
 
@@ -145,35 +167,49 @@ def build_projection_analytics(
     starters: dict[str, int] | None = None,
     flex_slots: int = 1,
     superflex_slots: int = 0,
+    compiled: np.ndarray | None = None,
 ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-    """Score provider projection records and derive position-relative analytics."""
+    """Score provider projection records and derive position-relative analytics.
+
+    Pass the profile's cached ``compiled`` rules so repeat requests reuse its
+    scoring kernel instead of recompiling the rule dicts.
+    """
     records = list(records)
     opportunity_by_player = projected_team_opportunity(records)
     normalized_rules = rule_dicts(rules)
     starter_config = {**DEFAULT_STARTERS, **(starters or {})}
     groups: dict[str, list[dict[str, Any]]] = defaultdict(list)
 
+    # Score every season and weekly stat line in one pass, then hand the
+    # points back out in the same order.
+    candidates = []
+    stat_lines: list[dict[str, float] | None] = []
     for record in records:
         position = normalize_position(record.position)
         if not record.player_id or position not in FANTASY_POSITIONS:
             continue
         raw = record.raw or {}
-        stats = raw.get("projected_stats") or {}
+        weeks = raw.get("weekly_projections") or []
+        candidates.append((record, position, raw, weeks))
+        stat_lines.append(raw.get("projected_stats"))
+        stat_lines.extend(week.get("stats") for week in weeks)
+    scored = iter(score_projected_batch(stat_lines, normalized_rules, compiled))
+
+    for record, position, raw, weeks in candidates:
         native_points = raw.get("projected_points")
-        profile_points = score_projected_stats(stats, normalized_rules)
+        profile_points = next(scored)
+        weekly = [
+            {
+                "week": week.get("week"),
+                "espn_points": week.get("points"),
+                "profile_points": next(scored),
+            }
+            for week in weeks
+        ]
         analytics_points = profile_points if profile_points is not None else native_points
         if analytics_points is None:
             continue
 
-        weekly = []
-        for week in raw.get("weekly_projections") or []:
-            weekly_profile_points = score_projected_stats(week.get("stats"), normalized_rules)
-            weekly.append({
-                "week": week.get("week"),
-                "espn_points": week.get("points"),
-                "profile_points": weekly_profile_points,
-            })
-
         groups[position].append({
             "player_id": record.player_id,
             "full_name": record.full_name,
@@ -5,6 +5,7 @@ from __future__ import annotations
 from functools import lru_cache
 from typing import Any
 
+import polars as pl
 
 _TEAM_ALIASES = {"LAR": "LA", "WSH": "WAS"}
 
@@ -14,6 +15,13 @@ def _team(value: str | None) -> str:
     return _TEAM_ALIASES.get(team, team)
 
 
+def _rows(frame: pl.DataFrame, *columns: str):
+    """Iterate ``columns`` of ``frame`` as tuples, yielding None for any column it lacks."""
+    return frame.select(
+        [pl.col(name) if name in frame.columns else pl.lit(None).alias(name) for name in columns]
+    ).iter_rows()
+
+
 @lru_cache(maxsize=64)
 def get_schedule_strength(team: str, position: str, season: int) -> dict[str, Any]:
     """Estimate matchup ease from prior-year PPR points allowed by position.
@@ -33,17 +41,26 @@ def get_schedule_strength(team: str, position: str, season: int) -> dict[str, An
     import nflreadpy as nfl
 
     basis_season = season - 1
-    stats = nfl.load_player_stats([basis_season], summary_level="week").to_dicts()
-    schedules = nfl.load_schedules([season]).to_dicts()
+    # Only the handful of columns used below are pulled out of the frames, as
+    # plain tuples, instead of one dict per row holding every stat column.
+    stats = _rows(
+        nfl.load_player_stats([basis_season], summary_level="week"),
+        "season_type", "position", "opponent_team", "game_id", "fantasy_points_ppr",
+    )
+    schedules = [
+        {"game_type": game_type, "week": week, "away_team": away_team, "home_team": home_team}
+        for game_type, week, away_team, home_team in _rows(
+            nfl.load_schedules([season]), "game_type", "week", "away_team", "home_team"
+        )
+    ]
 
     totals: dict[str, float] = {}
     games: dict[str, set[str]] = {}
-    for row in stats:
-        if row.get("season_type") != "REG" or str(row.get("position") or "").upper() != position:
+    for season_type, row_position, opponent_team, game_id, points in stats:
+        if season_type != "REG" or str(row_position or "").upper() != position:
             continue
-        opponent = _team(row.get("opponent_team"))
-        game_id = str(row.get("game_id") or "")
-        points = row.get("fantasy_points_ppr")
+        opponent = _team(opponent_team)
+        game_id = str(game_id or "")
         if not opponent or points is None:
             continue
         totals[opponent] = totals.get(opponent, 0.0) + float(points)
@@ -0,0 +1,83 @@
+"""Precomputed per-week fantasy points for public scoring profiles."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db import WEEK_POINTS_MAINTAINED
+from ..models import (
+    PlayerWeekPoints,
+    PlayerWeekPointsComplete,
+    PlayerWeekStat,
+    ScoringProfile,
+    ScoringRule,
+)
+from ..scoring import scores_missing_stats, sql_rule_points
+
+
+async def materialize_week_points(session: AsyncSession, season: int, weeks: Iterable[int]) -> int:
+    """
+    Score every player-week in ``weeks`` under each public profile and mark those weeks complete.
+
+    Profiles that award points for absent stats cannot be scored as a join
+    over stat rows and are skipped; their leaderboards keep scoring live.
+    Off SQLite nothing is materialized, since the triggers that invalidate
+    stored points only exist there. Points are stored unrounded; readers
+    round them the same way as points scored live. The caller commits.
+
+    Returns:
+        Number of profiles materialized
+    """
+    weeks = sorted(set(weeks))
+    if not weeks or not WEEK_POINTS_MAINTAINED:
+        return 0
+
+    rules_by_profile: dict[str, list[dict]] = defaultdict(list)
+    profile_ids = (await session.execute(
+        select(ScoringProfile.profile_id).where(ScoringProfile.is_public.is_(True))
+    )).scalars().all()
+    rule_rows = (await session.execute(
+        select(ScoringRule.profile_id, ScoringRule.bonus_min, ScoringRule.bonus_max, ScoringRule.cap)
+        .where(ScoringRule.profile_id.in_(profile_ids))
+    )).mappings().all()
+    for rule in rule_rows:
+        rules_by_profile[rule["profile_id"]].append(dict(rule))
+
+    materialized = 0
+    for profile_id in profile_ids:
+        if scores_missing_stats(rules_by_profile[profile_id]):
+            continue
+        scored = (
+            select(
+                PlayerWeekStat.player_id,
+                PlayerWeekStat.season,
+                PlayerWeekStat.week,
+                literal(profile_id).label("profile_id"),
+                func.coalesce(func.sum(sql_rule_points(PlayerWeekStat.stat_value)), 0.0),
+            )
+            .outerjoin(
+                ScoringRule,
+                (ScoringRule.profile_id == profile_id) & (ScoringRule.stat_key == PlayerWeekStat.stat_key),
+            )
+            .where(PlayerWeekStat.season == season, PlayerWeekStat.week.in_(weeks))
+            .group_by(PlayerWeekStat.player_id, PlayerWeekStat.season, PlayerWeekStat.week)
+        )
+        upsert = sqlite_insert(PlayerWeekPoints).from_select(
+            ["player_id", "season", "week", "profile_id", "points"], scored
+        )
+        await session.execute(upsert.on_conflict_do_update(
+            index_elements=["player_id", "season", "week", "profile_id"],
+            set_={"points": upsert.excluded.points},
+        ))
+        await session.execute(
+            sqlite_insert(PlayerWeekPointsComplete)
+            .values([{"season": season, "week": week, "profile_id": profile_id} for week in weeks])
+            .on_conflict_do_nothing()
+        )
+        materialized += 1
+    return materialized
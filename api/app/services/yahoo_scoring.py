@@ -10,6 +10,7 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import ScoringProfile, ScoringRule
+from app.scoring import compile_profile
 
 
 def _label(value: str | None) -> str:
@@ -153,7 +154,12 @@ async def persist_yahoo_scoring_profile(
     settings: dict,
     translation: dict,
 ) -> dict | None:
-    """Create or replace the internal profile for one Yahoo league."""
+    """
+    Create or replace the internal profile for one Yahoo league.
+
+    The caller commits, then bumps the profile's generation so cached rules
+    and bodies are only dropped once the new rules are readable.
+    """
 
     rules = translation.get("rules", [])
     if not rules:
@@ -177,6 +183,7 @@ async def persist_yahoo_scoring_profile(
     else:
         await db.execute(delete(ScoringRule).where(ScoringRule.profile_id == profile.profile_id))
 
+    profile.compiled = compile_profile(rules)
     for rule in rules:
         db.add(
             ScoringRule(
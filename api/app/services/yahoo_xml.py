@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from typing import Callable, Optional
 from xml.etree import ElementTree as ET
 
 
@@ -77,55 +78,98 @@ def parse_leagues(xml: str) -> list[dict]:
     return leagues
 
 
-def parse_teams(xml: str) -> list[dict]:
-    root = ET.fromstring(xml)
-    teams = []
-    for team in _descendants(root, "team"):
-        team_key = _text(team, "team_key")
-        if not team_key:
+class ElementStream:
+    """
+    Incremental parser that builds one dict per ``tag`` element as chunks are fed.
+
+    Each element is cleared once built, so a large response (a league's full
+    rosters) is parsed as it downloads without keeping the whole tree around.
+    """
+
+    def __init__(self, tag: str, build: Callable[[ET.Element], Optional[dict]]):
+        self._parser = ET.XMLPullParser(events=("end",))
+        self._tag = tag
+        self._build = build
+        self.items: list[dict] = []
+
+    def feed(self, chunk: str | bytes) -> None:
+        self._parser.feed(chunk)
+        self._drain()
+
+    def close(self) -> list[dict]:
+        self._parser.close()
+        self._drain()
+        return self.items
+
+    def _drain(self) -> None:
+        for _, element in self._parser.read_events():
+            if _name(element) != self._tag:
+                continue
+            item = self._build(element)
+            if item is not None:
+                self.items.append(item)
+            element.clear()
+
+
+def _team(team: ET.Element) -> Optional[dict]:
+    team_key = _text(team, "team_key")
+    if not team_key:
+        return None
+    managers = _descendants(team, "manager")
+    owner = _text(managers[0], "nickname") if managers else ""
+    return {
+        "id": team_key,
+        "name": _text(team, "name", team_key),
+        "owner": owner,
+        "rank": _int(_nested_text(team, ("team_standings", "rank"))),
+        "wins": _int(_nested_text(team, ("team_standings", "outcome_totals", "wins"))),
+        "losses": _int(_nested_text(team, ("team_standings", "outcome_totals", "losses"))),
+        "ties": _int(_nested_text(team, ("team_standings", "outcome_totals", "ties"))),
+        "points_for": _float(_nested_text(team, ("team_standings", "points_for"))),
+        "points_against": _float(_nested_text(team, ("team_standings", "points_against"))),
+    }
+
+
+def _roster(team: ET.Element) -> Optional[dict]:
+    team_key = _text(team, "team_key")
+    if not team_key:
+        return None
+    players = []
+    for player in _descendants(team, "player"):
+        player_key = _text(player, "player_key")
+        if not player_key:
             continue
-        managers = _descendants(team, "manager")
-        owner = _text(managers[0], "nickname") if managers else ""
-        teams.append(
+        full = _nested_text(player, ("name", "full")) or _text(player, "name")
+        players.append(
             {
-                "id": team_key,
-                "name": _text(team, "name", team_key),
-                "owner": owner,
-                "rank": _int(_nested_text(team, ("team_standings", "rank"))),
-                "wins": _int(_nested_text(team, ("team_standings", "outcome_totals", "wins"))),
-                "losses": _int(_nested_text(team, ("team_standings", "outcome_totals", "losses"))),
-                "ties": _int(_nested_text(team, ("team_standings", "outcome_totals", "ties"))),
-                "points_for": _float(_nested_text(team, ("team_standings", "points_for"))),
-                "points_against": _float(_nested_text(team, ("team_standings", "points_against"))),
+                "id": player_key,
+                "name": full,
+                "position": _text(player, "display_position"),
+                "selected_position": _nested_text(player, ("selected_position", "position")),
+                "team": _text(player, "editorial_team_abbr"),
             }
         )
-    return teams
+    return {"team_id": team_key, "players": players}
+
+
+def team_stream() -> ElementStream:
+    return ElementStream("team", _team)
+
+
+def roster_stream() -> ElementStream:
+    return ElementStream("team", _roster)
+
+
+def parse_teams(xml: str) -> list[dict]:
+    stream = team_stream()
+    stream.feed(xml)
+    return stream.close()
 
 
 def parse_rosters(xml: str) -> list[dict]:
-    root = ET.fromstring(xml)
-    rosters = []
-    for team in _descendants(root, "team"):
-        team_key = _text(team, "team_key")
-        if not team_key:
-            continue
-        players = []
-        for player in _descendants(team, "player"):
-            player_key = _text(player, "player_key")
-            if not player_key:
-                continue
-            full = _nested_text(player, ("name", "full")) or _text(player, "name")
-            players.append(
-                {
-                    "id": player_key,
-                    "name": full,
-                    "position": _text(player, "display_position"),
-                    "selected_position": _nested_text(player, ("selected_position", "position")),
-                    "team": _text(player, "editorial_team_abbr"),
-                }
-            )
-        rosters.append({"team_id": team_key, "players": players})
-    return rosters
+    stream = roster_stream()
+    stream.feed(xml)
+    return stream.close()
 
 
 def parse_settings(xml: str) -> dict:
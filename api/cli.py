@@ -1,14 +1,13 @@
 import asyncio
+import os
 import uuid
 import time
-from typing import List
 import typer
 from sqlalchemy import insert, select
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import SessionLocal
-from app.models import Player, PlayerWeekStat, ScoringProfile, ScoringRule
-from app.scoring import get_default_scoring_profiles
+from app.models import ScoringProfile, ScoringRule
+from app.scoring import compile_profile, get_default_scoring_profiles
 
 cli = typer.Typer()
 
@@ -17,35 +16,43 @@ async def _seed_default_profiles():
     """Seed default scoring profiles"""
     async with SessionLocal() as session:
         # Check if profiles already exist
-        existing = await session.execute(select(ScoringProfile))
-        if existing.scalars().first():
+        existing = await session.execute(select(ScoringProfile.profile_id).limit(1))
+        if existing.first():
             typer.echo("Default profiles already exist, skipping...")
             return
         
         default_profiles = get_default_scoring_profiles()
         current_time = int(time.time())
         
+        # Plain rows for two Core inserts: every profile and every rule go
+        # to the database as one executemany each instead of an ORM flush
+        # per object.
+        # Draw every profile and rule id from a single urandom read.
+        id_count = len(default_profiles) + sum(len(rules) for rules in default_profiles.values())
+        entropy = os.urandom(16 * id_count)
+        ids = (
+            str(uuid.UUID(bytes=entropy[start:start + 16], version=4))
+            for start in range(0, len(entropy), 16)
+        )
+        profile_rows = []
+        rule_rows = []
         for profile_name, rules in default_profiles.items():
-            # Create profile
-            profile_id = str(uuid.uuid4())
-            profile = ScoringProfile(
-                profile_id=profile_id,
-                name=profile_name,
-                description=f"Default {profile_name} scoring profile",
-                is_public=True,
-                created_at=current_time
+            profile_id = next(ids)
+            profile_rows.append({
+                "profile_id": profile_id,
+                "name": profile_name,
+                "description": f"Default {profile_name} scoring profile",
+                "is_public": True,
+                "created_at": current_time,
+                "compiled": compile_profile(rules),
+            })
+            rule_rows.extend(
+                {"rule_id": next(ids), "profile_id": profile_id, **rule_data}
+                for rule_data in rules
             )
-            session.add(profile)
-            
-            # Create rules for this profile
-            for rule_data in rules:
-                rule = ScoringRule(
-                    rule_id=str(uuid.uuid4()),
-                    profile_id=profile_id,
-                    **rule_data
-                )
-                session.add(rule)
         
+        await session.execute(insert(ScoringProfile.__table__), profile_rows)
+        await session.execute(insert(ScoringRule.__table__), rule_rows)
         await session.commit()
         typer.echo(f"Created {len(default_profiles)} default scoring profiles")
 
@@ -64,12 +71,7 @@ def seed_players():
     try:
         from app.services.nflverse import seed_players_and_ids
         typer.echo("Seeding players from nflreadpy...")
-        
-        async def _seed_players():
-            count = await seed_players_and_ids()
-            return count
-        
-        count = asyncio.run(_seed_players())
+        count = asyncio.run(seed_players_and_ids())
         typer.echo(f"Seeded {count} players")
         
     except ImportError:
@@ -85,13 +87,8 @@ def load_stats(
     try:
         from app.services.nflverse import ingest_weekly_stats
         typer.echo(f"Loading weekly stats for seasons: {seasons}")
-        
-        async def _load_stats():
-            years = [int(y.strip()) for y in seasons.split(",")]
-            results = await ingest_weekly_stats(years)
-            return results
-        
-        results = asyncio.run(_load_stats())
+        years = [int(y.strip()) for y in seasons.split(",")]
+        results = asyncio.run(ingest_weekly_stats(years))
         for season, count in results.items():
             typer.echo(f"Loaded {count} stat records for {season}")
         
@@ -1,24 +1,29 @@
 import pytest
 import pytest_asyncio
 import asyncio
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Generator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
 from app.main import app
-from app.deps import get_db_session
+from app.db import create_player_fts, create_season_stats_triggers, get_db, get_read_db, get_read_sessions
+from app.routers import fantasy, players, yahoo
+from app.services import nflverse, profile_rules
 from app.models import Base, Player, PlayerRanking, ScoringProfile, ScoringRule
 
 
 # Test database URL - use in-memory SQLite for testing
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
-# Create test engine
+# Create test engine. StaticPool hands every checkout the same connection,
+# so all tests share the one in-memory database built by test_db_setup.
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     echo=False,
-    future=True
+    poolclass=StaticPool,
 )
 
 @pytest.fixture(scope="session")
@@ -34,6 +39,8 @@ async def test_db_setup():
     """Set up test database tables."""
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await create_season_stats_triggers(conn)
+        await create_player_fts(conn)
         await conn.execute(
             Player.__table__.insert().values(
                 player_id="fixture-qb",
@@ -109,6 +116,38 @@ async def db_session(test_db_setup) -> AsyncGenerator[AsyncSession, None]:
                     await transaction.rollback()
 
 
+@pytest_asyncio.fixture
+async def db_sessions(test_db_setup) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """A session factory for code that opens and commits its own sessions.
+
+    Commits only release savepoints inside one transaction on the shared
+    test database, which is rolled back afterwards, so tests need no private
+    engine and schema.
+    """
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            yield async_sessionmaker(
+                bind=connection, expire_on_commit=False, join_transaction_mode="create_savepoint"
+            )
+        finally:
+            await transaction.rollback()
+
+
+@pytest.fixture(autouse=True)
+def clear_fantasy_caches():
+    """In-process caches must not carry rows from one test's rolled-back data to the next."""
+    yield
+    profile_rules.profile_rules_cache.clear()
+    fantasy._points_response_cache.clear()
+    fantasy._profile_body_cache.clear()
+    fantasy._profile_list_cache.clear()
+    fantasy._leaderboard_cache.clear()
+    nflverse._search_cache.clear()
+    players._stats_body_cache.clear()
+    yahoo._token_response_cache.clear()
+
+
 @pytest.fixture
 def override_get_db(db_session: AsyncSession):
     """Override the get_db dependency for testing."""
@@ -119,18 +158,35 @@ def override_get_db(db_session: AsyncSession):
 
 
 @pytest.fixture
-def client(override_get_db) -> TestClient:
+def override_get_read_sessions(db_session: AsyncSession):
+    """Hand concurrent readers the test session one at a time, so they see its uncommitted rows."""
+    lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def _session():
+        async with lock:
+            yield db_session
+
+    return lambda: _session
+
+
+@pytest.fixture
+def client(override_get_db, override_get_read_sessions) -> TestClient:
     """Create a test client with overridden dependencies."""
-    app.dependency_overrides[get_db_session] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_sessions] = override_get_read_sessions
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
 
 @pytest.fixture
-async def async_client(override_get_db) -> AsyncGenerator[AsyncClient, None]:
+async def async_client(override_get_db, override_get_read_sessions) -> AsyncGenerator[AsyncClient, None]:
     """Create an async test client with overridden dependencies."""
-    app.dependency_overrides[get_db_session] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_sessions] = override_get_read_sessions
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
     app.dependency_overrides.clear()
@@ -1,9 +1,18 @@
+import sqlite3
+
+import httpx
 import pytest
 from fastapi import status
-from sqlalchemy import insert
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import OperationalError
 from urllib.parse import parse_qs, urlparse
-from app.models import Player, ScoringProfile, ScoringRule
-from app.routers import yahoo
+from app.models import Player, PlayerSeasonStat, PlayerWeekPoints, PlayerWeekStat, ScoringProfile, ScoringRule
+from app.routers import fantasy, players, yahoo
+from app.schemas import Player as PlayerSchema
+from app.cache import profile_generations
+from app.services import nflverse
+from app.services.profile_rules import cached_profile_rules, get_profile_rules
+from app.services.week_points import materialize_week_points
 
 
 class TestFantasyEndpoints:
@@ -75,6 +84,57 @@ class TestFantasyEndpoints:
             "http://localhost:5173/auth/callback?code=test-code&state=test-state"
         )
     
+    def test_yahoo_token_checks_reuse_recent_responses(self, client, monkeypatch):
+        calls = []
+
+        def handler(request):
+            calls.append(request.headers["authorization"])
+            if request.headers["authorization"] != "Bearer good-token":
+                return httpx.Response(401)
+            return httpx.Response(200, text="<fantasy_content/>")
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            yahoo.httpx, "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+
+        good = {"Authorization": "Bearer good-token"}
+        assert client.get("/yahoo/verify-token", headers=good).status_code == status.HTTP_200_OK
+        assert client.get("/yahoo/verify-token", headers=good).status_code == status.HTTP_200_OK
+        bad = {"Authorization": "Bearer bad-token"}
+        assert client.get("/yahoo/verify-token", headers=bad).status_code == status.HTTP_401_UNAUTHORIZED
+        assert client.get("/yahoo/verify-token", headers=bad).status_code == status.HTTP_401_UNAUTHORIZED
+        assert calls == ["Bearer good-token", "Bearer bad-token", "Bearer bad-token"]
+        assert yahoo.get_yahoo_client() is yahoo.get_yahoo_client()
+        # Entries are keyed by a hash of the token, never the token itself.
+        assert not any("good-token" in part for key in yahoo._token_response_cache._entries for part in key)
+    
+    def test_yahoo_league_rosters_are_parsed_and_reused(self, client, monkeypatch):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, text=(
+                "<fantasy_content><teams><team><team_key>1.l.2.t.1</team_key><roster><players>"
+                "<player><player_key>1.p.42</player_key><name><full>Example Player</full></name></player>"
+                "</players></roster></team></teams></fantasy_content>"
+            ))
+
+        real_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            yahoo.httpx, "AsyncClient",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+
+        headers = {"Authorization": "Bearer good-token"}
+        first = client.get("/yahoo/leagues/1.l.2/rosters", headers=headers)
+        second = client.get("/yahoo/leagues/1.l.2/rosters", headers=headers)
+        assert first.status_code == status.HTTP_200_OK
+        assert first.json() == second.json()
+        assert first.json()["rosters"][0]["players"][0]["name"] == "Example Player"
+        assert calls == ["/fantasy/v2/league/1.l.2/teams/roster"]
+    
     def test_scoring_profiles_endpoint(self, client, db_session):
         """Test the scoring profiles endpoint."""
         response = client.get("/fantasy/profiles")
@@ -92,6 +152,66 @@ class TestFantasyEndpoints:
         assert "description" in profile
         assert "created_at" in profile
     
+    def test_get_and_export_scoring_profile_include_rules(self, client, db_session):
+        """Single-profile reads load the rules eagerly with the profile."""
+        response = client.get("/fantasy/profiles/fixture-ppr")
+        assert response.status_code == status.HTTP_200_OK
+        assert [rule["stat_key"] for rule in response.json()["rules"]] == ["receptions"]
+
+        exported = client.get("/fantasy/profiles/fixture-ppr/export")
+        assert exported.status_code == status.HTTP_200_OK
+        assert exported.json()["rules"][0]["multiplier"] == 1.0
+
+    def test_profile_reads_are_cached_until_profile_update(self, client, db_session):
+        """Cached profile bodies are replaced once the profile is edited."""
+        listed = client.get("/fantasy/profiles")
+        assert client.get(
+            "/fantasy/profiles", headers={"If-None-Match": listed.headers["etag"]}
+        ).status_code == status.HTTP_304_NOT_MODIFIED
+        assert client.get("/fantasy/profiles/fixture-ppr").json()["name"] == "Fixture PPR"
+
+        updated = client.put("/fantasy/profiles/fixture-ppr", json={
+            "name": "Fixture Half PPR",
+            "description": "Test scoring profile",
+            "is_public": True,
+            "rules": [{"stat_key": "receptions", "multiplier": 0.5, "per": 1.0}],
+        })
+        assert updated.status_code == status.HTTP_200_OK
+
+        assert client.get("/fantasy/profiles/fixture-ppr").json()["name"] == "Fixture Half PPR"
+        relisted = client.get("/fantasy/profiles")
+        assert relisted.headers["etag"] != listed.headers["etag"]
+        profile = next(p for p in relisted.json()["profiles"] if p["profile_id"] == "fixture-ppr")
+        assert profile["rules"][0]["multiplier"] == 0.5
+
+    async def test_profile_rules_read_during_update_stay_under_old_generation(self, db_session, monkeypatch):
+        """Rules loaded while an update bumps the generation are not cached under the new one."""
+        execute = db_session.execute
+
+        async def execute_then_bump(*args, **kwargs):
+            result = await execute(*args, **kwargs)
+            profile_generations.bump("fixture-ppr")
+            return result
+
+        monkeypatch.setattr(db_session, "execute", execute_then_bump)
+        before = profile_generations.get("fixture-ppr")
+        assert await get_profile_rules(db_session, "fixture-ppr") is not None
+        assert cached_profile_rules("fixture-ppr", before) is not None
+        assert cached_profile_rules("fixture-ppr", profile_generations.get("fixture-ppr")) is None
+
+    def test_profile_write_errors_keep_their_status(self, client, db_session):
+        """A missing profile is a 404 and a duplicate name a 409, not a generic 500."""
+        payload = {
+            "name": "Fixture PPR",
+            "description": "Duplicate name",
+            "is_public": True,
+            "rules": [{"stat_key": "receptions", "multiplier": 1.0, "per": 1.0}],
+        }
+
+        assert client.put("/fantasy/profiles/missing-profile", json=payload).status_code == status.HTTP_404_NOT_FOUND
+        assert client.delete("/fantasy/profiles/missing-profile").status_code == status.HTTP_404_NOT_FOUND
+        assert client.post("/fantasy/profiles", json=payload).status_code == status.HTTP_409_CONFLICT
+
     def test_calculate_points_endpoint(self, client, db_session, sample_scoring_rules):
         """Test the points calculation endpoint."""
         # This test requires a more complex setup that we'll implement later
@@ -106,6 +226,312 @@ class TestFantasyEndpoints:
         # Should return 404 since player doesn't exist
         assert response.status_code == 404
     
+    async def test_calculate_points_scores_week_stats(self, client, db_session):
+        """Points are computed from the week's stats and the profile's rules."""
+        await db_session.execute(
+            insert(PlayerWeekStat),
+            [
+                {"player_id": "fixture-wr-1", "season": 2025, "week": 3, "stat_key": "receptions", "stat_value": 7.0},
+                {"player_id": "fixture-wr-1", "season": 2025, "week": 3, "stat_key": "receiving_yards", "stat_value": 88.0},
+            ],
+        )
+
+        response = client.get("/fantasy/points", params={
+            "player_id": "fixture-wr-1",
+            "season": 2025,
+            "week": 3,
+            "profile_id": "fixture-ppr",
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["points"] == 7.0
+        assert data["profile_name"] == "Fixture PPR"
+        assert data["stats"] == {"receptions": 7.0, "receiving_yards": 88.0}
+
+        # The second request is served from the response cache.
+        cached = client.get("/fantasy/points", params={
+            "player_id": "fixture-wr-1",
+            "season": 2025,
+            "week": 3,
+            "profile_id": "fixture-ppr",
+        })
+        assert cached.json() == data
+        assert cached.headers["etag"] == response.headers["etag"]
+        revalidated = client.get("/fantasy/points", params={
+            "player_id": "fixture-wr-1",
+            "season": 2025,
+            "week": 3,
+            "profile_id": "fixture-ppr",
+        }, headers={"If-None-Match": response.headers["etag"]})
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+
+        # Reads never write points; once the ingest has materialized the
+        # week and the in-memory response cache is gone, requests read them.
+        stored_points = select(PlayerWeekPoints.points).where(
+            PlayerWeekPoints.player_id == "fixture-wr-1",
+            PlayerWeekPoints.season == 2025,
+            PlayerWeekPoints.week == 3,
+            PlayerWeekPoints.profile_id == "fixture-ppr",
+        )
+        assert await db_session.scalar(stored_points) is None
+        assert await materialize_week_points(db_session, 2025, [3]) == 1
+        assert await db_session.scalar(stored_points) == 7.0
+        await db_session.execute(
+            update(PlayerWeekPoints)
+            .where(PlayerWeekPoints.player_id == "fixture-wr-1")
+            .values(points=42.0)
+        )
+        fantasy._points_response_cache.clear()
+        materialized = client.get("/fantasy/points", params={
+            "player_id": "fixture-wr-1",
+            "season": 2025,
+            "week": 3,
+            "profile_id": "fixture-ppr",
+        })
+        assert materialized.json()["points"] == 42.0
+
+        response = client.get("/fantasy/points", params={
+            "player_id": "fixture-wr-1",
+            "season": 2025,
+            "week": 3,
+            "profile_id": "missing-profile",
+        })
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+    
+    async def test_leaderboard_scores_each_player_from_one_stats_query(self, client, db_session):
+        """Leaderboard rows carry each player's own stat line and points."""
+        await db_session.execute(
+            insert(PlayerWeekStat),
+            [
+                {"player_id": "fixture-wr-1", "season": 2023, "week": 1, "stat_key": "receptions", "stat_value": 4.0},
+                {"player_id": "fixture-wr-1", "season": 2023, "week": 2, "stat_key": "receptions", "stat_value": 2.0},
+                {"player_id": "fixture-wr-2", "season": 2023, "week": 1, "stat_key": "receptions", "stat_value": 8.0},
+            ],
+        )
+
+        weekly = client.get("/fantasy/points/leaderboard", params={
+            "season": 2023, "week": 1, "profile_id": "fixture-ppr",
+        })
+        season_totals = client.get("/fantasy/points/leaderboard", params={
+            "season": 2023, "profile_id": "fixture-ppr",
+        })
+
+        assert weekly.status_code == status.HTTP_200_OK
+        assert [
+            (row["player_id"], row["fantasy_points"], row["stats"]) for row in weekly.json()["leaderboard"]
+        ] == [("fixture-wr-2", 8.0, {"receptions": 8.0}), ("fixture-wr-1", 4.0, {"receptions": 4.0})]
+        assert {
+            row["player_id"]: row["fantasy_points"] for row in season_totals.json()["leaderboard"]
+        } == {"fixture-wr-1": 6.0, "fixture-wr-2": 8.0}
+
+    async def test_leaderboard_pages_by_fantasy_points(self, client, db_session):
+        """The page limit applies after scoring, not to raw stat totals."""
+        await db_session.execute(
+            insert(PlayerWeekStat),
+            [
+                {"player_id": "fixture-wr-1", "season": 2023, "week": 4, "stat_key": "receptions", "stat_value": 1.0},
+                {"player_id": "fixture-wr-1", "season": 2023, "week": 4, "stat_key": "receiving_yards", "stat_value": 200.0},
+                {"player_id": "fixture-wr-2", "season": 2023, "week": 4, "stat_key": "receptions", "stat_value": 5.0},
+            ],
+        )
+        params = {"season": 2023, "week": 4, "profile_id": "fixture-ppr", "limit": 1}
+
+        top = client.get("/fantasy/points/leaderboard", params=params).json()["leaderboard"]
+        assert [(row["player_id"], row["fantasy_points"]) for row in top] == [("fixture-wr-2", 5.0)]
+
+        # A bonus for a zero stat is scored for every player in Python instead.
+        await db_session.execute(insert(ScoringRule).values(
+            rule_id="fixture-no-fumbles", profile_id="fixture-ppr", stat_key="fumbles_lost",
+            multiplier=0.0, per=1.0, bonus_min=0.0, bonus_max=0.0, bonus_points=2.0,
+        ))
+        fantasy.profile_generations.bump("fixture-ppr")
+        fantasy._leaderboard_cache.clear()
+        top = client.get("/fantasy/points/leaderboard", params=params).json()["leaderboard"]
+        assert [(row["player_id"], row["fantasy_points"]) for row in top] == [("fixture-wr-2", 7.0)]
+
+    async def test_leaderboard_reads_materialized_week_points(self, client, db_session):
+        """Weeks precomputed after a stats load are ranked from player_week_points."""
+        await db_session.execute(
+            insert(PlayerWeekStat),
+            [
+                {"player_id": "fixture-wr-1", "season": 2023, "week": 6, "stat_key": "receptions", "stat_value": 9.0},
+                {"player_id": "fixture-wr-2", "season": 2023, "week": 6, "stat_key": "receptions", "stat_value": 2.0},
+                {"player_id": "fixture-wr-2", "season": 2023, "week": 6, "stat_key": "receiving_yards", "stat_value": 30.0},
+            ],
+        )
+        assert await materialize_week_points(db_session, 2023, [6]) == 1
+        stored = (await db_session.execute(
+            select(PlayerWeekPoints.player_id, PlayerWeekPoints.points)
+            .where(PlayerWeekPoints.season == 2023, PlayerWeekPoints.week == 6)
+        )).all()
+        assert sorted(stored) == [("fixture-wr-1", 9.0), ("fixture-wr-2", 2.0)]
+
+        # Prove the endpoint ranks the stored rows rather than rescoring, and
+        # rounds them with Python's rule like live-scored points.
+        await db_session.execute(
+            update(PlayerWeekPoints).where(PlayerWeekPoints.player_id == "fixture-wr-2").values(points=20.015)
+        )
+        response = client.get("/fantasy/points/leaderboard", params={
+            "season": 2023, "week": 6, "profile_id": "fixture-ppr",
+        })
+        assert [
+            (row["player_id"], row["fantasy_points"], row["stats"]) for row in response.json()["leaderboard"]
+        ] == [
+            ("fixture-wr-2", round(20.015, 2), {"receptions": 2.0, "receiving_yards": 30.0}),
+            ("fixture-wr-1", 9.0, {"receptions": 9.0}),
+        ]
+
+    async def test_season_leaderboard_reads_trigger_maintained_totals(self, client, db_session):
+        """Season totals follow week inserts, updates and deletes."""
+        await db_session.execute(
+            insert(PlayerWeekStat),
+            [
+                {"player_id": "fixture-wr-1", "season": 2020, "week": 1, "stat_key": "receptions", "stat_value": 4.0},
+                {"player_id": "fixture-wr-1", "season": 2020, "week": 2, "stat_key": "receptions", "stat_value": 7.0},
+                {"player_id": "fixture-wr-1", "season": 2020, "week": 3, "stat_key": "receptions", "stat_value": 2.0},
+                {"player_id": "fixture-wr-2", "season": 2020, "week": 1, "stat_key": "receptions", "stat_value": 10.0},
+            ],
+        )
+        await db_session.execute(
+            update(PlayerWeekStat)
+            .where(PlayerWeekStat.player_id == "fixture-wr-1", PlayerWeekStat.week == 2)
+            .values(stat_value=9.0)
+        )
+        await db_session.execute(
+            delete(PlayerWeekStat).where(PlayerWeekStat.player_id == "fixture-wr-1", PlayerWeekStat.week == 3)
+        )
+
+        totals = (await db_session.execute(
+            select(PlayerSeasonStat.player_id, PlayerSeasonStat.total, PlayerSeasonStat.games, PlayerSeasonStat.high)
+            .where(PlayerSeasonStat.season == 2020)
+        )).all()
+        assert sorted(totals) == [("fixture-wr-1", 13.0, 2, 9.0), ("fixture-wr-2", 10.0, 1, 10.0)]
+
+        response = client.get("/fantasy/points/leaderboard", params={"season": 2020, "profile_id": "fixture-ppr"})
+        assert [
+            (row["player_id"], row["fantasy_points"]) for row in response.json()["leaderboard"]
+        ] == [("fixture-wr-1", 13.0), ("fixture-wr-2", 10.0)]
+
+    async def test_leaderboard_serves_stale_body_when_database_fails(self, client, db_session, monkeypatch):
+        """A cached leaderboard outlives a stats reload if rebuilding it fails."""
+        await db_session.execute(
+            insert(PlayerWeekStat),
+            [{"player_id": "fixture-wr-1", "season": 2023, "week": 5, "stat_key": "receptions", "stat_value": 6.0}],
+        )
+        params = {"season": 2023, "week": 5, "profile_id": "fixture-ppr"}
+        first = client.get("/fantasy/points/leaderboard", params=params)
+        assert first.status_code == status.HTTP_200_OK
+        assert first.headers["cache-control"] == "no-cache"
+
+        async def database_down(db, profile_id):
+            raise OperationalError("SELECT", {}, sqlite3.OperationalError("database is locked"))
+
+        monkeypatch.setattr(fantasy, "get_profile_rules", database_down)
+        assert client.get("/fantasy/points/leaderboard", params=params).json() == first.json()
+
+        fantasy.stats_generations.bump((2023, 5))
+        stale = client.get("/fantasy/points/leaderboard", params=params)
+        assert stale.status_code == status.HTTP_200_OK
+        assert stale.json() == first.json()
+        assert stale.headers["cache-control"] == "no-cache"
+
+    async def test_batch_points_reads_all_players_stats_together(self, client, db_session):
+        """The multi-player batch keeps per-player stat lines and reports missing players."""
+        await db_session.execute(
+            insert(PlayerWeekStat),
+            [
+                {"player_id": "fixture-wr-1", "season": 2022, "week": 1, "stat_key": "receptions", "stat_value": 3.0},
+                {"player_id": "fixture-wr-1", "season": 2022, "week": 2, "stat_key": "receptions", "stat_value": 5.0},
+            ],
+        )
+
+        response = client.post("/fantasy/points/batch", json={
+            "player_ids": ["fixture-wr-1", "fixture-wr-2", "no-such-player"],
+            "season": 2022,
+            "profile_id": "fixture-ppr",
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json()["results"]
+        assert results[0]["fantasy_points"] == 8.0
+        assert results[0]["stats"] == {"receptions": 8.0}
+        assert results[1]["error"] == "No stats available"
+        assert results[2]["error"] == "Player not found"
+
+    async def test_batch_points_chunks_player_ids(self, client, db_session, monkeypatch):
+        """Long id lists are queried in chunks and an empty list short-circuits."""
+        await db_session.execute(
+            insert(PlayerWeekStat),
+            [
+                {"player_id": "fixture-wr-1", "season": 2022, "week": 1, "stat_key": "receptions", "stat_value": 3.0},
+                {"player_id": "fixture-wr-2", "season": 2022, "week": 1, "stat_key": "receptions", "stat_value": 4.0},
+            ],
+        )
+        monkeypatch.setattr(fantasy, "_IN_CHUNK_SIZE", 1)
+
+        response = client.post("/fantasy/points/batch", json={
+            "player_ids": ["fixture-wr-1", "fixture-wr-2", "fixture-wr-1"],
+            "season": 2022,
+            "profile_id": "fixture-ppr",
+        })
+        assert [row["fantasy_points"] for row in response.json()["results"]] == [3.0, 4.0, 3.0]
+
+        empty = client.post("/fantasy/points/batch", json={
+            "player_ids": [], "season": 2022, "profile_id": "fixture-ppr",
+        })
+        assert empty.status_code == status.HTTP_200_OK
+        assert empty.json()["results"] == []
+    
+    async def test_batch_week_points_scores_each_entry(self, client, db_session):
+        """The weekly batch endpoint scores every requested player-week."""
+        await db_session.execute(
+            insert(PlayerWeekStat),
+            [
+                {"player_id": "fixture-wr-1", "season": 2025, "week": 1, "stat_key": "receptions", "stat_value": 5.0},
+                {"player_id": "fixture-wr-1", "season": 2025, "week": 2, "stat_key": "receptions", "stat_value": 9.0},
+                {"player_id": "fixture-wr-2", "season": 2025, "week": 1, "stat_key": "receptions", "stat_value": 3.0},
+            ],
+        )
+
+        response = client.post("/fantasy/points/batch/weeks", json={
+            "profile_id": "fixture-ppr",
+            "entries": [
+                {"player_id": "fixture-wr-1", "season": 2025, "week": 1},
+                {"player_id": "fixture-wr-1", "season": 2025, "week": 2},
+                {"player_id": "fixture-wr-2", "season": 2025, "week": 1},
+                {"player_id": "fixture-wr-2", "season": 2025, "week": 2},
+            ],
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["profile_name"] == "Fixture PPR"
+        assert [row["fantasy_points"] for row in data["results"]] == [5.0, 9.0, 3.0, 0.0]
+    
+    async def test_player_week_stats_support_conditional_requests(self, client, db_session):
+        """Finished-season stats are cacheable and revalidate by ETag."""
+        await db_session.execute(
+            insert(PlayerWeekStat).values(
+                player_id="fixture-wr-2", season=2024, week=5, stat_key="receptions", stat_value=4.0
+            )
+        )
+
+        response = client.get("/fantasy/players/fixture-wr-2/stats", params={"season": 2024, "week": 5})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["stats"] == {"receptions": 4.0}
+        assert "immutable" in response.headers["cache-control"]
+        etag = response.headers["etag"]
+
+        revalidated = client.get(
+            "/fantasy/players/fixture-wr-2/stats",
+            params={"season": 2024, "week": 5},
+            headers={"If-None-Match": etag},
+        )
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+        assert revalidated.headers["etag"] == etag
+    
     def test_calculate_points_invalid_params(self, client):
         """Test points calculation with invalid parameters."""
         # Test with invalid season
@@ -162,6 +588,11 @@ class TestPlayerEndpoints:
         assert "KC" in teams  # Kansas City Chiefs
         assert "SF" in teams  # San Francisco 49ers
         assert "BUF" in teams  # Buffalo Bills
+
+        assert response.headers["cache-control"] == "public, max-age=86400, immutable"
+        assert client.get(
+            "/players/teams", headers={"If-None-Match": response.headers["etag"]}
+        ).status_code == status.HTTP_304_NOT_MODIFIED
     
     def test_player_search_endpoint(self, client, db_session, sample_player):
         """Test the player search endpoint."""
@@ -186,6 +617,24 @@ class TestPlayerEndpoints:
         for player in data:
             assert player["position"] == "QB"
     
+    def test_player_search_cache_ignores_query_case(self, client, db_session):
+        """Typeahead searches differing only in case share one cached result."""
+        first = client.get("/players/", params={"q": "fixture receiver"})
+        second = client.get("/players/", params={"q": "FIXTURE Receiver"})
+        assert first.status_code == status.HTTP_200_OK
+        assert [p["player_id"] for p in first.json()] == ["fixture-wr-1", "fixture-wr-2"]
+        assert second.json() == first.json()
+        assert len(nflverse._search_cache._entries) == 1
+    
+    async def test_player_search_matches_name_substrings(self, client, db_session):
+        """Indexed (3+ characters) and short searches both match inside names."""
+        db_session.add(Player(player_id="fixture-rb", full_name='Fixture "Back" Runner', position="RB"))
+        await db_session.flush()
+
+        assert [p["player_id"] for p in client.get("/players/", params={"q": "EIVER TW"}).json()] == ["fixture-wr-2"]
+        assert [p["player_id"] for p in client.get("/players/", params={"q": '"back"'}).json()] == ["fixture-rb"]
+        assert [p["player_id"] for p in client.get("/players/", params={"q": "Tw"}).json()] == ["fixture-wr-2"]
+
     def test_player_search_by_team(self, client, db_session, sample_player):
         """Test player search filtered by team."""
         # Test search by team with no players in database
@@ -205,7 +654,105 @@ class TestPlayerEndpoints:
         # There are players in the database, so we should get results
         assert len(data) > 0
         assert len(data) <= 5  # Should respect the limit
-    
+
+    def test_player_literal_routes_registered_once_before_player_id(self):
+        """/positions and /teams must not be duplicated or shadowed by /{player_id}."""
+        paths = [route.path for route in players.router.routes]
+
+        assert paths.count("/players/positions") == 1
+        assert paths.count("/players/teams") == 1
+        assert paths.index("/players/positions") < paths.index("/players/{player_id}")
+        assert paths.index("/players/teams") < paths.index("/players/{player_id}")
+
+    async def test_player_season_stats_grouped_by_week(self, client, db_session):
+        """Season stats come back as one stat dictionary per week."""
+        await db_session.execute(
+            insert(PlayerWeekStat),
+            [
+                {"player_id": "fixture-wr-1", "season": 2021, "week": 2, "stat_key": "receptions", "stat_value": 3.0},
+                {"player_id": "fixture-wr-1", "season": 2021, "week": 1, "stat_key": "receptions", "stat_value": 5.0},
+                {"player_id": "fixture-wr-1", "season": 2021, "week": 1, "stat_key": "receiving_yards", "stat_value": 61.0},
+            ],
+        )
+
+        response = client.get("/players/fixture-wr-1/season/2021")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["weekly_stats"] == {
+            "1": {"receiving_yards": 61.0, "receptions": 5.0},
+            "2": {"receptions": 3.0},
+        }
+
+    async def test_player_summary_ranks_within_position(self, client, db_session):
+        """The summary scores the season and ranks it against the position."""
+        await db_session.execute(
+            insert(PlayerWeekStat),
+            [
+                {"player_id": "fixture-wr-1", "season": 2021, "week": 1, "stat_key": "receptions", "stat_value": 5.0},
+                {"player_id": "fixture-wr-1", "season": 2021, "week": 2, "stat_key": "receptions", "stat_value": 3.0},
+                {"player_id": "fixture-wr-2", "season": 2021, "week": 1, "stat_key": "receptions", "stat_value": 6.0},
+                {"player_id": "fixture-wr-2", "season": 2021, "week": 2, "stat_key": "receptions", "stat_value": 4.0},
+                {"player_id": "fixture-qb", "season": 2021, "week": 1, "stat_key": "receptions", "stat_value": 20.0},
+            ],
+        )
+
+        response = client.get(
+            "/players/fixture-wr-1/summary", params={"season": 2021, "profile_id": "fixture-ppr"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["fantasy_points"] == 8.0
+        assert data["position_ranking"] == 2
+        assert [(w["week"], w["fantasy_points"]) for w in data["weekly_sparkline"]] == [(1, 5.0), (2, 3.0)]
+        assert data["season_stats"]["receptions"] == {"total": 8.0, "high": 5.0, "games": 2, "avg": 4.0}
+        assert data["total_games"] == 2
+
+        # A bonus for a zero stat is ranked in Python instead of SQL.
+        await db_session.execute(insert(ScoringRule).values(
+            rule_id="fixture-no-fumbles", profile_id="fixture-ppr", stat_key="fumbles_lost",
+            multiplier=0.0, per=1.0, bonus_min=0.0, bonus_max=0.0, bonus_points=2.0,
+        ))
+        fantasy.profile_generations.bump("fixture-ppr")
+        data = client.get(
+            "/players/fixture-wr-1/summary", params={"season": 2021, "profile_id": "fixture-ppr"}
+        ).json()
+        assert (data["fantasy_points"], data["position_ranking"]) == (10.0, 2)
+
+    def test_player_stat_reads_distinguish_unknown_player_from_no_stats(self, client, db_session):
+        """A known player without stats is an empty result; an unknown one is a 404."""
+        weekly = client.get("/players/fixture-wr-1/stats", params={"season": 2021, "week": 1})
+        assert weekly.status_code == status.HTTP_200_OK
+        assert weekly.json()["player"]["full_name"] == "Fixture Receiver One"
+        assert weekly.json()["stats"] == {}
+        assert client.get("/players/fixture-wr-1/season/2021").json()["weekly_stats"] == {}
+
+        assert client.get(
+            "/players/no-such-player/stats", params={"season": 2021, "week": 1}
+        ).status_code == status.HTTP_404_NOT_FOUND
+        assert client.get("/players/no-such-player/season/2021").status_code == status.HTTP_404_NOT_FOUND
+
+    def test_player_reads_revalidate_with_etags(self, client, db_session):
+        """Player and stat reads carry an ETag and answer a matching If-None-Match with 304."""
+        for path in ("/players/fixture-wr-1", "/players/fixture-wr-1/season/2021"):
+            response = client.get(path)
+            assert response.status_code == status.HTTP_200_OK
+            cached = client.get(path, headers={"If-None-Match": response.headers["etag"]})
+            assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+            assert cached.content == b""
+            assert response.headers["cache-control"] == "public, max-age=300"
+
+    def test_player_search_reuses_recent_results(self, client, db_session, monkeypatch):
+        """Identical searches within the TTL are answered without querying again."""
+        first = client.get("/players/", params={"q": "Fixture", "position": "WR"})
+        assert [p["player_id"] for p in first.json()] == ["fixture-wr-1", "fixture-wr-2"]
+
+        async def fail_execute(*args, **kwargs):
+            raise AssertionError("search should have been cached")
+
+        monkeypatch.setattr(db_session, "execute", fail_execute)
+        assert client.get("/players/", params={"q": "Fixture", "position": "WR"}).json() == first.json()
+
     def test_player_search_no_results(self, client):
         """Test player search with no matching results."""
         response = client.get("/players/", params={"q": "NonexistentPlayer"})
@@ -224,6 +771,14 @@ class TestPlayerEndpoints:
         assert "detail" in data
         assert "not found" in data["detail"].lower()
     
+    def test_get_player_by_id_returns_schema_fields(self, client, db_session):
+        """A found player carries every field the Player schema documents."""
+        response = client.get("/players/fixture-wr-1")
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert set(data) == set(PlayerSchema.model_fields)
+        assert (data["full_name"], data["team"]) == ("Fixture Receiver One", "KC")
+    
     def test_get_player_by_id_not_found(self, client):
         """Test getting a player that doesn't exist."""
         response = client.get("/players/nonexistent-id")
@@ -0,0 +1,40 @@
+from app import cache
+from app.cache import Generations, TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    profiles = TTLCache(maxsize=4, ttl=10)
+    profiles.set("ppr", ("PPR", ()))
+
+    now[0] = 109.0
+    assert profiles.get("ppr") == ("PPR", ())
+    now[0] = 110.0
+    assert profiles.get("ppr") is None
+    assert len(profiles) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    profiles = TTLCache(maxsize=2, ttl=60)
+    profiles.set("a", 1)
+    profiles.set("b", 2)
+    assert profiles.get("a") == 1
+
+    profiles.set("c", 3)
+
+    assert profiles.get("b") is None
+    assert profiles.get("a") == 1
+    assert profiles.get("c") == 3
+    profiles.pop("a")
+    assert profiles.get("a", "missing") == "missing"
+
+
+def test_generations_change_only_the_bumped_key():
+    generations = Generations()
+    assert generations.get((2025, 3)) == 0
+
+    generations.bump((2025, 3))
+
+    assert generations.get((2025, 3)) == 1
+    assert generations.get((2025, 4)) == 0
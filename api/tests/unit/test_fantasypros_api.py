@@ -1,19 +1,14 @@
 import pytest
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-from app.models import ApiResponseCache, Base
+from app.models import ApiResponseCache
 from app.services import fantasypros_api
 from app.services.fantasypros_api import FantasyProsAPIError, FantasyProsClient
 from app.services.fantasypros_projections import _parse_player
 
 
 @pytest.mark.asyncio
-async def test_fantasypros_client_persists_and_reuses_cache(monkeypatch):
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
-    async with engine.begin() as connection:
-        await connection.run_sync(Base.metadata.create_all)
-    sessions = async_sessionmaker(engine, expire_on_commit=False)
-    monkeypatch.setattr(fantasypros_api, "SessionLocal", sessions)
+async def test_fantasypros_client_persists_and_reuses_cache(monkeypatch, db_sessions):
+    monkeypatch.setattr(fantasypros_api, "SessionLocal", db_sessions)
     calls = []
 
     def fake_request(url, api_key):
@@ -32,16 +27,11 @@ async def test_fantasypros_client_persists_and_reuses_cache(monkeypatch):
     assert second.response_headers["x-ratelimit-remaining"] == "49"
     assert len(calls) == 1
     assert "test-key" not in calls[0][0]
-    await engine.dispose()
 
 
 @pytest.mark.asyncio
-async def test_fantasypros_client_serves_stale_on_provider_failure(monkeypatch):
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
-    async with engine.begin() as connection:
-        await connection.run_sync(Base.metadata.create_all)
-    sessions = async_sessionmaker(engine, expire_on_commit=False)
-    monkeypatch.setattr(fantasypros_api, "SessionLocal", sessions)
+async def test_fantasypros_client_serves_stale_on_provider_failure(monkeypatch, db_sessions):
+    monkeypatch.setattr(fantasypros_api, "SessionLocal", db_sessions)
     monkeypatch.setattr(
         fantasypros_api, "_request_json",
         lambda *_: ({"players": [{"name": "Stale Player"}]}, 200, {}),
@@ -57,7 +47,6 @@ async def test_fantasypros_client_serves_stale_on_provider_failure(monkeypatch):
 
     assert stale.cache_status == "stale"
     assert stale.data["players"][0]["name"] == "Stale Player"
-    await engine.dispose()
 
 
 def test_parse_fantasypros_projection_maps_full_stat_line():
@@ -120,3 +120,52 @@ def test_ingest_news_stores_scored_items_and_is_idempotent():
     assert first["loaded"] == 1
     assert second["loaded"] == 0
     assert second["skipped_duplicate"] == 1
+
+
+def test_bulk_upsert_news_keeps_fts_in_sync():
+    import asyncio
+
+    from app.db import create_news_fts_triggers
+    from app.models import Base
+    from app.services.news import bulk_upsert_news
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    def record(news_id, title):
+        return {
+            "news_id": news_id, "published_at": 0, "source": "espn", "url": f"https://x/{news_id}",
+            "title": title, "summary": "summary", "story": None, "players": {},
+            "dedupe_hash": news_id, "created_at": 0,
+        }
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(text(
+                "CREATE VIRTUAL TABLE news_items_fts USING fts5(title, summary, content='news_items', content_rowid='rowid')"
+            ))
+            await create_news_fts_triggers(conn)
+
+        async with async_sessionmaker(engine)() as s:
+            # The first batch fills an empty table and goes through one rebuild;
+            # the small follow-up is indexed row by row by the triggers.
+            filler = [record(f"filler-{i}", "Filler news") for i in range(8)]
+            await bulk_upsert_news(s, [record("a", "Alpha news"), record("b", "Bravo news"), *filler])
+            await bulk_upsert_news(s, [record("a", "Charlie news")])
+            await s.commit()
+
+            def match(term):
+                return s.execute(text("SELECT rowid FROM news_items_fts WHERE news_items_fts MATCH :t"), {"t": term})
+
+            counts = [len((await match(term)).all()) for term in ("alpha", "bravo", "charlie")]
+            triggers = (await s.execute(text(
+                "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'news_items_a%'"
+            ))).scalar()
+
+        await engine.dispose()
+        return counts, triggers
+
+    counts, triggers = asyncio.run(run())
+    assert counts == [0, 1, 1]
+    assert triggers == 3
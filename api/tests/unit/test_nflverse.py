@@ -0,0 +1,159 @@
+import ast
+import inspect
+from collections import Counter
+
+import polars as pl
+import pytest
+from app.models import Player, PlayerSeasonStat, PlayerWeekStat
+from app.services import nflverse
+from app.services.nfl_data_provider import NFLReadPyProvider
+from app.services.nflverse import (
+    _first,
+    get_player_stats,
+    get_stats_for_players,
+    ingest_weekly_stats,
+    search_players,
+    seed_players_and_ids,
+)
+from sqlalchemy import select
+
+
+class FakeProvider:
+    def __init__(self, records):
+        self._records = records
+
+    def load_players(self):
+        return self._records
+
+    def load_weekly_stats(self, seasons, columns=None):
+        return self._records
+
+
+def test_first_skips_missing_values_but_keeps_zero():
+    record = {"a": None, "b": float("nan"), "c": " nan ", "d": "", "e": 0, "f": "KC"}
+
+    assert _first(record, "a", "b", "c", "d", "e") == 0
+    assert _first(record, "a", "b", "c", "d", "f") == "KC"
+    assert _first(record, "a", "b", "c", "missing") is None
+
+
+@pytest.mark.asyncio
+async def test_seed_upserts_players_and_keeps_matched_ids(db_session):
+    db_session.add(
+        Player(
+            player_id="00-0001", full_name="Old Name", position="WR", team="KC",
+            yahoo_id="y-1", espn_id="e-1",
+        )
+    )
+    await db_session.flush()
+
+    count = await seed_players_and_ids(
+        provider=FakeProvider([
+            {"gsis_id": "00-0001", "display_name": "New Name", "position": "WR", "latest_team": "BUF", "yahoo_id": "y-other"},
+            {"gsis_id": "00-0002", "display_name": "Rookie", "position": "RB", "espn_id": "e-2", "last_season": 2026},
+            {"gsis_id": None, "display_name": "No Id"},
+        ]),
+        session=db_session,
+    )
+
+    assert count == 2 + 32
+    players = {
+        player.player_id: player
+        for player in (await db_session.execute(
+            select(Player).where(Player.player_id.in_(["00-0001", "00-0002", "def-KC"]))
+            .execution_options(populate_existing=True)
+        )).scalars()
+    }
+    assert (players["00-0001"].full_name, players["00-0001"].team) == ("New Name", "BUF")
+    assert (players["00-0001"].yahoo_id, players["00-0001"].espn_id) == ("y-1", "e-1")
+    assert (players["00-0002"].espn_id, players["00-0002"].last_season) == ("e-2", 2026)
+    assert players["def-KC"].full_name == "Kansas City Chiefs D/ST"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [10_000, 1])
+async def test_ingest_bulk_inserts_new_stats_and_skips_stored_ones(db_session, monkeypatch, chunk_size):
+    monkeypatch.setattr(nflverse, "_INSERT_CHUNK_SIZE", chunk_size)
+    provider = FakeProvider([
+        {"player_id": "fixture-wr-1", "season": 2024, "week": 1, "receptions": 6, "receiving_yards": 71.0, "targets": 0},
+        {"player_id": "fixture-wr-1", "season": 2024, "week": 2, "receptions": 3, "receiving_yards": None, "targets": float("nan")},
+        {"player_id": "fixture-wr-2", "season": 2023, "week": 1, "receptions": 9},
+    ])
+
+    assert await ingest_weekly_stats([2024], provider=provider, session=db_session) == {2024: 3}
+    assert await ingest_weekly_stats([2024], provider=provider, session=db_session) == {2024: 0}
+
+    rows = (await db_session.execute(
+        select(PlayerWeekStat.week, PlayerWeekStat.stat_key, PlayerWeekStat.stat_value)
+        .where(PlayerWeekStat.player_id == "fixture-wr-1", PlayerWeekStat.season == 2024)
+        .order_by(PlayerWeekStat.week, PlayerWeekStat.stat_key)
+    )).all()
+    assert rows == [(1, "receiving_yards", 71.0), (1, "receptions", 6.0), (2, "receptions", 3.0)]
+    totals = (await db_session.execute(
+        select(PlayerSeasonStat.stat_key, PlayerSeasonStat.total, PlayerSeasonStat.games, PlayerSeasonStat.high)
+        .where(PlayerSeasonStat.player_id == "fixture-wr-1", PlayerSeasonStat.season == 2024)
+        .order_by(PlayerSeasonStat.stat_key)
+    )).all()
+    assert totals == [("receiving_yards", 71.0, 1, 71.0), ("receptions", 9.0, 2, 6.0)]
+
+
+@pytest.mark.asyncio
+async def test_stats_for_players_groups_one_query_by_player(db_session):
+    db_session.add_all([
+        PlayerWeekStat(player_id="fixture-wr-1", season=2024, week=3, stat_key="receptions", stat_value=5),
+        PlayerWeekStat(player_id="fixture-wr-1", season=2024, week=3, stat_key="receiving_yards", stat_value=64),
+        PlayerWeekStat(player_id="fixture-wr-2", season=2024, week=3, stat_key="receptions", stat_value=2),
+        PlayerWeekStat(player_id="fixture-wr-2", season=2024, week=4, stat_key="receptions", stat_value=8),
+    ])
+    await db_session.flush()
+
+    stats = await get_stats_for_players(
+        ["fixture-wr-1", "fixture-wr-2", "fixture-qb"], 2024, 3, session=db_session
+    )
+
+    assert stats == {
+        "fixture-wr-1": {"receptions": 5, "receiving_yards": 64},
+        "fixture-wr-2": {"receptions": 2},
+    }
+    assert await get_player_stats("fixture-wr-2", 2024, 3, session=db_session) == {"receptions": 2}
+    assert await get_player_stats("fixture-qb", 2024, 3, session=db_session) is None
+
+
+@pytest.mark.asyncio
+async def test_search_results_do_not_share_rows_with_the_cache(db_session):
+    """Editing a returned player must not change what the next cached search returns."""
+    first = await search_players("Fixture", position="WR", session=db_session)
+    first[0]["full_name"] = "Edited"
+
+    again = await search_players("Fixture", position="WR", session=db_session)
+    assert again[0]["full_name"] == "Fixture Receiver One"
+
+
+def test_provider_reuses_cached_parquet_until_stale(tmp_path):
+    provider = NFLReadPyProvider(cache_dir=tmp_path)
+    downloads = []
+
+    def download():
+        downloads.append(1)
+        return pl.DataFrame({"gsis_id": ["00-0001"], "height": [float("nan")]})
+
+    first = provider._cached_frame("players", (), download, ttl=60)
+    again = provider._cached_frame("players", (), download, ttl=60)
+    provider._cached_frame("players", (), download, ttl=0)
+
+    assert len(downloads) == 2
+    assert again.equals(first)
+    assert provider._records(again) == [{"gsis_id": "00-0001", "height": None}]
+    assert provider._records(again, columns=("gsis_id", "week")) == [{"gsis_id": "00-0001"}]
+    assert [path.suffix for path in tmp_path.iterdir()] == [".parquet"]
+
+
+def test_nflverse_defines_each_function_once():
+    """A second def silently replaces the first at import; keep one seeder and one ingester."""
+    tree = ast.parse(inspect.getsource(nflverse))
+    names = Counter(
+        node.name for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    )
+
+    assert [name for name, count in names.items() if count > 1] == []
@@ -0,0 +1,23 @@
+import polars as pl
+import pytest
+from app.models import Player
+from app.services.player_id_backfill import backfill_espn_ids_from_rosters
+from sqlalchemy import select
+
+
+@pytest.mark.asyncio
+async def test_backfill_fills_only_missing_espn_ids(db_session, tmp_path):
+    rosters = tmp_path / "rosters.parquet"
+    pl.DataFrame({
+        "player_id": ["fixture-qb", "fixture-wr-1", "fixture-wr-2", "unknown"],
+        "espn_id": ["99", "101", None, "102"],
+    }).write_parquet(rosters)
+
+    result = await backfill_espn_ids_from_rosters(rosters, session=db_session)
+
+    assert result["updated"] == 1
+    espn_ids = dict((await db_session.execute(
+        select(Player.player_id, Player.espn_id)
+        .where(Player.player_id.in_(["fixture-qb", "fixture-wr-1", "fixture-wr-2"]))
+    )).all())
+    assert espn_ids == {"fixture-qb": "1", "fixture-wr-1": "101", "fixture-wr-2": None}
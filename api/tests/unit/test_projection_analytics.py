@@ -1,9 +1,11 @@
 from types import SimpleNamespace
 
+from app.scoring import _kernel, compile_rules
 from app.services.projection_analytics import (
     build_projection_analytics,
     projected_team_opportunity,
     replacement_rank,
+    score_projected_batch,
     score_projected_stats,
 )
 
@@ -56,6 +58,14 @@ def test_missing_projected_rule_returns_none_instead_of_zero():
     assert score_projected_stats({"field_goals_made": 30}, [rule("receptions", 1)]) is None
 
 
+def test_batch_scoring_matches_per_line_scoring():
+    rules = [rule("receptions", 1), rule("receiving_yards", 0.1)]
+    lines = [{"receptions": 7, "receiving_yards": 88}, None, {"field_goals_made": 2}, {"receptions": 3}]
+
+    assert score_projected_batch(lines, rules) == [score_projected_stats(line, rules) for line in lines]
+    assert score_projected_batch(lines, [])[0] is None
+
+
 def test_projected_team_opportunity_derives_rank_and_exact_stat_shares():
     alpha = record("wr-a", "Alpha WR", "WR", {"targets": 120, "receptions": 80}, 250)
     beta = record("wr-b", "Beta WR", "WR", {"targets": 80, "receptions": 40}, 150)
@@ -103,6 +113,19 @@ def test_projection_board_derives_vorp_tiers_and_weekly_profile_points():
     assert methodology["replacement_ranks"]["QB"] == 2
 
 
+def test_projection_board_reuses_cached_compiled_rules():
+    rules = [rule("passing_yards", 0.04), rule("passing_touchdowns", 4)]
+    compiled = compile_rules(rules)
+    records = [record("qb-a", "Alpha QB", "QB", {"passing_yards": 4_000, "passing_touchdowns": 30}, 280)]
+
+    rows, _ = build_projection_analytics(records, rules, compiled=compiled)
+    kernel = _kernel(compiled)
+    again, _ = build_projection_analytics(records, rules, compiled=compiled)
+
+    assert rows == again == build_projection_analytics(records, rules)[0]
+    assert _kernel(compiled) is kernel
+
+
 def test_projection_board_labels_espn_fallback():
     rows, _ = build_projection_analytics(
         [record("k-a", "Alpha K", "K", {"field_goals_made": 30}, 120)],
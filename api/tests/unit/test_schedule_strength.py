@@ -0,0 +1,35 @@
+import sys
+from types import SimpleNamespace
+
+import polars as pl
+from app.services.schedule_strength import get_schedule_strength
+
+
+def test_schedule_strength_tolerates_missing_stat_columns(monkeypatch):
+    """Weekly stats without a game_id column still rank opponents."""
+    stats = pl.DataFrame({
+        "season_type": ["REG", "REG"],
+        "position": ["WR", "WR"],
+        "opponent_team": ["DAL", "NYG"],
+        "fantasy_points_ppr": [30.0, 10.0],
+    })
+    schedules = pl.DataFrame({
+        "game_type": ["REG", "REG"],
+        "week": [1, 2],
+        "away_team": ["PHI", "NYG"],
+        "home_team": ["DAL", "PHI"],
+    })
+    monkeypatch.setitem(sys.modules, "nflreadpy", SimpleNamespace(
+        load_player_stats=lambda seasons, summary_level: stats,
+        load_schedules=lambda seasons: schedules,
+    ))
+    get_schedule_strength.cache_clear()
+
+    result = get_schedule_strength("PHI", "WR", 2099)
+    get_schedule_strength.cache_clear()
+
+    assert [(m["week"], m["opponent"], m["ease_rank"]) for m in result["matchups"]] == [
+        (1, "DAL", 1),
+        (2, "NYG", 2),
+    ]
+    assert result["matchups"][0]["points_allowed_per_game"] == 30.0
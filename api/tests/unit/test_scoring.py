@@ -1,6 +1,18 @@
+import numpy as np
 import pytest
+from sqlalchemy import func, insert, select
+from app.models import PlayerWeekStat, ScoringProfile, ScoringRule
 from app.scoring import (
+    CompiledProfile,
+    compile_profile,
+    compile_rules,
+    compute_points,
+    compute_points_batch,
     compute_points_from_dict,
+    load_compiled_profile,
+    score_compiled,
+    scores_missing_stats,
+    sql_rule_points,
     validate_scoring_rule,
     get_default_scoring_profiles
 )
@@ -117,6 +129,18 @@ class TestScoringEngine:
         # Expected: 0 points since None is treated as 0
         assert points == 0.0
     
+    def test_orm_rules_score_like_rule_dicts(self, sample_scoring_rules):
+        """compute_points reads ScoringRule attributes with the same bonus window and cap logic."""
+        rules = sample_scoring_rules + [
+            {"stat_key": "receiving_yards", "multiplier": 1.0, "per": 10, "bonus_min": 100, "bonus_max": 150, "bonus_points": 2, "cap": 12},
+            {"stat_key": "fumbles_lost", "multiplier": -2.0, "per": None, "bonus_min": None, "bonus_max": None, "bonus_points": None, "cap": None},
+        ]
+        orm_rules = [ScoringRule(**rule) for rule in rules]
+
+        for receiving_yards in (0, 99, 100, 150, 151, 400):
+            stats = {"passing_yards": 310, "receptions": 4, "receiving_yards": receiving_yards, "fumbles_lost": 1}
+            assert compute_points(stats, orm_rules) == compute_points_from_dict(stats, rules)
+    
     def test_complex_scoring_scenario(self):
         """Test a complex scoring scenario with multiple rules."""
         rules = [
@@ -183,6 +207,111 @@ class TestScoringEngine:
         assert isinstance(points, float)
 
 
+class TestBatchScoring:
+    """Vectorized batch scoring must agree with the per-line engine."""
+
+    def test_batch_matches_per_line_scoring(self, sample_scoring_rules):
+        rules = sample_scoring_rules + [
+            {"stat_key": "receiving_yards", "multiplier": 1.0, "per": 10, "bonus_min": 100, "bonus_max": 150, "bonus_points": 2, "cap": 12},
+        ]
+        stat_rows = [
+            {"passing_yards": 350, "passing_touchdowns": 3, "interceptions": 1},
+            {"rushing_yards": 123, "rushing_touchdowns": 1, "receptions": 4, "receiving_yards": 128},
+            {"rushing_yards": -6, "receiving_yards": 99, "receptions": None},
+            {},
+        ]
+
+        assert compute_points_batch(stat_rows, rules) == [
+            compute_points_from_dict(stats, rules) for stats in stat_rows
+        ]
+
+    def test_scalar_and_vectorized_paths_agree(self, sample_scoring_rules):
+        """Small batches take the scalar loop, large ones the NumPy kernel."""
+        rules = sample_scoring_rules + [
+            {"stat_key": "receiving_yards", "multiplier": 1.0, "per": 10, "bonus_min": 100, "bonus_max": 150, "bonus_points": 2, "cap": 12},
+        ]
+        compiled = load_compiled_profile(compile_profile(rules))
+        stat_rows = [
+            {"passing_yards": 250 + 10 * i, "rushing_yards": i * 7 - 5, "receiving_yards": 90 + 3 * i, "receptions": i % 4}
+            for i in range(40)
+        ]
+
+        assert score_compiled(stat_rows, compiled) == [score_compiled([stats], compiled)[0] for stats in stat_rows]
+        assert score_compiled(stat_rows, compiled) == [compute_points_from_dict(stats, rules) for stats in stat_rows]
+
+    def test_compiled_profile_round_trips(self, sample_scoring_rules):
+        compiled = load_compiled_profile(compile_profile(sample_scoring_rules))
+        stats = {"passing_yards": 310, "passing_touchdowns": 2, "receptions": 6}
+
+        assert compiled["stat_key"].tolist() == [rule["stat_key"] for rule in sample_scoring_rules]
+        assert score_compiled([stats], compiled) == [compute_points_from_dict(stats, sample_scoring_rules)]
+
+    def test_compiled_profile_splits_simple_rules_into_contiguous_arrays(self, sample_scoring_rules):
+        profile = CompiledProfile.from_compiled(compile_rules(sample_scoring_rules))
+
+        assert profile.stat_keys == tuple(rule["stat_key"] for rule in sample_scoring_rules)
+        assert [rule[0] for rule in profile.simple.scalar_rules] == [
+            "passing_touchdowns", "interceptions", "rushing_touchdowns", "receptions",
+        ]
+        assert [rule[0] for rule in profile.complex.scalar_rules] == ["passing_yards", "rushing_yards"]
+        for group in (profile.simple, profile.complex):
+            for array in (group.multiplier, group.per, group.bonus_min, group.cap):
+                assert array.flags.c_contiguous and array.dtype == np.float64
+        assert profile.complex.bonus_min.tolist() == [300, 100]
+        assert np.isinf(profile.complex.cap).all() and np.isinf(profile.complex.bonus_max).all()
+
+    def test_batch_handles_empty_inputs(self, sample_scoring_rules):
+        assert compute_points_batch([], sample_scoring_rules) == []
+        assert compute_points_batch([{"receptions": 3}], []) == [0.0]
+
+
+class TestSqlScoring:
+    """SQL scoring expressions must agree with the Python engine."""
+
+    async def test_sql_rule_points_matches_python(self, db_session):
+        rules = [
+            {"stat_key": "passing_yards", "multiplier": 1.0, "per": 25, "bonus_min": 300, "bonus_max": None, "bonus_points": 3, "cap": None},
+            {"stat_key": "rushing_yards", "multiplier": 0.1, "per": None, "bonus_min": 100, "bonus_max": 199, "bonus_points": 2, "cap": None},
+            {"stat_key": "receiving_yards", "multiplier": 1.0, "per": 10, "bonus_min": None, "bonus_max": None, "bonus_points": None, "cap": 5},
+            {"stat_key": "receptions", "multiplier": 0.5, "per": None, "bonus_min": None, "bonus_max": None, "bonus_points": None, "cap": None},
+        ]
+        stats = {"passing_yards": 312.0, "rushing_yards": -7.0, "receiving_yards": 88.0, "receptions": 6.0, "targets": 9.0}
+        await db_session.execute(
+            insert(ScoringProfile).values(profile_id="sql-profile", name="SQL Profile", created_at=0)
+        )
+        await db_session.execute(
+            insert(ScoringRule),
+            [{"rule_id": f"sql-{rule['stat_key']}", "profile_id": "sql-profile", **rule} for rule in rules],
+        )
+        await db_session.execute(
+            insert(PlayerWeekStat),
+            [
+                {"player_id": "fixture-qb", "season": 2025, "week": 1, "stat_key": key, "stat_value": value}
+                for key, value in stats.items()
+            ],
+        )
+
+        total = (
+            await db_session.execute(
+                select(func.sum(sql_rule_points(PlayerWeekStat.stat_value)))
+                .select_from(PlayerWeekStat)
+                .join(
+                    ScoringRule,
+                    (ScoringRule.profile_id == "sql-profile")
+                    & (ScoringRule.stat_key == PlayerWeekStat.stat_key),
+                )
+                .where(PlayerWeekStat.player_id == "fixture-qb", PlayerWeekStat.season == 2025)
+            )
+        ).scalar_one()
+
+        assert round(total, 2) == compute_points_from_dict(stats, rules)
+
+    def test_scores_missing_stats_flags_zero_bonus_and_negative_cap(self):
+        assert scores_missing_stats([{"stat_key": "a", "multiplier": 1, "bonus_min": 0, "bonus_points": 1}])
+        assert scores_missing_stats([{"stat_key": "a", "multiplier": 1, "cap": -1}])
+        assert not scores_missing_stats([{"stat_key": "a", "multiplier": 1, "bonus_min": 100, "bonus_points": 1}])
+
+
 class TestScoringRuleValidation:
     """Test scoring rule validation."""
     
@@ -322,3 +451,11 @@ class TestDefaultScoringProfiles:
                 # Check values
                 assert rule["per"] > 0
                 # Note: multipliers can be negative (e.g., interceptions)
+
+    def test_default_profiles_are_shared_read_only(self):
+        """Defaults are built once; callers cannot mutate the shared rules."""
+        profiles = get_default_scoring_profiles()
+
+        assert get_default_scoring_profiles() is profiles
+        with pytest.raises(TypeError):
+            profiles["PPR"][0]["multiplier"] = 2.0
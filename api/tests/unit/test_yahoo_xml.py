@@ -4,6 +4,7 @@ from app.services.yahoo_xml import (
     parse_settings,
     parse_stat_categories,
     parse_teams,
+    roster_stream,
 )
 
 
@@ -57,6 +58,14 @@ def test_parses_teams_and_rosters_without_name_only_matching():
     }
 
 
+def test_roster_stream_parses_chunked_responses():
+    stream = roster_stream()
+    data = XML.encode()
+    for start in range(0, len(data), 7):
+        stream.feed(data[start:start + 7])
+    assert stream.close() == parse_rosters(XML)
+
+
 def test_parses_stat_category_metadata():
     assert parse_stat_categories(CATEGORIES_XML) == [{
         "stat_id": "4",